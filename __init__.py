@@ -8,6 +8,8 @@ as well as the puzzle generator and solver. Can be used as GUI and CLI versions.
 Packages:
     core
     ui
+    benchmark
+    service
 
 Modules:
     sudoku_py_cli
@@ -21,4 +23,4 @@ __date__ = "24-09-2018"
 __status__ = "Development"
 __maintainer__ = "a.azarov@diagnoptics.com"
 
-__all__ = ['core', 'ui', 'sudoku_py_cli']
+__all__ = ['core', 'ui', 'benchmark', 'service', 'sudoku_py_cli']
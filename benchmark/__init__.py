@@ -0,0 +1,16 @@
+#!/usr/bin/python
+"""
+Package sudoku_py.benchmark
+
+Reproducible performance benchmarks of the solvers and of the generator.
+
+Modules:
+    corpora
+    suite
+"""
+
+__version__ = "0.0.1.0"
+__date__ = "16-10-2026"
+__status__ = "Development"
+
+__all__ = ['corpora', 'suite']
@@ -0,0 +1,220 @@
+#!/usr/bin/python
+"""
+Module sudoku_py.benchmark.corpora
+
+Builds the reproducible benchmark corpora of the puzzles locally. Each puzzle
+is generated from its own seed, which depends only on the base seed, the box
+shape, the difficulty tier and the index of the puzzle, thus the same corpus is
+built on any machine, and extending a corpus does not change its first
+puzzles.
+
+The tiers differ by the fraction of the cells left as clues, the 'hard' tier
+consists of the minimal puzzles (as many clues removed as possible). Digging
+the minimal puzzles of the large boards takes minutes per puzzle, thus for
+those shapes the removal of the clues is stopped at a fixed floor (see
+CLUES_FLOOR). The 3 x 3 boxes corpus has an additional 'hardest' tier of the
+well known puzzles, which are the hardest for the human techniques or for the
+plain backtracking.
+
+The built corpora are stored as text files (one puzzle per line) and re-used
+by the subsequent runs.
+
+Functions:
+    GetSeed()
+        int, int, int, str, int -> int
+    GetMinClues()
+        int, int, str -> int OR None
+    BuildCorpus()
+        int, int, str/, int, int/ -> list(str)
+    LoadCorpus()
+        int, int, str/, int, int, str OR None/ -> list(str)
+"""
+
+__version__ = "0.0.1.0"
+__date__ = "16-10-2026"
+__status__ = "Development"
+
+__all__ = ['SHAPES', 'TIERS', 'HARDEST_TIER', 'DEF_SEED', 'DEF_CORPUS_SIZE',
+            'GetSeed', 'GetMinClues', 'BuildCorpus', 'LoadCorpus']
+
+#imports
+
+#+ standard libraries
+
+import os
+import zlib
+
+#+ other modules from the package
+
+from sudoku_py.core.generator import GeneratePuzzle
+
+#globals
+
+#+ box shapes (rows, columns) covered by the benchmark
+
+SHAPES = ((2, 2), (2, 3), (3, 3), (3, 4), (4, 4), (5, 5))
+
+#+ difficulty tiers as the fraction of the cells left as clues, None - minimal
+
+TIERS = (('easy', 0.65), ('medium', 0.55), ('hard', None))
+
+HARDEST_TIER = 'hardest'
+
+#+ the lowest fraction of the clues per box shape, where the minimal puzzles
+#+ are too slow to generate
+
+CLUES_FLOOR = {(4, 4) : 0.4, (5, 5) : 0.5}
+
+#+ the 3 x 3 boxes puzzles of the 'hardest' tier
+
+HARDEST_PUZZLES = (
+    '1....7.9..3..2...8..96..5....53..9...1..8...2'
+        '6....4...3......1..4......7..7...3..',
+    '8..........36......7..9.2...5...7.......457..'
+        '...1...3...1....68..85...1..9....4..',
+    '12.3....435....1....4........54..2..6...7....'
+        '.....8.9...31..5.......9.7.....6...8',
+    '..............3.85..1.2.......5.7.....4...1..'
+        '.9.......5......73..2.1........4...9')
+
+DEF_SEED = 20261016
+
+DEF_CORPUS_SIZE = 20
+
+#functions
+
+def GetSeed(iBaseSeed, iBoxRows, iBoxColumns, strTier, iIndex):
+    """
+    Calculates the seed of a single puzzle of a corpus. The result does not
+    depend on the hash randomization of the interpreter.
+
+    Signature:
+        int, int, int, str, int -> int
+
+    Args:
+        iBaseSeed: integer, the base seed of the corpora
+        iBoxRows: positive integer, number of rows in a box
+        iBoxColumns: positive integer, number of columns in a box
+        strTier: string, name of the tier
+        iIndex: non-negative integer, index of the puzzle within the corpus
+
+    Returns:
+        int: the seed
+    """
+    strKey = '{}:{}x{}:{}:{}'.format(iBaseSeed, iBoxRows, iBoxColumns,
+                                                                strTier, iIndex)
+    return zlib.crc32(strKey) & 0xFFFFFFFF
+
+def GetMinClues(iBoxRows, iBoxColumns, strTier):
+    """
+    Calculates the number of the clues, at which the removal of the clues is
+    stopped for the puzzles of a box shape and a generated tier.
+
+    Signature:
+        int, int, str -> int OR None
+
+    Args:
+        iBoxRows: positive integer, number of rows in a box
+        iBoxColumns: positive integer, number of columns in a box
+        strTier: string, name of the tier, see TIERS
+
+    Returns:
+        int OR None: the number of the clues, None - as many clues as possible
+            are removed
+
+    Raises:
+        ValueError: unknown tier
+    """
+    dictTiers = dict(TIERS)
+    if not (strTier in dictTiers):
+        raise ValueError('Unknown corpus tier {!r}'.format(strTier))
+    iCells = (iBoxRows * iBoxColumns) ** 2
+    gFraction = dictTiers[strTier]
+    gFloor = CLUES_FLOOR.get((iBoxRows, iBoxColumns), None)
+    if gFloor is not None and (gFraction is None or gFraction < gFloor):
+        gFraction = gFloor
+    if gFraction is None:
+        return None
+    return int(round(gFraction * iCells))
+
+def BuildCorpus(iBoxRows, iBoxColumns, strTier, iCount = DEF_CORPUS_SIZE,
+                                                        iBaseSeed = DEF_SEED):
+    """
+    Generates a corpus of the puzzles of a box shape and a tier.
+
+    Signature:
+        int, int, str/, int, int/ -> list(str)
+
+    Args:
+        iBoxRows: positive integer, number of rows in a box
+        iBoxColumns: positive integer, number of columns in a box
+        strTier: string, name of the tier, see TIERS and HARDEST_TIER
+        iCount: (optional) positive integer, number of the puzzles, defaults
+            to DEF_CORPUS_SIZE
+        iBaseSeed: (optional) integer, the base seed, defaults to DEF_SEED
+
+    Returns:
+        list(str): the puzzles as strings; the 'hardest' tier is returned
+            whole regardless of the requested number, and it is empty for the
+            shapes other than 3 x 3
+
+    Raises:
+        ValueError: unknown tier
+    """
+    if strTier == HARDEST_TIER:
+        if (iBoxRows, iBoxColumns) == (3, 3):
+            return list(HARDEST_PUZZLES)
+        return []
+    iMinClues = GetMinClues(iBoxRows, iBoxColumns, strTier)
+    strlstPuzzles = []
+    for iIndex in xrange(iCount):
+        objPuzzle, _ = GeneratePuzzle(iBoxRows, iBoxColumns, iMinClues,
+                GetSeed(iBaseSeed, iBoxRows, iBoxColumns, strTier, iIndex))
+        strlstPuzzles.append(objPuzzle.toString())
+    return strlstPuzzles
+
+def LoadCorpus(iBoxRows, iBoxColumns, strTier, iCount = DEF_CORPUS_SIZE,
+                                    iBaseSeed = DEF_SEED, strFolder = None):
+    """
+    Loads a corpus from its file in the specified folder, or builds it and
+    stores it there if the file is absent or has too few puzzles.
+
+    Signature:
+        int, int, str/, int, int, str OR None/ -> list(str)
+
+    Args:
+        iBoxRows: positive integer, number of rows in a box
+        iBoxColumns: positive integer, number of columns in a box
+        strTier: string, name of the tier, see TIERS and HARDEST_TIER
+        iCount: (optional) positive integer, number of the puzzles, defaults
+            to DEF_CORPUS_SIZE
+        iBaseSeed: (optional) integer, the base seed, defaults to DEF_SEED
+        strFolder: (optional) string, folder of the corpora files, by default
+            the corpus is always built and not stored
+
+    Returns:
+        list(str): the puzzles as strings
+
+    Raises:
+        ValueError: unknown tier
+    """
+    if strFolder is None:
+        return BuildCorpus(iBoxRows, iBoxColumns, strTier, iCount, iBaseSeed)
+    strPath = os.path.join(strFolder, '{}_{}x{}_{}.txt'.format(iBaseSeed,
+                                            iBoxRows, iBoxColumns, strTier))
+    if os.path.isfile(strPath):
+        with open(strPath) as fFile:
+            strlstPuzzles = [strLine.strip() for strLine in fFile
+                                                            if strLine.strip()]
+        if strTier == HARDEST_TIER:
+            return strlstPuzzles
+        if len(strlstPuzzles) >= iCount:
+            return strlstPuzzles[:iCount]
+    strlstPuzzles = BuildCorpus(iBoxRows, iBoxColumns, strTier, iCount,
+                                                                    iBaseSeed)
+    if not os.path.isdir(strFolder):
+        os.makedirs(strFolder)
+    with open(strPath, 'w') as fFile:
+        for strPuzzle in strlstPuzzles:
+            fFile.write(strPuzzle + '\n')
+    return strlstPuzzles
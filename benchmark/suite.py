@@ -0,0 +1,452 @@
+#!/usr/bin/python
+"""
+Module sudoku_py.benchmark.suite
+
+Reproducible performance benchmark of the solver engines and of the puzzle
+generator on the fixed seed corpora (see the module
+sudoku_py.benchmark.corpora) across the box shapes and the difficulty tiers.
+
+Per engine, box shape and tier the suite measures:
+    *) solves per second - over the whole corpus
+    *) p50 / p99 latency - of a single solve, including the set-up of the
+        solver, but not the parsing of the puzzle
+    *) peak memory - each measurement is run in a fresh worker process, and
+        its peak resident set size (as reported by the OS) and the growth of
+        it during the measurement are recorded
+
+The generator throughput is measured in the same way per box shape and tier,
+the generator uses the propagation engine internally.
+
+The canonicalization (see sudoku_py.core.canonical) is measured per box shape
+on the degenerate boards - the empty one, the one with a single clue and the
+one with a single filled row, which tie on almost every step of the search,
+as well as a random full grid and the same grid with 10% of the cells
+cleared, which tie on the first steps. A board taking longer than
+CANONICAL_LIMIT seconds is counted as failed, and a grown number of the failed
+items is reported as a regression.
+
+The results are a JSON document with the sorted keys and one record per
+measurement, thus two runs can be diffed directly, or compared by
+CompareResults() with a tolerance. Can be run as a script:
+
+    python -m sudoku_py.benchmark.suite --output baseline.json
+
+Functions:
+    Percentile()
+        list(float), float -> float
+    RunBenchmark()
+        /seq(tuple(int, int)), seq(str) OR None, int, int, str OR None, bool,
+            file OR None/ -> dict
+    CompareResults()
+        dict, dict/, float/ -> list(str)
+    main()
+        /list(str)/ -> None
+"""
+
+__version__ = "0.0.1.0"
+__date__ = "17-10-2026"
+__status__ = "Development"
+
+__all__ = ['FORMAT_VERSION', 'Percentile', 'RunBenchmark', 'CompareResults',
+            'main']
+
+#imports
+
+#+ standard libraries
+
+import sys
+import os
+import argparse
+import json
+import multiprocessing
+import platform
+import random
+import resource
+import time
+import timeit
+
+#+ my libraries
+
+if __name__ == '__main__':
+    strTemp = os.path.dirname(os.path.dirname(os.path.dirname(
+                                                os.path.realpath(__file__))))
+    if not (strTemp in sys.path):
+        sys.path.append(strTemp)
+
+#+ other modules from the package
+
+from sudoku_py.core.board import SudokuBoard
+
+from sudoku_py.core.solvers import ENGINES, GetEngine
+
+from sudoku_py.core.generator import GeneratePuzzle, PuzzleGenerator
+
+from sudoku_py.core.canonical import GetCanonicalMapping
+
+from sudoku_py.benchmark.corpora import (SHAPES, TIERS, HARDEST_TIER,
+                            DEF_SEED, DEF_CORPUS_SIZE, GetSeed, GetMinClues,
+                                                                    LoadCorpus)
+
+#globals
+
+FORMAT_VERSION = 1
+
+#+ relative change of a metric reported as a regression by default
+
+DEF_TOLERANCE = 0.1
+
+LOG_FORMAT = '{} {} {} {}: {} /s, p50 {} ms, p99 {} ms\n'
+
+#+ the longest canonicalization of a degenerate board, seconds
+
+CANONICAL_LIMIT = 1.0
+
+#+ fraction of the cells cleared in the dense degenerate board
+
+DENSE_CLEARED = 0.1
+
+DEGENERATE_TIER = 'degenerate'
+
+#functions
+
+def _GetPeakMemory():
+    """
+    Helper function to get the peak resident set size of the current process
+    in KiB (the OS reports it in bytes on macOS).
+
+    Signature:
+        None -> int
+    """
+    iPeak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == 'darwin':
+        iPeak //= 1024
+    return iPeak
+
+def Percentile(glstSorted, gFraction):
+    """
+    Gets the nearest-rank percentile of the sorted values.
+
+    Signature:
+        list(float), float -> float
+
+    Args:
+        glstSorted: list of int or float, the values in the ascending order
+        gFraction: float in the range [0, 1], e.g. 0.99 for p99
+
+    Returns:
+        float: the percentile, 0.0 for no values
+    """
+    if not glstSorted:
+        return 0.0
+    iRank = int(gFraction * len(glstSorted) + 0.999999)
+    return glstSorted[min(max(iRank, 1), len(glstSorted)) - 1]
+
+def _Summarize(glstTimes, iFailed, iStartMemory):
+    """
+    Helper function to convert the per item timings into the record of the
+    metrics.
+
+    Signature:
+        list(float), int, int -> dict(str -> int OR float)
+    """
+    glstSorted = sorted(glstTimes)
+    gTotal = sum(glstSorted)
+    iPeak = _GetPeakMemory()
+    if gTotal:
+        gPerSecond = round(len(glstSorted) / gTotal, 3)
+    else:
+        gPerSecond = 0.0
+    return {'items' : len(glstSorted),
+            'failed' : iFailed,
+            'total_s' : round(gTotal, 6),
+            'per_second' : gPerSecond,
+            'p50_ms' : round(1000 * Percentile(glstSorted, 0.5), 4),
+            'p99_ms' : round(1000 * Percentile(glstSorted, 0.99), 4),
+            'peak_rss_kb' : iPeak,
+            'rss_growth_kb' : iPeak - iStartMemory}
+
+def _MeasureSolver(strEngine, iBoxRows, iBoxColumns, strlstPuzzles):
+    """
+    Helper function executed in a worker process. Solves each puzzle with the
+    engine once and times each solve.
+
+    Signature:
+        str, int, int, list(str) -> dict(str -> int OR float)
+    """
+    iStartMemory = _GetPeakMemory()
+    clsEngine = GetEngine(strEngine)
+    lstPuzzles = [SudokuBoard.fromString(strPuzzle, iBoxRows, iBoxColumns)
+                                                for strPuzzle in strlstPuzzles]
+    fTimer = timeit.default_timer
+    glstTimes = []
+    iFailed = 0
+    for objPuzzle in lstPuzzles:
+        gStart = fTimer()
+        lstSolutions = clsEngine(objPuzzle).solve(1)
+        glstTimes.append(fTimer() - gStart)
+        if not lstSolutions:
+            iFailed += 1
+    return _Summarize(glstTimes, iFailed, iStartMemory)
+
+def _MeasureGenerator(iBoxRows, iBoxColumns, strTier, iCount, iBaseSeed):
+    """
+    Helper function executed in a worker process. Generates the puzzles of a
+    tier with the corpus seeds and times each one.
+
+    Signature:
+        int, int, str, int, int -> dict(str -> int OR float)
+    """
+    iStartMemory = _GetPeakMemory()
+    iMinClues = GetMinClues(iBoxRows, iBoxColumns, strTier)
+    fTimer = timeit.default_timer
+    glstTimes = []
+    for iIndex in xrange(iCount):
+        iSeed = GetSeed(iBaseSeed, iBoxRows, iBoxColumns, strTier, iIndex)
+        gStart = fTimer()
+        GeneratePuzzle(iBoxRows, iBoxColumns, iMinClues, iSeed)
+        glstTimes.append(fTimer() - gStart)
+    return _Summarize(glstTimes, 0, iStartMemory)
+
+def _MeasureCanonical(iBoxRows, iBoxColumns, iBaseSeed):
+    """
+    Helper function executed in a worker process. Canonizes each degenerate
+    board once and times each one; the boards taking longer than
+    CANONICAL_LIMIT are counted as failed. The full grid and the cleared cells
+    are chosen by the seed of the degenerate tier.
+
+    Signature:
+        int, int, int -> dict(str -> int OR float)
+    """
+    iStartMemory = _GetPeakMemory()
+    objEmpty = SudokuBoard(iBoxRows, iBoxColumns)
+    objClue = SudokuBoard(iBoxRows, iBoxColumns)
+    objClue.setValue(objClue.Cells // 2, 1)
+    objRow = SudokuBoard(iBoxRows, iBoxColumns)
+    for iCell in xrange(objRow.Size):
+        objRow.setValue(iCell, iCell + 1)
+    iSeed = GetSeed(iBaseSeed, iBoxRows, iBoxColumns, DEGENERATE_TIER, 0)
+    objFull = PuzzleGenerator(iBoxRows, iBoxColumns, iSeed).makeGrid()
+    objDense = objFull.copy()
+    for iCell in random.Random(iSeed).sample(xrange(objDense.Cells),
+                                int(round(DENSE_CLEARED * objDense.Cells))):
+        objDense.clearValue(iCell)
+    fTimer = timeit.default_timer
+    glstTimes = []
+    for objBoard in (objEmpty, objClue, objRow, objFull, objDense):
+        gStart = fTimer()
+        GetCanonicalMapping(objBoard)
+        glstTimes.append(fTimer() - gStart)
+    iFailed = sum(1 for gTime in glstTimes if gTime > CANONICAL_LIMIT)
+    return _Summarize(glstTimes, iFailed, iStartMemory)
+
+def _RunIsolated(fTarget, tupArgs):
+    """
+    Helper function to run a measurement in a fresh worker process, thus the
+    peak memory of a measurement is not affected by the previous ones.
+
+    Signature:
+        callable, tuple -> type A
+    """
+    objPool = multiprocessing.Pool(1)
+    try:
+        return objPool.apply(fTarget, tupArgs)
+    finally:
+        objPool.terminate()
+        objPool.join()
+
+def _GetKey(dictRecord):
+    """
+    Helper function to get the identity of a measurement record.
+
+    Signature:
+        dict -> tuple(str, str, str, str)
+    """
+    return (dictRecord['kind'], dictRecord['engine'], dictRecord['shape'],
+                                                            dictRecord['tier'])
+
+def RunBenchmark(tuplstShapes = SHAPES, strlstEngines = None,
+                    iCount = DEF_CORPUS_SIZE, iBaseSeed = DEF_SEED,
+                    strCorpora = None, bGenerator = True, fLog = None,
+                    bCanonical = True):
+    """
+    Runs the benchmark suite.
+
+    Signature:
+        /seq(tuple(int, int)), seq(str) OR None, int, int, str OR None, bool,
+            file OR None, bool/ -> dict
+
+    Args:
+        tuplstShapes: (optional) sequence of the (box rows, box columns)
+            tuples, defaults to SHAPES
+        strlstEngines: (optional) sequence of the engines' names, by default
+            all engines
+        iCount: (optional) positive integer, number of the puzzles per corpus,
+            defaults to DEF_CORPUS_SIZE
+        iBaseSeed: (optional) integer, the base seed of the corpora
+        strCorpora: (optional) string, the folder to store and re-use the
+            built corpora in, by default the corpora are built each run
+        bGenerator: (optional) boolean, if True (default) the generator
+            throughput is measured as well
+        fLog: (optional) file-like object to report the progress to
+        bCanonical: (optional) boolean, if True (default) the
+            canonicalization of the degenerate boards is measured as well
+
+    Returns:
+        dict: the JSON serializable results with the keys 'meta' (the run's
+            parameters and the environment) and 'results' (list of the
+            records)
+
+    Raises:
+        ValueError: unknown engine
+    """
+    if strlstEngines is None:
+        strlstEngines = sorted(ENGINES)
+    for strEngine in strlstEngines:
+        GetEngine(strEngine)
+    lstRecords = []
+    for iBoxRows, iBoxColumns in tuplstShapes:
+        strShape = '{}x{}'.format(iBoxRows, iBoxColumns)
+        lstTierJobs = []
+        for strTier in [strTier for strTier, _ in TIERS] + [HARDEST_TIER]:
+            strlstPuzzles = LoadCorpus(iBoxRows, iBoxColumns, strTier, iCount,
+                                                        iBaseSeed, strCorpora)
+            if not strlstPuzzles:
+                continue
+            lstJobs = [('solver', strEngine, _MeasureSolver, (strEngine,
+                                    iBoxRows, iBoxColumns, strlstPuzzles))
+                                                for strEngine in strlstEngines]
+            if bGenerator and strTier != HARDEST_TIER:
+                lstJobs.append(('generator', 'propagation', _MeasureGenerator,
+                        (iBoxRows, iBoxColumns, strTier, iCount, iBaseSeed)))
+            lstTierJobs.append((strTier, lstJobs))
+        if bCanonical:
+            lstTierJobs.append((DEGENERATE_TIER, [('canonical', 'shell',
+                _MeasureCanonical, (iBoxRows, iBoxColumns, iBaseSeed))]))
+        for strTier, lstJobs in lstTierJobs:
+            for strKind, strEngine, fTarget, tupArgs in lstJobs:
+                dictRecord = _RunIsolated(fTarget, tupArgs)
+                dictRecord.update(kind = strKind, engine = strEngine,
+                                            shape = strShape, tier = strTier)
+                lstRecords.append(dictRecord)
+                if fLog is not None:
+                    fLog.write(LOG_FORMAT.format(strKind, strEngine,
+                                strShape, strTier, dictRecord['per_second'],
+                                dictRecord['p50_ms'], dictRecord['p99_ms']))
+                    fLog.flush()
+    dictMeta = {'format' : FORMAT_VERSION,
+                'seed' : iBaseSeed,
+                'count' : iCount,
+                'date' : time.strftime('%Y-%m-%d %H:%M:%S'),
+                'python' : '{} {}'.format(platform.python_implementation(),
+                                                platform.python_version()),
+                'platform' : platform.platform(),
+                'cpus' : multiprocessing.cpu_count()}
+    return {'meta' : dictMeta, 'results' : lstRecords}
+
+def CompareResults(dictBaseline, dictCurrent, gTolerance = DEF_TOLERANCE):
+    """
+    Compares two benchmark runs and reports the regressions: the throughput
+    dropped, or the latency or the memory grew by more than the tolerance, or
+    the number of the failed items grew. Only the measurements present in both
+    runs are compared.
+
+    Signature:
+        dict, dict/, float/ -> list(str)
+
+    Args:
+        dictBaseline: dict, results of the baseline run, see RunBenchmark()
+        dictCurrent: dict, results of the current run
+        gTolerance: (optional) non-negative float, the allowed relative change
+
+    Returns:
+        list(str): descriptions of the regressions, empty list if there are
+            none
+    """
+    dictBase = dict((_GetKey(dictRecord), dictRecord)
+                                    for dictRecord in dictBaseline['results'])
+    strlstRegressions = []
+    for dictRecord in dictCurrent['results']:
+        tupKey = _GetKey(dictRecord)
+        dictOld = dictBase.get(tupKey, None)
+        if dictOld is None:
+            continue
+        if dictRecord['failed'] > dictOld['failed']:
+            strlstRegressions.append('{}: failed {} -> {}'.format(
+                    ' '.join(tupKey), dictOld['failed'], dictRecord['failed']))
+        for strMetric, bHigherBetter in (('per_second', True),
+                                        ('p50_ms', False), ('p99_ms', False),
+                                        ('rss_growth_kb', False)):
+            gOld = dictOld[strMetric]
+            gNew = dictRecord[strMetric]
+            if bHigherBetter:
+                bRegressed = gNew < gOld * (1 - gTolerance)
+            else:
+                bRegressed = gNew > gOld * (1 + gTolerance)
+            if bRegressed and gOld:
+                strlstRegressions.append('{}: {} {} -> {} ({:+.1%})'.format(
+                                        ' '.join(tupKey), strMetric, gOld,
+                                        gNew, float(gNew - gOld) / gOld))
+    return strlstRegressions
+
+def main(strlstArgs = None):
+    """
+    Parses the command line arguments, runs the benchmark and writes the
+    results as JSON.
+
+    Signature:
+        /list(str)/ -> None
+
+    Args:
+        strlstArgs: (optional) list of strings, the command line arguments,
+            defaults to sys.argv[1:]
+    """
+    objParser = argparse.ArgumentParser(description = 'Sudoku m x n benchmark')
+    objParser.add_argument('--output', metavar = 'FILE',
+                            help = 'JSON results file, default: stdout')
+    objParser.add_argument('--shapes', nargs = '+', metavar = 'MxN',
+                            default = ['{}x{}'.format(*tupShape)
+                                                    for tupShape in SHAPES],
+                            help = 'box shapes, default: all')
+    objParser.add_argument('--engines', nargs = '+', choices = sorted(ENGINES),
+                            default = None, help = 'engines, default: all')
+    objParser.add_argument('--count', type = int, default = DEF_CORPUS_SIZE,
+                            help = 'puzzles per corpus')
+    objParser.add_argument('--seed', type = int, default = DEF_SEED,
+                            help = 'base seed of the corpora')
+    objParser.add_argument('--corpora', metavar = 'FOLDER',
+                            help = 'store and re-use the corpora in FOLDER')
+    objParser.add_argument('--no-generator', action = 'store_true',
+                            help = 'skip the generator throughput')
+    objParser.add_argument('--no-canonical', action = 'store_true',
+                            help = 'skip the canonicalization timing')
+    objParser.add_argument('--compare', metavar = 'FILE',
+                            help = 'report regressions against FILE')
+    objParser.add_argument('--tolerance', type = float,
+                            default = DEF_TOLERANCE,
+                            help = 'relative change reported as regression')
+    objArgs = objParser.parse_args(strlstArgs)
+    try:
+        tuplstShapes = [tuple(int(strItem) for strItem in strShape.split('x'))
+                                                for strShape in objArgs.shapes]
+    except ValueError:
+        objParser.error('box shape must be MxN, e.g. 3x3')
+    dictResults = RunBenchmark(tuplstShapes, objArgs.engines, objArgs.count,
+                                objArgs.seed, objArgs.corpora,
+                                not objArgs.no_generator, sys.stderr,
+                                not objArgs.no_canonical)
+    strJSON = json.dumps(dictResults, indent = 2, sort_keys = True,
+                                            separators = (',', ': '))
+    if objArgs.output is None:
+        print strJSON
+    else:
+        with open(objArgs.output, 'w') as fFile:
+            fFile.write(strJSON + '\n')
+    if objArgs.compare is not None:
+        with open(objArgs.compare) as fFile:
+            dictBaseline = json.load(fFile)
+        for strLine in CompareResults(dictBaseline, dictResults,
+                                                            objArgs.tolerance):
+            sys.stderr.write('REGRESSION {}\n'.format(strLine))
+
+if __name__ == '__main__':
+    main()
@@ -3,10 +3,40 @@
 Package sudoku_py.core
 
 Core functionality as the data model, game logic, input / output, etc.
+
+Modules:
+    board
+    solver_base
+    dlx_solver
+    propagation_solver
+    cdcl_solver
+    solvers
+    batch_solver
+    parallel_batch
+    parallel_search
+    generator
+    grid_source
+    puzzle_factory
+    canonical
+    solution_cache
+    vector_batch
+    rating
+    game
+    savegame
+    puzzle_library
+    puzzle_pool
+    reducer
+    solver_stats
+    solve_budget
 """
 
 __version__ = "0.0.1.0"
 __date__ = "24-09-201"
 __status__ = "Development"
 
-__all__ = []
+__all__ = ['board', 'solver_base', 'dlx_solver', 'propagation_solver',
+            'cdcl_solver', 'solvers', 'batch_solver',
+            'parallel_batch', 'parallel_search', 'generator', 'grid_source',
+            'puzzle_factory', 'canonical', 'solution_cache', 'vector_batch',
+            'rating', 'game', 'savegame', 'puzzle_library', 'puzzle_pool',
+            'reducer', 'solver_stats', 'solve_budget']
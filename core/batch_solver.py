@@ -0,0 +1,183 @@
+#!/usr/bin/python
+"""
+Module sudoku_py.core.batch_solver
+
+Implements the streaming (lazy) pipeline for solving the puzzle collections
+stored as text files with one puzzle per line, e.g. 81 characters for the
+classic 9 x 9 puzzles or 256 characters for the 16 x 16 ones. Only the first
+whitespace separated token of a line is considered as the puzzle definition,
+the empty lines and the lines starting with '#' are skipped.
+
+All functions are generators chained one after another, thus only a single
+puzzle is held in memory at any moment regardless of the size of the file.
+
+Classes:
+    BatchResult
+
+Functions:
+    ReadPuzzles()
+        file -> generator(tuple(int, str))
+    SolvePuzzles()
+        iterable(tuple(int, str))/, str, int OR None, int OR None/
+            -> generator(BatchResult)
+    SolveFile()
+        file/, str, int OR None, int OR None/ -> generator(BatchResult)
+    WriteResults()
+        iterable(BatchResult), file -> dict(str -> int)
+"""
+
+__version__ = "0.0.1.0"
+__date__ = "16-10-2026"
+__status__ = "Development"
+
+__all__ = ['BatchResult', 'ReadPuzzles', 'SolvePuzzles', 'SolveFile',
+            'WriteResults']
+
+#imports
+
+#+ standard libraries
+
+import collections
+
+#+ other modules from the package
+
+from sudoku_py.core.board import SudokuBoard
+
+from sudoku_py.core.solvers import DEF_ENGINE, GetEngine
+
+#globals
+
+STATUS_SOLVED = 'solved'
+
+STATUS_UNSOLVABLE = 'unsolvable'
+
+STATUS_INVALID = 'invalid'
+
+COMMENT_CHAR = '#'
+
+#classes
+
+class BatchResult(collections.namedtuple('BatchResult',
+                                    ['Line', 'Puzzle', 'Status', 'Solution'])):
+    """
+    Result of solving a single puzzle from a collection, a named tuple.
+
+    Attributes:
+        Line: int, the line number (from 1) in the source file
+        Puzzle: str, the puzzle string as read
+        Status: str, one of 'solved', 'unsolvable', 'invalid'
+        Solution: str OR None, the solution string, None unless solved
+    """
+
+    __slots__ = ()
+
+#functions
+
+def ReadPuzzles(fFile):
+    """
+    Generator function, which reads the puzzles from a file object line by line.
+    The puzzle strings are not parsed here, but only extracted.
+
+    Signature:
+        file -> generator(tuple(int, str))
+
+    Args:
+        fFile: file-like object, any iterable over the text lines
+
+    Yields:
+        tuple(int, str): the line number (from 1) and the puzzle string
+    """
+    for iLine, strLine in enumerate(fFile, 1):
+        strlstTokens = strLine.split(None, 1)
+        if strlstTokens and not strlstTokens[0].startswith(COMMENT_CHAR):
+            yield iLine, strlstTokens[0]
+
+def SolvePuzzles(iterPuzzles, strEngine = DEF_ENGINE, iBoxRows = None,
+                                                            iBoxColumns = None):
+    """
+    Generator function, which solves the puzzles one by one as they are pulled
+    from the source iterable. The malformed puzzles are not raising exceptions
+    but are reported with the 'invalid' status.
+
+    Signature:
+        iterable(tuple(int, str))/, str, int OR None, int OR None/
+            -> generator(BatchResult)
+
+    Args:
+        iterPuzzles: iterable of pairs (line number, puzzle string), e.g. as
+            generated by ReadPuzzles()
+        strEngine: (optional) string, name of the solver engine, defaults to
+            sudoku_py.core.solvers.DEF_ENGINE
+        iBoxRows: (optional) positive integer, number of rows in a box, the
+            default shape is derived from the puzzle length if not specified
+        iBoxColumns: (optional) positive integer, number of columns in a box,
+            the default shape is derived from the puzzle length if not
+            specified
+
+    Yields:
+        BatchResult: result of solving a single puzzle
+
+    Raises:
+        ValueError: unknown engine name
+    """
+    clsEngine = GetEngine(strEngine)
+    for iLine, strPuzzle in iterPuzzles:
+        try:
+            objPuzzle = SudokuBoard.fromString(strPuzzle, iBoxRows,
+                                                                iBoxColumns)
+        except ValueError:
+            yield BatchResult(iLine, strPuzzle, STATUS_INVALID, None)
+            continue
+        lstSolutions = clsEngine(objPuzzle).solve(1)
+        if lstSolutions:
+            yield BatchResult(iLine, strPuzzle, STATUS_SOLVED,
+                                                    lstSolutions[0].toString())
+        else:
+            yield BatchResult(iLine, strPuzzle, STATUS_UNSOLVABLE, None)
+
+def SolveFile(fFile, strEngine = DEF_ENGINE, iBoxRows = None,
+                                                            iBoxColumns = None):
+    """
+    Generator function, which lazily reads and solves the puzzles from a file
+    object, see ReadPuzzles() and SolvePuzzles().
+
+    Signature:
+        file/, str, int OR None, int OR None/ -> generator(BatchResult)
+
+    Args:
+        fFile: file-like object, any iterable over the text lines
+        strEngine: (optional) string, name of the solver engine, defaults to
+            sudoku_py.core.solvers.DEF_ENGINE
+        iBoxRows: (optional) positive integer, number of rows in a box
+        iBoxColumns: (optional) positive integer, number of columns in a box
+
+    Yields:
+        BatchResult: result of solving a single puzzle
+
+    Raises:
+        ValueError: unknown engine name
+    """
+    return SolvePuzzles(ReadPuzzles(fFile), strEngine, iBoxRows, iBoxColumns)
+
+def WriteResults(iterResults, fOutput):
+    """
+    Writes the results into a text file object as they arrive, one line per
+    puzzle with the tab separated puzzle string, status and solution (empty if
+    not solved).
+
+    Signature:
+        iterable(BatchResult), file -> dict(str -> int)
+
+    Args:
+        iterResults: iterable of BatchResult instances
+        fOutput: file-like object opened for writing
+
+    Returns:
+        dict(str -> int): number of the puzzles per status
+    """
+    dictCounts = {STATUS_SOLVED : 0, STATUS_UNSOLVABLE : 0, STATUS_INVALID : 0}
+    for objResult in iterResults:
+        fOutput.write('{}\t{}\t{}\n'.format(objResult.Puzzle, objResult.Status,
+                                                    objResult.Solution or ''))
+        dictCounts[objResult.Status] += 1
+    return dictCounts
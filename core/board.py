@@ -0,0 +1,608 @@
+#!/usr/bin/python
+"""
+Module sudoku_py.core.board
+
+Implements the compact data model of a generic m x n sudoku board, i.e. a board
+of N x N cells (N = m * n) split into N boxes of m rows x n columns each.
+
+The cells are stored in a flat array (one unsigned byte per cell, row-major
+order) and the digits already placed into each row, column and box are tracked
+as integer bitsets (bit k set means digit k + 1 is present). Thus placing and
+removing a digit as well as checking if a digit is a valid candidate for a cell
+are O(1) operations.
+
+The index tables (row, column and box of each cell, cells of each unit, peers
+of each cell) depend only on the box shape; they are computed once per shape
+and shared by all boards and solvers.
+
+Puzzles are exchanged as strings of N * N characters in the row-major order,
+with the characters '.' or '0' denoting the empty cells and the characters
+1-9, A-Z, a-z denoting the digits 1 to 61.
+
+Classes:
+    SudokuBoard
+
+Functions:
+    GetDefaultShape()
+        int -> int, int
+    GetIndexTables()
+        int, int -> tuple(array, array, array, tuple, tuple)
+    DigitToChar()
+        int -> str
+    CharToDigit()
+        str -> int
+    ToBoard()
+        SudokuBoard OR str -> SudokuBoard
+"""
+
+__version__ = "0.0.1.0"
+__date__ = "16-10-2026"
+__status__ = "Development"
+
+__all__ = ['SudokuBoard', 'GetDefaultShape', 'GetIndexTables', 'DigitToChar',
+            'CharToDigit', 'ToBoard']
+
+#imports
+
+#+ standard libraries
+
+import array
+
+#globals
+
+DIGIT_CHARS = ('123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+                                                'abcdefghijklmnopqrstuvwxyz')
+
+EMPTY_CHARS = '.0'
+
+MAX_SIZE = len(DIGIT_CHARS)
+
+_dictCharToDigit = dict((strChar, iIndex + 1)
+                            for iIndex, strChar in enumerate(DIGIT_CHARS))
+
+for strChar in EMPTY_CHARS:
+    _dictCharToDigit[strChar] = 0
+
+del strChar
+
+_dictTables = dict()
+
+#functions
+
+def GetDefaultShape(iSize):
+    """
+    Finds the box shape m x n for the N x N board, such that m * n = N, m <= n
+    and the box is the closest to a square one, e.g. 2 x 3 for N = 6 or 3 x 4
+    for N = 12.
+
+    Signature:
+        int -> int, int
+
+    Args:
+        iSize: positive integer, the size N of the board
+
+    Returns:
+        tuple(int, int): number of rows m and number of columns n in a box
+
+    Raises:
+        ValueError: the size is not positive or it is too large
+    """
+    if iSize < 1 or iSize > MAX_SIZE:
+        raise ValueError('Unsupported board size {}'.format(iSize))
+    iBoxRows = int(iSize ** 0.5)
+    while iSize % iBoxRows:
+        iBoxRows -= 1
+    return iBoxRows, iSize // iBoxRows
+
+def GetIndexTables(iBoxRows, iBoxColumns):
+    """
+    Returns the (cached) index tables for the specific box shape.
+
+    The cells are numbered in the row-major order, the boxes are numbered also
+    in the row-major order (from left to right, from top to bottom). The units
+    are numbered as: rows 0 to N-1, columns N to 2N-1 and boxes 2N to 3N-1.
+
+    Signature:
+        int, int -> tuple(array, array, array, tuple, tuple)
+
+    Args:
+        iBoxRows: positive integer, number of rows in a box (m)
+        iBoxColumns: positive integer, number of columns in a box (n)
+
+    Returns:
+        tuple(array, array, array, tuple, tuple): row index per cell, column
+            index per cell, box index per cell, tuple of 3N tuples of cell
+            indexes per unit, tuple of N * N tuples of the peers' indexes per
+            cell
+    """
+    tupKey = (iBoxRows, iBoxColumns)
+    tupTables = _dictTables.get(tupKey, None)
+    if tupTables is None:
+        iSize = iBoxRows * iBoxColumns
+        iCells = iSize * iSize
+        arrRowOf = array.array('H', [0]) * iCells
+        arrColumnOf = array.array('H', [0]) * iCells
+        arrBoxOf = array.array('H', [0]) * iCells
+        lstlstUnits = [[] for _ in xrange(3 * iSize)]
+        for iCell in xrange(iCells):
+            iRow, iColumn = divmod(iCell, iSize)
+            iBox = ((iRow // iBoxRows) * iBoxRows
+                                                + iColumn // iBoxColumns)
+            arrRowOf[iCell] = iRow
+            arrColumnOf[iCell] = iColumn
+            arrBoxOf[iCell] = iBox
+            lstlstUnits[iRow].append(iCell)
+            lstlstUnits[iSize + iColumn].append(iCell)
+            lstlstUnits[2 * iSize + iBox].append(iCell)
+        tupUnits = tuple(tuple(lstUnit) for lstUnit in lstlstUnits)
+        lstPeers = []
+        for iCell in xrange(iCells):
+            setPeers = set(tupUnits[arrRowOf[iCell]])
+            setPeers.update(tupUnits[iSize + arrColumnOf[iCell]])
+            setPeers.update(tupUnits[2 * iSize + arrBoxOf[iCell]])
+            setPeers.discard(iCell)
+            lstPeers.append(tuple(sorted(setPeers)))
+        tupTables = (arrRowOf, arrColumnOf, arrBoxOf, tupUnits,
+                                                                tuple(lstPeers))
+        _dictTables[tupKey] = tupTables
+    return tupTables
+
+def DigitToChar(iDigit):
+    """
+    Converts a digit into its character representation, with zero (empty cell)
+    being converted into '.'.
+
+    Signature:
+        int -> str
+
+    Args:
+        iDigit: non-negative integer, the digit value
+
+    Returns:
+        str: single character
+    """
+    if iDigit:
+        return DIGIT_CHARS[iDigit - 1]
+    return '.'
+
+def CharToDigit(strChar):
+    """
+    Converts a single character into the digit value, with '.' and '0'
+    characters being converted into zero (empty cell).
+
+    Signature:
+        str -> int
+
+    Args:
+        strChar: single character
+
+    Returns:
+        int: digit value
+
+    Raises:
+        ValueError: the character does not represent a digit
+    """
+    iDigit = _dictCharToDigit.get(strChar, None)
+    if iDigit is None:
+        raise ValueError('Not a digit character {!r}'.format(strChar))
+    return iDigit
+
+def ToBoard(gPuzzle):
+    """
+    Converts a puzzle definition into a board. A board instance is returned as
+    it is, a string is parsed with the default box shape (see
+    SudokuBoard.fromString()).
+
+    Signature:
+        SudokuBoard OR str -> SudokuBoard
+
+    Args:
+        gPuzzle: SudokuBoard instance or string, the puzzle definition
+
+    Returns:
+        SudokuBoard: the puzzle board
+
+    Raises:
+        TypeError: the argument is neither a board nor a string
+        ValueError: the string is not a proper puzzle definition
+    """
+    if isinstance(gPuzzle, SudokuBoard):
+        return gPuzzle
+    if isinstance(gPuzzle, basestring):
+        return SudokuBoard.fromString(gPuzzle)
+    raise TypeError('Not a board or a string puzzle definition')
+
+#classes
+
+class SudokuBoard(object):
+    """
+    Compact model of a generic m x n sudoku board. The cells are addressed by
+    their flat (row-major) index, i.e. iCell = iRow * N + iColumn.
+
+    The board is always consistent, i.e. it is not possible to place a digit
+    into a cell, if this digit is already present in the same row, column or
+    box.
+
+    Methods:
+        getCellIndex(iRow, iColumn)
+            int, int -> int
+        getValue(iCell)
+            int -> int
+        setValue(iCell, iValue)
+            int, int -> None
+        clearValue(iCell)
+            int -> None
+        isCandidate(iCell, iValue)
+            int, int -> bool
+        getCandidates(iCell)
+            int -> int
+        isComplete()
+            None -> bool
+        copy()
+            None -> SudokuBoard
+        toString()
+            None -> str
+        fromString(strPuzzle, iBoxRows = None, iBoxColumns = None)
+            str/, int OR None, int OR None/ -> SudokuBoard
+
+    Attributes:
+        BoxRows: int, read-only property, number of rows in a box (m)
+        BoxColumns: int, read-only property, number of columns in a box (n)
+        Size: int, read-only property, size of the board N = m * n
+        Cells: int, read-only property, total number of cells N * N
+        Filled: int, read-only property, number of the non-empty cells
+        Values: list(int), read-only property, copy of the cells' values
+        FullMask: int, read-only property, bitset with all N digits set
+    """
+
+    #special methods
+
+    def __init__(self, iBoxRows = 3, iBoxColumns = 3):
+        """
+        Initializes an empty board of the required box shape.
+
+        Signature:
+            /int, int/ -> None
+
+        Args:
+            iBoxRows: (optional) positive integer, number of rows in a box,
+                defaults to 3
+            iBoxColumns: (optional) positive integer, number of columns in a
+                box, defaults to 3
+
+        Raises:
+            TypeError: any of the arguments is not an integer number
+            ValueError: any of the arguments is not positive, or the board is
+                too large
+        """
+        if not isinstance(iBoxRows, (int, long)):
+            raise TypeError('Not an integer number of rows in a box')
+        if not isinstance(iBoxColumns, (int, long)):
+            raise TypeError('Not an integer number of columns in a box')
+        if iBoxRows < 1 or iBoxColumns < 1:
+            raise ValueError('Not positive box dimensions')
+        iSize = iBoxRows * iBoxColumns
+        if iSize > MAX_SIZE:
+            raise ValueError('Unsupported board size {}'.format(iSize))
+        self._iBoxRows = iBoxRows
+        self._iBoxColumns = iBoxColumns
+        self._iSize = iSize
+        self._iFilled = 0
+        (self._arrRowOf, self._arrColumnOf, self._arrBoxOf, _,
+                    _) = GetIndexTables(iBoxRows, iBoxColumns)
+        self._arrCells = array.array('B', [0]) * (iSize * iSize)
+        if iSize <= 8 * array.array('L').itemsize:
+            self._gRowMasks = array.array('L', [0]) * iSize
+        else:
+            self._gRowMasks = [0] * iSize
+        self._gColumnMasks = self._gRowMasks[:]
+        self._gBoxMasks = self._gRowMasks[:]
+
+    def __str__(self):
+        """
+        Returns the grid as multiple lines of text with the boxes separated.
+
+        Signature:
+            None -> str
+        """
+        iSize = self._iSize
+        strlstLines = []
+        strSeparator = '+'.join(['-' * (2 * self._iBoxColumns + 1)]
+                                                        * self._iBoxRows)
+        for iRow in xrange(iSize):
+            if iRow and not (iRow % self._iBoxRows):
+                strlstLines.append(strSeparator)
+            strlstParts = []
+            for iStart in xrange(0, iSize, self._iBoxColumns):
+                iFirst = iRow * iSize + iStart
+                iLast = iFirst + self._iBoxColumns
+                strlstParts.append(' '.join(DigitToChar(iValue)
+                                for iValue in self._arrCells[iFirst : iLast]))
+            strlstLines.append(' {} '.format(' | '.join(strlstParts)))
+        return '\n'.join(strlstLines)
+
+    #public API
+
+    #properties
+
+    @property
+    def BoxRows(self):
+        """
+        Getter property for the number of rows in a box.
+
+        Signature:
+            None -> int
+        """
+        return self._iBoxRows
+
+    @property
+    def BoxColumns(self):
+        """
+        Getter property for the number of columns in a box.
+
+        Signature:
+            None -> int
+        """
+        return self._iBoxColumns
+
+    @property
+    def Size(self):
+        """
+        Getter property for the size N of the board.
+
+        Signature:
+            None -> int
+        """
+        return self._iSize
+
+    @property
+    def Cells(self):
+        """
+        Getter property for the total number of cells N * N.
+
+        Signature:
+            None -> int
+        """
+        return self._iSize * self._iSize
+
+    @property
+    def Filled(self):
+        """
+        Getter property for the number of the non-empty cells.
+
+        Signature:
+            None -> int
+        """
+        return self._iFilled
+
+    @property
+    def Values(self):
+        """
+        Getter property for the copy of the values of all cells (row-major
+        order, zero for the empty cells).
+
+        Signature:
+            None -> list(int)
+        """
+        return self._arrCells.tolist()
+
+    @property
+    def FullMask(self):
+        """
+        Getter property for the bitset with all N digits set.
+
+        Signature:
+            None -> int
+        """
+        return (1 << self._iSize) - 1
+
+    #+ methods
+
+    def getCellIndex(self, iRow, iColumn):
+        """
+        Calculates the flat index of a cell from its row and column indexes.
+
+        Signature:
+            int, int -> int
+
+        Args:
+            iRow: non-negative integer, row index
+            iColumn: non-negative integer, column index
+
+        Returns:
+            int: flat index of the cell
+
+        Raises:
+            IndexError: any of the indexes is out of range
+        """
+        if not (0 <= iRow < self._iSize and 0 <= iColumn < self._iSize):
+            raise IndexError('Cell ({}, {}) is out of range'.format(iRow,
+                                                                    iColumn))
+        return iRow * self._iSize + iColumn
+
+    def getValue(self, iCell):
+        """
+        Returns the value of a cell, zero for an empty cell.
+
+        Signature:
+            int -> int
+
+        Args:
+            iCell: non-negative integer, flat index of the cell
+
+        Returns:
+            int: the value of the cell
+        """
+        return self._arrCells[iCell]
+
+    def setValue(self, iCell, iValue):
+        """
+        Places a digit into an empty cell.
+
+        Signature:
+            int, int -> None
+
+        Args:
+            iCell: non-negative integer, flat index of the cell
+            iValue: integer 1 to N, the digit to place
+
+        Raises:
+            ValueError: the cell is not empty, the value is out of range, or
+                the digit is already present in the same row, column or box
+        """
+        if not (0 < iValue <= self._iSize):
+            raise ValueError('Digit {} is out of range'.format(iValue))
+        if self._arrCells[iCell]:
+            raise ValueError('Cell {} is not empty'.format(iCell))
+        iBit = 1 << (iValue - 1)
+        iRow = self._arrRowOf[iCell]
+        iColumn = self._arrColumnOf[iCell]
+        iBox = self._arrBoxOf[iCell]
+        if (self._gRowMasks[iRow] | self._gColumnMasks[iColumn]
+                                            | self._gBoxMasks[iBox]) & iBit:
+            raise ValueError('Digit {} conflicts in cell {}'.format(iValue,
+                                                                        iCell))
+        self._arrCells[iCell] = iValue
+        self._gRowMasks[iRow] |= iBit
+        self._gColumnMasks[iColumn] |= iBit
+        self._gBoxMasks[iBox] |= iBit
+        self._iFilled += 1
+
+    def clearValue(self, iCell):
+        """
+        Removes the digit from a cell. Does nothing if the cell is empty.
+
+        Signature:
+            int -> None
+
+        Args:
+            iCell: non-negative integer, flat index of the cell
+        """
+        iValue = self._arrCells[iCell]
+        if iValue:
+            iMask = ~(1 << (iValue - 1))
+            self._arrCells[iCell] = 0
+            self._gRowMasks[self._arrRowOf[iCell]] &= iMask
+            self._gColumnMasks[self._arrColumnOf[iCell]] &= iMask
+            self._gBoxMasks[self._arrBoxOf[iCell]] &= iMask
+            self._iFilled -= 1
+
+    def isCandidate(self, iCell, iValue):
+        """
+        Checks if a digit can be placed into a cell, i.e. the cell is empty, and
+        the digit is not present in the same row, column or box.
+
+        Signature:
+            int, int -> bool
+
+        Args:
+            iCell: non-negative integer, flat index of the cell
+            iValue: integer 1 to N, the digit to check
+
+        Returns:
+            bool: True if the digit can be placed, False otherwise
+        """
+        if self._arrCells[iCell]:
+            return False
+        return not ((self._gRowMasks[self._arrRowOf[iCell]]
+                        | self._gColumnMasks[self._arrColumnOf[iCell]]
+                        | self._gBoxMasks[self._arrBoxOf[iCell]])
+                                                        & (1 << (iValue - 1)))
+
+    def getCandidates(self, iCell):
+        """
+        Returns the candidate digits of a cell as a bitset (bit k set means
+        digit k + 1 is a candidate); zero for a non-empty cell.
+
+        Signature:
+            int -> int
+
+        Args:
+            iCell: non-negative integer, flat index of the cell
+
+        Returns:
+            int: bitset of the candidate digits
+        """
+        if self._arrCells[iCell]:
+            return 0
+        return ~(self._gRowMasks[self._arrRowOf[iCell]]
+                    | self._gColumnMasks[self._arrColumnOf[iCell]]
+                    | self._gBoxMasks[self._arrBoxOf[iCell]]) & self.FullMask
+
+    def isComplete(self):
+        """
+        Checks if all cells are filled. Since the board is always consistent, a
+        complete board is a solved one.
+
+        Signature:
+            None -> bool
+        """
+        return self._iFilled == self._iSize * self._iSize
+
+    def copy(self):
+        """
+        Creates an independent copy of the board.
+
+        Signature:
+            None -> SudokuBoard
+        """
+        objCopy = self.__class__.__new__(self.__class__)
+        objCopy.__dict__.update(self.__dict__)
+        objCopy._arrCells = self._arrCells[:]
+        objCopy._gRowMasks = self._gRowMasks[:]
+        objCopy._gColumnMasks = self._gColumnMasks[:]
+        objCopy._gBoxMasks = self._gBoxMasks[:]
+        return objCopy
+
+    def toString(self):
+        """
+        Converts the board into a single line string of N * N characters, with
+        the empty cells represented by '.'.
+
+        Signature:
+            None -> str
+        """
+        return ''.join(DigitToChar(iValue) for iValue in self._arrCells)
+
+    @classmethod
+    def fromString(cls, strPuzzle, iBoxRows = None, iBoxColumns = None):
+        """
+        Creates a board from a single line string of N * N characters. The
+        whitespace characters are ignored. If the box shape is not specified,
+        it is derived from the length of the string (see GetDefaultShape()).
+
+        Signature:
+            str/, int OR None, int OR None/ -> SudokuBoard
+
+        Args:
+            strPuzzle: string, the puzzle definition
+            iBoxRows: (optional) positive integer, number of rows in a box
+            iBoxColumns: (optional) positive integer, number of columns in a
+                box
+
+        Returns:
+            SudokuBoard: new instance
+
+        Raises:
+            TypeError: the first argument is not a string
+            ValueError: the string length does not match the shape, it contains
+                improper characters, or the givens are conflicting
+        """
+        if not isinstance(strPuzzle, basestring):
+            raise TypeError('Not a string puzzle definition')
+        strPuzzle = ''.join(strPuzzle.split())
+        iCells = len(strPuzzle)
+        if iBoxRows is None or iBoxColumns is None:
+            iSize = int(round(iCells ** 0.5))
+            if iSize * iSize != iCells:
+                raise ValueError('Length {} is not a square'.format(iCells))
+            iBoxRows, iBoxColumns = GetDefaultShape(iSize)
+        objBoard = cls(iBoxRows, iBoxColumns)
+        if iCells != objBoard.Cells:
+            raise ValueError('Length {} does not match {} x {} boxes'.format(
+                                                iCells, iBoxRows, iBoxColumns))
+        for iCell, strChar in enumerate(strPuzzle):
+            iValue = CharToDigit(strChar)
+            if iValue:
+                objBoard.setValue(iCell, iValue)
+        return objBoard
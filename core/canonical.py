@@ -0,0 +1,642 @@
+#!/usr/bin/python
+"""
+Module sudoku_py.core.canonical
+
+Implements the canonical form of the generic m x n sudoku puzzles, i.e. a
+single representative of the class of the puzzles equivalent under the
+validity preserving transformations:
+
+    *) relabeling of the digits
+    *) permutation of the bands (horizontal rows of boxes) and of the stacks
+        (vertical columns of boxes)
+    *) permutation of the rows within a band and of the columns within a stack
+    *) transposition - for the square boxes (m = n) within the same shape; a
+        puzzle with the m x n boxes (m > n) is always transposed into the
+        equivalent puzzle with the n x m boxes
+
+Each row and each column is ranked by its signature, which is invariant under
+all these transformations: the number of its clues and the value-pair profiles
+against the other parallel lines of the same group (band or stack) and of the
+other groups, see _GetPairSignature(). The canonical form is the smallest grid
+among all transformations, compared line by line in the 'shell' order: the
+k-th shell consists of the k-th row up to the k-th column, then of the k-th
+column above the k-th row, then of their crossing. A line is compared by its
+rank first, then by its part of the shell, with the clues relabeled in the
+order of their first appearance and the clues ordered before the empty cells.
+Thus the k-th row and the k-th column are chosen together at the k-th step of
+the search, and only the partial transformations yielding the smallest key
+are kept at each step, instead of enumerating all row and column
+permutations. The ranks tell apart almost all lines of the dense puzzles and
+the full grids, which would otherwise tie on the first steps - the first digit
+of every line is relabeled into the same label.
+
+The sparse puzzles (e.g. the empty grid) tie on almost every step, thus the
+tied partial transformations are merged, if they are indistinguishable for the
+rest of the search: their remaining rows and columns, taken in a fixed order
+respecting the bands and stacks, hold the same values up to the relabeling of
+the digits not labeled yet, see _GetResidual(). Such transformations yield the
+same canonical form, thus only one of them is kept, which bounds the search
+for the puzzles with the blank or symmetric lines.
+The full grids with many automorphisms (e.g. the base pattern of the module
+sudoku_py.core.grid_source for the large boxes) tie on every step without
+being merged, thus they remain the worst case - use a budget with them.
+
+Classes:
+    CanonicalMapping
+
+Functions:
+    GetCanonicalMapping()
+        SudokuBoard OR str/, SolveBudget OR None/ -> CanonicalMapping
+    GetCanonicalForm()
+        SudokuBoard OR str -> SudokuBoard
+    HashBoard()
+        SudokuBoard -> str
+    GetCanonicalHash()
+        SudokuBoard OR str -> str
+"""
+
+__version__ = "0.0.1.0"
+__date__ = "17-10-2026"
+__status__ = "Development"
+
+__all__ = ['CanonicalMapping', 'GetCanonicalMapping', 'GetCanonicalForm',
+            'HashBoard', 'GetCanonicalHash']
+
+#imports
+
+#+ standard libraries
+
+import collections
+import hashlib
+import itertools
+import operator
+
+#+ other modules from the package
+
+from sudoku_py.core.board import SudokuBoard, ToBoard
+
+#globals
+
+#+ the tied states are merged only if there are more of them, since merging
+#+ costs a pass over the whole grid per state; the threshold is raised to four
+#+ times the merged number, thus the ties, which cannot be merged (e.g. of
+#+ a full grid), are not merged again and again
+
+MERGE_ABOVE = 64
+
+#+ character code of the zero label in the residual descriptions, greater than
+#+ any raw value of a cell
+
+LABEL_BASE = 128
+
+_strlstCodes = [chr(iCode) for iCode in xrange(256)]
+
+#classes
+
+class CanonicalMapping(collections.namedtuple('CanonicalMapping',
+                        ['Board', 'Cells', 'Digits', 'BoxRows', 'BoxColumns'])):
+    """
+    Canonical form of a puzzle together with the reverse transformation, a
+    named tuple. Any board derived from the canonical form (e.g. its solution)
+    can be mapped back onto the original puzzle by the method toOriginal(),
+    and vice versa by the method fromOriginal().
+
+    Methods:
+        toOriginal(objBoard)
+            SudokuBoard -> SudokuBoard
+        fromOriginal(objBoard)
+            SudokuBoard -> SudokuBoard
+
+    Attributes:
+        Board: SudokuBoard, the canonical form
+        Cells: tuple(int), the original cell index per canonical cell index
+        Digits: tuple(int), the original digit per canonical digit (index)
+        BoxRows: int, number of rows in a box of the original puzzle
+        BoxColumns: int, number of columns in a box of the original puzzle
+    """
+
+    __slots__ = ()
+
+    def toOriginal(self, objBoard):
+        """
+        Applies the reverse transformation to a board of the canonical shape.
+
+        Signature:
+            SudokuBoard -> SudokuBoard
+
+        Args:
+            objBoard: SudokuBoard instance, e.g. the solution of the canonical
+                form
+
+        Returns:
+            SudokuBoard: the transformed board of the original shape
+        """
+        objOriginal = SudokuBoard(self.BoxRows, self.BoxColumns)
+        tupDigits = self.Digits
+        for iCell, iOriginal in enumerate(self.Cells):
+            iValue = objBoard.getValue(iCell)
+            if iValue:
+                objOriginal.setValue(iOriginal, tupDigits[iValue])
+        return objOriginal
+
+    def fromOriginal(self, objBoard):
+        """
+        Applies the direct (canonizing) transformation to a board of the
+        original shape.
+
+        Signature:
+            SudokuBoard -> SudokuBoard
+
+        Args:
+            objBoard: SudokuBoard instance, e.g. the solution of the original
+                puzzle
+
+        Returns:
+            SudokuBoard: the transformed board of the canonical shape
+        """
+        objCanonical = SudokuBoard(self.Board.BoxRows, self.Board.BoxColumns)
+        ilstLabels = [0] * len(self.Digits)
+        for iLabel, iDigit in enumerate(self.Digits):
+            ilstLabels[iDigit] = iLabel
+        for iCell, iOriginal in enumerate(self.Cells):
+            iValue = objBoard.getValue(iOriginal)
+            if iValue:
+                objCanonical.setValue(iCell, ilstLabels[iValue])
+        return objCanonical
+
+#functions
+
+def _GetOptions(iPosition, tupChosen, iGroup, iSize):
+    """
+    Helper function to list the lines (rows or columns), which can be placed
+    at the specified position, given the lines already placed before it. The
+    first line of a group (band or stack) can be taken from any group not used
+    yet, the other lines - only from the group of that first line.
+
+    Signature:
+        int, tuple(int), int, int -> list(int)
+
+    Args:
+        iPosition: non-negative integer, the position to be filled
+        tupChosen: tuple(int), the lines placed at the previous positions
+        iGroup: positive integer, the number of lines in a group
+        iSize: positive integer, the total number of lines N
+
+    Returns:
+        list(int): indexes of the possible lines
+    """
+    iOffset = iPosition % iGroup
+    if iOffset:
+        iFirst = (tupChosen[iPosition - iOffset] // iGroup) * iGroup
+        return [iLine for iLine in xrange(iFirst, iFirst + iGroup)
+                                                if not (iLine in tupChosen)]
+    setUsed = set(tupChosen[iStart] // iGroup
+                                    for iStart in xrange(0, iPosition, iGroup))
+    return [iLine for iLine in xrange(iSize)
+                                if not ((iLine // iGroup) in setUsed)]
+
+def _Relabel(ilstValues, ilstLabels, iNext, iBlank):
+    """
+    Helper function to convert the raw values of the cells into the keys of
+    the canonical ordering. The digits without a label yet are labeled in the
+    order of their appearance, the empty cells are converted into the blank
+    key, which is greater than any label.
+
+    Signature:
+        list(int), list(int), int, int -> tuple(tuple(int), list(int), int)
+
+    Args:
+        ilstValues: list(int), the raw values of the cells
+        ilstLabels: list(int), the current labels per raw digit, zero for the
+            unlabeled digits; it is not modified
+        iNext: positive integer, the next label to be assigned
+        iBlank: positive integer, the key of an empty cell
+
+    Returns:
+        tuple(tuple(int), list(int), int): the keys, the updated labels (the
+            same list object if no new labels were assigned), the next label
+    """
+    ilstKeys = []
+    bCopied = False
+    for iValue in ilstValues:
+        if not iValue:
+            ilstKeys.append(iBlank)
+        else:
+            iLabel = ilstLabels[iValue]
+            if not iLabel:
+                if not bCopied:
+                    ilstLabels = ilstLabels[:]
+                    bCopied = True
+                iLabel = iNext
+                ilstLabels[iValue] = iLabel
+                iNext += 1
+            ilstKeys.append(iLabel)
+    return tuple(ilstKeys), ilstLabels, iNext
+
+def _KeepSmallest(lstCandidates):
+    """
+    Helper function to select the candidate states with the smallest key.
+
+    Signature:
+        list(tuple(tuple(int), type A)) -> list(type A)
+    """
+    tupBest = min(tupItem[0] for tupItem in lstCandidates)
+    return [tupItem[1] for tupItem in lstCandidates if tupItem[0] == tupBest]
+
+def _GetPairSignature(ilstFirst, ilstSecond):
+    """
+    Helper function to calculate the value-pair profile of two parallel lines
+    (rows or columns), which is invariant under the relabeling of the digits
+    and under any permutation of the crossing lines. The digits of the first
+    line are mapped onto the digits of the second line in the same positions;
+    since a digit occurs at most once in a line, this mapping forms disjoint
+    chains and cycles. The profile of the swapped lines differs only by the
+    order of the first two items.
+
+    Signature:
+        list(int), list(int)
+            -> tuple(int, int, tuple(int), tuple(int))
+
+    Returns:
+        tuple(int, int, tuple(int), tuple(int)): the numbers of the clues
+            only in the first and only in the second line, the sorted lengths
+            of the chains and of the cycles
+    """
+    dictNext = {}
+    iOnlyFirst = iOnlySecond = 0
+    for iFirst, iSecond in itertools.izip(ilstFirst, ilstSecond):
+        if iFirst:
+            if iSecond:
+                dictNext[iFirst] = iSecond
+            else:
+                iOnlyFirst += 1
+        elif iSecond:
+            iOnlySecond += 1
+    setTargets = set(dictNext.itervalues())
+    ilstChains = []
+    for iValue in [iValue for iValue in dictNext
+                                            if not (iValue in setTargets)]:
+        iLength = 0
+        while iValue in dictNext:
+            iValue = dictNext.pop(iValue)
+            iLength += 1
+        ilstChains.append(iLength)
+    ilstCycles = []
+    while dictNext:
+        iStart, iValue = dictNext.popitem()
+        iLength = 1
+        while iValue != iStart:
+            iValue = dictNext.pop(iValue)
+            iLength += 1
+        ilstCycles.append(iLength)
+    ilstChains.sort()
+    ilstCycles.sort()
+    return iOnlyFirst, iOnlySecond, tuple(ilstChains), tuple(ilstCycles)
+
+def _GetSignatures(lstLines, iGroup, objBudget):
+    """
+    Helper function to calculate the signatures of the parallel lines (rows
+    or columns): the number of the clues in a line, the sorted value-pair
+    profiles (see _GetPairSignature()) against the other lines of its group
+    (band or stack) and against the lines of the other groups.
+
+    Signature:
+        list(list(int)), int, SolveBudget OR None -> list(tuple)
+    """
+    iSize = len(lstLines)
+    lstInGroup = [[] for _ in xrange(iSize)]
+    lstOutGroup = [[] for _ in xrange(iSize)]
+    for iFirst in xrange(iSize):
+        if objBudget is not None:
+            objBudget.check()
+        ilstFirst = lstLines[iFirst]
+        for iSecond in xrange(iFirst + 1, iSize):
+            iOnlyFirst, iOnlySecond, tupChains, tupCycles = _GetPairSignature(
+                                                ilstFirst, lstLines[iSecond])
+            if iFirst // iGroup == iSecond // iGroup:
+                lstPairs = lstInGroup
+            else:
+                lstPairs = lstOutGroup
+            lstPairs[iFirst].append((iOnlyFirst, iOnlySecond, tupChains,
+                                                                    tupCycles))
+            lstPairs[iSecond].append((iOnlySecond, iOnlyFirst, tupChains,
+                                                                    tupCycles))
+    return [(iSize - lstLines[iLine].count(0),
+                                    tuple(sorted(lstInGroup[iLine])),
+                                    tuple(sorted(lstOutGroup[iLine])))
+                                                    for iLine in xrange(iSize)]
+
+def _GetRanks(lstGrids, iBandRows, iStackColumns, objBudget):
+    """
+    Helper function to rank the rows and the columns of the grids by their
+    signatures (see _GetSignatures()); the equal signatures share the rank.
+    The second grid (if any) must be the transposition of the first one.
+
+    Signature:
+        list(list(list(int))), int, int, SolveBudget OR None
+            -> list(tuple(list(int), list(int)))
+
+    Returns:
+        list(tuple(list(int), list(int))): the ranks of the rows and of the
+            columns per grid
+    """
+    lstRows = lstGrids[0]
+    lstColumns = [list(tupColumn) for tupColumn in zip(*lstRows)]
+    tuplstRows = _GetSignatures(lstRows, iBandRows, objBudget)
+    tuplstColumns = _GetSignatures(lstColumns, iStackColumns, objBudget)
+    dictRanks = dict((tupSignature, iRank) for iRank, tupSignature
+                        in enumerate(sorted(set(tuplstRows + tuplstColumns))))
+    ilstRows = [dictRanks[tupSignature] for tupSignature in tuplstRows]
+    ilstColumns = [dictRanks[tupSignature] for tupSignature in tuplstColumns]
+    lstRanks = [(ilstRows, ilstColumns)]
+    if len(lstGrids) > 1:
+        lstRanks.append((ilstColumns, ilstRows))
+    return lstRanks
+
+def _GetLayout(tupChosen, iGroup, iSize):
+    """
+    Helper function to order all lines (rows or columns): the chosen lines in
+    their order, then the rest of the group of the last chosen line (if it is
+    not complete), then the unused groups - each in the index order.
+
+    Signature:
+        tuple(int), int, int -> list(int)
+    """
+    ilstLayout = list(tupChosen)
+    iChosen = len(tupChosen)
+    iOffset = iChosen % iGroup
+    if iOffset:
+        iFirst = (tupChosen[iChosen - iOffset] // iGroup) * iGroup
+        ilstLayout.extend(iLine for iLine in xrange(iFirst, iFirst + iGroup)
+                                                if not (iLine in tupChosen))
+    setUsed = set(iLine // iGroup for iLine in tupChosen)
+    ilstLayout.extend(iLine for iLine in xrange(iSize)
+                                        if not ((iLine // iGroup) in setUsed))
+    return ilstLayout
+
+def _GetResidual(strlstlstGrids, tupState, iBandRows, iStackColumns, iSize):
+    """
+    Helper function to describe everything the rest of the search depends on
+    for a partial transformation: the whole grid with the rows and columns
+    taken in the fixed order (see _GetLayout()), the labeled digits replaced by
+    their labels and the rest of the digits - by the following labels in the
+    order of their appearance. The equal descriptions mean that both
+    transformations are completed into the same canonical form.
+
+    The grids are passed as the lists of the row strings, in which the
+    character code is the raw value of a cell; the labels are encoded as the
+    character codes from LABEL_BASE on, thus the description is built by the
+    string methods.
+
+    Signature:
+        list(list(str)), tuple(int, tuple(int), tuple(int), list(int), int),
+            int, int, int -> str
+    """
+    iGrid, tupRows, tupColumns, ilstLabels, iNext = tupState
+    strlstRows = strlstlstGrids[iGrid]
+    funColumns = operator.itemgetter(*_GetLayout(tupColumns, iStackColumns,
+                                                                        iSize))
+    strlstTable = _strlstCodes[:]
+    tuplstFirst = []
+    for iValue in xrange(1, iSize + 1):
+        if ilstLabels[iValue]:
+            strlstTable[iValue] = chr(LABEL_BASE + ilstLabels[iValue])
+    strResidual = ''.join([''.join(funColumns(strlstRows[iRow]))
+                        for iRow in _GetLayout(tupRows, iBandRows, iSize)])
+    for iValue in xrange(1, iSize + 1):
+        if not ilstLabels[iValue]:
+            iFirst = strResidual.find(chr(iValue))
+            if iFirst >= 0:
+                tuplstFirst.append((iFirst, iValue))
+    for iLabel, (_, iValue) in enumerate(sorted(tuplstFirst), iNext):
+        strlstTable[iValue] = chr(LABEL_BASE + iLabel)
+    return strResidual.translate(''.join(strlstTable))
+
+def _MergeTied(lstStates, strlstlstGrids, iBandRows, iStackColumns, iSize):
+    """
+    Helper function to keep only the first of the tied states with the same
+    residual description, see _GetResidual().
+
+    Signature:
+        list(tuple(int, tuple(int), tuple(int), list(int), int)),
+            list(list(str)), int, int, int
+                -> list(tuple(int, tuple(int), tuple(int), list(int), int))
+    """
+    setSeen = set()
+    lstMerged = []
+    for tupState in lstStates:
+        strResidual = _GetResidual(strlstlstGrids, tupState, iBandRows,
+                                                        iStackColumns, iSize)
+        if not (strResidual in setSeen):
+            setSeen.add(strResidual)
+            lstMerged.append(tupState)
+    return lstMerged
+
+def _Canonize(lstGrids, iBandRows, iStackColumns, iSize, objBudget):
+    """
+    Helper function to perform the step-wise search of the canonical form.
+
+    Each state is a tuple (grid index, chosen rows, chosen columns, labels,
+    next label); the labels list is shared by the child states and copied
+    (see _Relabel()) only when a new label is actually assigned. The key of a
+    chosen line is its rank (see _GetRanks()) followed by its part of the
+    shell. The tied states are merged after a choice, if there are more of
+    them than the threshold, see MERGE_ABOVE and _MergeTied().
+
+    Signature:
+        list(list(list(int))), int, int, int, SolveBudget OR None
+            -> tuple(int, tuple(int), tuple(int), list(int))
+
+    Args:
+        lstGrids: list(list(list(int))), the grid and, for the square boxes,
+            its transposition as lists of rows
+        iBandRows: positive integer, number of rows in a band (box rows m)
+        iStackColumns: positive integer, number of columns in a stack (box
+            columns n)
+        iSize: positive integer, the size of the board N
+        objBudget: SolveBudget instance, which is checked for each state, or
+            None
+
+    Returns:
+        tuple(int, tuple(int), tuple(int), list(int)): the index of the grid,
+            the rows and the columns of that grid in the canonical order, the
+            labels of the raw digits (zero for the digits not present)
+    """
+    iBlank = iSize + 1
+    strlstlstGrids = [[''.join(map(chr, ilstRow)) for ilstRow in lstRows]
+                                                        for lstRows in lstGrids]
+    lstRanks = _GetRanks(lstGrids, iBandRows, iStackColumns, objBudget)
+    iMergeAbove = MERGE_ABOVE
+    lstStates = []
+    for iGrid in xrange(len(lstGrids)):
+        lstStates.append((iGrid, (), (), [0] * (iSize + 1), 1))
+    for iStep in xrange(iSize):
+        #choose the row - the keys of the row part of the shell
+        lstCandidates = []
+        for iGrid, tupRows, tupColumns, ilstLabels, iNext in lstStates:
+            if objBudget is not None:
+                objBudget.check()
+            ilstGridRows = lstGrids[iGrid]
+            ilstRanks = lstRanks[iGrid][0]
+            for iRow in _GetOptions(iStep, tupRows, iBandRows, iSize):
+                ilstRow = ilstGridRows[iRow]
+                tupKey, ilstNew, iNew = _Relabel([ilstRow[iColumn]
+                                                for iColumn in tupColumns],
+                                                ilstLabels, iNext, iBlank)
+                lstCandidates.append(((ilstRanks[iRow], tupKey), (iGrid,
+                                tupRows + (iRow, ), tupColumns, ilstNew, iNew)))
+        lstStates = _KeepSmallest(lstCandidates)
+        if len(lstStates) > iMergeAbove:
+            lstStates = _MergeTied(lstStates, strlstlstGrids, iBandRows,
+                                                        iStackColumns, iSize)
+            iMergeAbove = max(MERGE_ABOVE, 4 * len(lstStates))
+        #choose the column - the keys of the column part and the crossing
+        lstCandidates = []
+        for iGrid, tupRows, tupColumns, ilstLabels, iNext in lstStates:
+            if objBudget is not None:
+                objBudget.check()
+            ilstGridRows = lstGrids[iGrid]
+            ilstRanks = lstRanks[iGrid][1]
+            for iColumn in _GetOptions(iStep, tupColumns, iStackColumns,
+                                                                        iSize):
+                tupKey, ilstNew, iNew = _Relabel([ilstGridRows[iRow][iColumn]
+                                                    for iRow in tupRows],
+                                                    ilstLabels, iNext, iBlank)
+                lstCandidates.append(((ilstRanks[iColumn], tupKey), (iGrid,
+                            tupRows, tupColumns + (iColumn, ), ilstNew, iNew)))
+        lstStates = _KeepSmallest(lstCandidates)
+        if len(lstStates) > iMergeAbove:
+            lstStates = _MergeTied(lstStates, strlstlstGrids, iBandRows,
+                                                        iStackColumns, iSize)
+            iMergeAbove = max(MERGE_ABOVE, 4 * len(lstStates))
+    iGrid, tupRows, tupColumns, ilstLabels, _ = lstStates[0]
+    return iGrid, tupRows, tupColumns, ilstLabels
+
+def GetCanonicalMapping(gPuzzle, objBudget = None):
+    """
+    Finds the canonical form of a puzzle together with the transformation,
+    which maps it back onto the original puzzle, see CanonicalMapping.
+
+    Signature:
+        SudokuBoard OR str/, SolveBudget OR None/ -> CanonicalMapping
+
+    Args:
+        gPuzzle: SudokuBoard instance or string, the puzzle definition
+        objBudget: (optional) sudoku_py.core.solve_budget.SolveBudget
+            instance, its deadline and cancellation are checked during the
+            search, None (default) - unlimited
+
+    Returns:
+        CanonicalMapping: the canonical form and the reverse transformation
+
+    Raises:
+        TypeError: the argument is neither a board nor a string
+        ValueError: the string is not a proper puzzle definition
+        sudoku_py.core.solve_budget.BudgetExceeded: the budget's deadline is
+            passed or it is cancelled
+    """
+    objBoard = ToBoard(gPuzzle)
+    iBoxRows = objBoard.BoxRows
+    iBoxColumns = objBoard.BoxColumns
+    iSize = objBoard.Size
+    ilstValues = objBoard.Values
+    lstRows = [ilstValues[iStart : iStart + iSize]
+                                for iStart in xrange(0, iSize * iSize, iSize)]
+    lstTransposed = [list(tupColumn) for tupColumn in zip(*lstRows)]
+    if iBoxRows < iBoxColumns:
+        lstGrids = [lstRows]
+        tupTransposed = (False, )
+    elif iBoxRows > iBoxColumns:
+        lstGrids = [lstTransposed]
+        tupTransposed = (True, )
+    else:
+        lstGrids = [lstRows, lstTransposed]
+        tupTransposed = (False, True)
+    iGrid, tupRows, tupColumns, ilstLabels = _Canonize(lstGrids,
+                                min(iBoxRows, iBoxColumns),
+                                max(iBoxRows, iBoxColumns), iSize, objBudget)
+    ilstDigits = [0] * (iSize + 1)
+    for iDigit, iLabel in enumerate(ilstLabels):
+        if iLabel:
+            ilstDigits[iLabel] = iDigit
+    iLabel = max(ilstLabels) + 1
+    for iDigit in xrange(1, iSize + 1):
+        if not ilstLabels[iDigit]:
+            ilstDigits[iLabel] = iDigit
+            iLabel += 1
+    if tupTransposed[iGrid]:
+        tupCells = tuple(iColumn * iSize + iRow for iRow in tupRows
+                                                    for iColumn in tupColumns)
+    else:
+        tupCells = tuple(iRow * iSize + iColumn for iRow in tupRows
+                                                    for iColumn in tupColumns)
+    objCanonical = SudokuBoard(min(iBoxRows, iBoxColumns),
+                                                max(iBoxRows, iBoxColumns))
+    for iCell, iOriginal in enumerate(tupCells):
+        iValue = ilstValues[iOriginal]
+        if iValue:
+            objCanonical.setValue(iCell, ilstLabels[iValue])
+    return CanonicalMapping(objCanonical, tupCells, tuple(ilstDigits),
+                                                        iBoxRows, iBoxColumns)
+
+def GetCanonicalForm(gPuzzle):
+    """
+    Finds the canonical representative of the class of the equivalent puzzles.
+    Two puzzles are equivalent if and only if their canonical forms are equal.
+    The canonical form of a puzzle with the m x n boxes, m > n, has the n x m
+    boxes.
+
+    Signature:
+        SudokuBoard OR str -> SudokuBoard
+
+    Args:
+        gPuzzle: SudokuBoard instance or string, the puzzle definition
+
+    Returns:
+        SudokuBoard: the canonical form of the puzzle
+
+    Raises:
+        TypeError: the argument is neither a board nor a string
+        ValueError: the string is not a proper puzzle definition
+    """
+    return GetCanonicalMapping(gPuzzle).Board
+
+def HashBoard(objBoard):
+    """
+    Calculates a compact hash (SHA-1 hexadecimal digest) of a board as it is,
+    including its box shape. Applied to a canonical form it gives the hash
+    shared by all equivalent puzzles, see GetCanonicalHash().
+
+    Signature:
+        SudokuBoard -> str
+
+    Args:
+        objBoard: SudokuBoard instance
+
+    Returns:
+        str: 40 hexadecimal characters
+    """
+    return hashlib.sha1('{}x{}:{}'.format(objBoard.BoxRows,
+                        objBoard.BoxColumns, objBoard.toString())).hexdigest()
+
+def GetCanonicalHash(gPuzzle):
+    """
+    Calculates a compact hash (SHA-1 hexadecimal digest) of the canonical form
+    of a puzzle, including its box shape. The equivalent puzzles have the same
+    hash, thus it can be used for the deduplication of the puzzles and as a
+    key of the caches.
+
+    Signature:
+        SudokuBoard OR str -> str
+
+    Args:
+        gPuzzle: SudokuBoard instance or string, the puzzle definition
+
+    Returns:
+        str: 40 hexadecimal characters
+
+    Raises:
+        TypeError: the argument is neither a board nor a string
+        ValueError: the string is not a proper puzzle definition
+    """
+    return HashBoard(GetCanonicalForm(gPuzzle))
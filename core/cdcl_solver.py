@@ -0,0 +1,596 @@
+#!/usr/bin/python
+"""
+Module sudoku_py.core.cdcl_solver
+
+Implements the conflict-driven clause learning (CDCL) SAT solver of the generic
+m x n sudoku puzzles, intended for the large boards (6 x 6 boxes and larger),
+where the plain backtracking of the other engines hits the exponential walls.
+
+The puzzle is encoded in CNF with one boolean variable per candidate digit of
+each empty cell; the variables fixed or excluded by the givens are not created
+at all. The clauses are:
+    *) each empty cell has at least one digit
+    *) each digit missing from a unit has at least one cell in it
+    *) at most one digit per cell and at most one cell per digit in a unit -
+        these binary clauses are not stored, but propagated implicitly: when a
+        variable becomes true, all variables in conflict with it (the other
+        candidates of the cell and the same digit in the peers) become false
+
+The stored clauses are propagated with two watched literals per clause. On a
+conflict the first unique implication point clause is learned (with the
+literals implied by the other literals of the clause removed), and the search
+jumps back non-chronologically. The decisions always place a digit (set a
+variable true) and pick the variable of the highest VSIDS activity, which is
+bumped for the variables involved in the conflicts and decays over time. The
+search restarts following the Luby sequence, and the longer half of the
+learned clauses is dropped at a restart, when there are too many of them.
+
+The subsequent solutions are found by adding the clause blocking the decisions
+leading to the last one.
+
+The literals are integers: 2 * v for the variable v being true and 2 * v + 1
+for it being false. The state is kept in flat lists, thus no objects are
+allocated per assignment, except the reasons of the implicit binary clauses.
+
+Classes:
+    CDCLSolver
+
+Functions:
+    Solve()
+        SudokuBoard OR str/, int OR None/ -> list(SudokuBoard)
+"""
+
+__version__ = "0.0.1.0"
+__date__ = "17-10-2026"
+__status__ = "Development"
+
+__all__ = ['CDCLSolver', 'Solve']
+
+#imports
+
+#+ standard libraries
+
+import heapq
+
+#+ other modules from the package
+
+from sudoku_py.core.board import GetIndexTables
+
+from sudoku_py.core.solver_base import SolverBase
+
+from sudoku_py.core.solver_stats import PHASE_SETUP, PHASE_PROPAGATION
+
+#globals
+
+#+ number of the conflicts between the restarts per unit of the Luby sequence
+
+RESTART_BASE = 100
+
+#+ decay factor of the VSIDS activity per conflict
+
+ACTIVITY_DECAY = 0.95
+
+#+ the activity, above which all activities are scaled down
+
+ACTIVITY_LIMIT = 1e100
+
+#+ the initial limit of the learned clauses relative to the stored ones, and
+#+ its growth factor per reduction
+
+LEARNED_RATIO = 0.5
+
+LEARNED_GROWTH = 1.1
+
+#+ the size of the variables' heap relative to the number of the variables,
+#+ above which the heap is rebuilt at a restart
+
+HEAP_SLACK = 8
+
+#functions
+
+def _Luby(iIndex):
+    """
+    Helper function to get an element of the Luby sequence 1, 1, 2, 1, 1, 2,
+    4, 1, ... (from zero index).
+
+    Signature:
+        int -> int
+    """
+    iSize = 1
+    iPower = 0
+    while iSize < iIndex + 1:
+        iPower += 1
+        iSize = 2 * iSize + 1
+    while iSize - 1 != iIndex:
+        iSize = (iSize - 1) >> 1
+        iPower -= 1
+        iIndex %= iSize
+    return 1 << iPower
+
+def Solve(gPuzzle, iMaxSolutions = 1):
+    """
+    Finds up to the requested number of solutions of a puzzle.
+
+    Signature:
+        SudokuBoard OR str/, int OR None/ -> list(SudokuBoard)
+
+    Args:
+        gPuzzle: SudokuBoard instance or string, the puzzle definition
+        iMaxSolutions: (optional) positive integer or None, the maximum number
+            of solutions to find, None means all solutions; defaults to 1
+
+    Returns:
+        list(SudokuBoard): found solutions, empty list if there are none
+
+    Raises:
+        TypeError: the puzzle is neither a board nor a string, or the maximum
+            number of solutions is not an integer or None
+        ValueError: the puzzle string is malformed, or the maximum number of
+            solutions is not positive
+    """
+    return CDCLSolver(gPuzzle).solve(iMaxSolutions)
+
+#classes
+
+class CDCLSolver(SolverBase):
+    """
+    Conflict-driven clause learning SAT solver of a single puzzle. The CNF
+    encoding is built upon instantiation; the search is started by iterating
+    over the generator returned by the method iterSolutions(). Each search
+    starts from the encoding without the clauses learned by a previous one.
+
+    Subclasses sudoku_py.core.solver_base.SolverBase.
+
+    Methods:
+        iterSolutions()
+            None -> generator(SudokuBoard)
+        solve(iMaxSolutions = 1)
+            /int OR None/ -> list(SudokuBoard)
+        countSolutions(iLimit = 2)
+            /int OR None/ -> int
+        solveLimited(iMaxSolutions = 1, objBudget = None)
+            /int OR None, SolveBudget OR None/ -> SolveResult
+
+    Attributes:
+        Name: str, read-only property, name of the engine
+        Puzzle: SudokuBoard, read-only property, the puzzle being solved
+        Stats: SolverStats OR None, read-only property, the attached
+            statistics collector
+    """
+
+    #class fields
+
+    _strName = 'cdcl'
+
+    #special methods
+
+    def __init__(self, gPuzzle, objStats = None):
+        """
+        Builds the CNF encoding of the puzzle.
+
+        Signature:
+            SudokuBoard OR str/, SolverStats OR None/ -> None
+
+        Args:
+            gPuzzle: SudokuBoard instance or string, the puzzle definition
+            objStats: (optional) sudoku_py.core.solver_stats.SolverStats
+                instance, the statistics collector, None (default) - no
+                statistics are collected
+
+        Raises:
+            TypeError: the argument is neither a board nor a string
+            ValueError: the string is not a proper puzzle definition
+        """
+        if objStats is not None:
+            gStart = objStats.Timer()
+        super(CDCLSolver, self).__init__(gPuzzle, objStats)
+        objBoard = self._objBoard
+        iSize = objBoard.Size
+        iCells = objBoard.Cells
+        _, _, _, tupUnits, self._tupPeers = GetIndexTables(objBoard.BoxRows,
+                                                        objBoard.BoxColumns)
+        ilstValues = objBoard.Values
+        #variable per (cell, digit - 1) pair, -1 if not a candidate
+        ilstVarOf = [-1] * (iCells * iSize)
+        ilstCellOf = []
+        ilstDigitOf = []
+        ilstFirstVar = [0] * (iCells + 1)
+        lstClauses = []
+        bFeasible = True
+        for iCell, iValue in enumerate(ilstValues):
+            ilstFirstVar[iCell] = len(ilstCellOf)
+            if not iValue:
+                iMask = objBoard.getCandidates(iCell)
+                if not iMask:
+                    bFeasible = False
+                lstClause = []
+                iBase = iCell * iSize
+                for iDigit in xrange(iSize):
+                    if iMask & (1 << iDigit):
+                        iVar = len(ilstCellOf)
+                        ilstVarOf[iBase + iDigit] = iVar
+                        ilstCellOf.append(iCell)
+                        ilstDigitOf.append(iDigit)
+                        lstClause.append(2 * iVar)
+                lstClauses.append(lstClause)
+        ilstFirstVar[iCells] = len(ilstCellOf)
+        for tupUnit in tupUnits:
+            iPlaced = 0
+            for iCell in tupUnit:
+                if ilstValues[iCell]:
+                    iPlaced |= 1 << (ilstValues[iCell] - 1)
+            for iDigit in xrange(iSize):
+                if not (iPlaced & (1 << iDigit)):
+                    lstClause = [2 * ilstVarOf[iCell * iSize + iDigit]
+                                    for iCell in tupUnit
+                                    if ilstVarOf[iCell * iSize + iDigit] >= 0]
+                    if not lstClause:
+                        bFeasible = False
+                    lstClauses.append(lstClause)
+        self._bFeasible = bFeasible
+        self._iVars = len(ilstCellOf)
+        self._ilstVarOf = ilstVarOf
+        self._ilstCellOf = ilstCellOf
+        self._ilstDigitOf = ilstDigitOf
+        self._ilstFirstVar = ilstFirstVar
+        self._lstClauses = lstClauses
+        #the search state, see _search()
+        self._ilstValue = [0] * (2 * self._iVars)
+        self._ilstTrail = []
+        if objStats is not None:
+            objStats.addTime(PHASE_SETUP, objStats.Timer() - gStart)
+
+    #helper methods
+
+    def _getConflicts(self, iVar):
+        """
+        Helper method to create the negative literals of all variables in
+        conflict with a variable, i.e. the implicit binary clauses.
+
+        Signature:
+            int -> tuple(int)
+        """
+        iCell = self._ilstCellOf[iVar]
+        iDigit = self._ilstDigitOf[iVar]
+        iSize = self._objBoard.Size
+        ilstVarOf = self._ilstVarOf
+        ilstLiterals = [2 * iOther + 1 for iOther in xrange(
+                    self._ilstFirstVar[iCell], self._ilstFirstVar[iCell + 1])
+                                                        if iOther != iVar]
+        for iPeer in self._tupPeers[iCell]:
+            iOther = ilstVarOf[iPeer * iSize + iDigit]
+            if iOther >= 0:
+                ilstLiterals.append(2 * iOther + 1)
+        return tuple(ilstLiterals)
+
+    def _makeSolution(self):
+        """
+        Helper method to create a board from the variables currently set true,
+        which is the solution when all variables are assigned.
+
+        Signature:
+            None -> SudokuBoard
+        """
+        objSolution = self._objBoard.copy()
+        ilstValue = self._ilstValue
+        ilstCellOf = self._ilstCellOf
+        ilstDigitOf = self._ilstDigitOf
+        for iVar in xrange(self._iVars):
+            if ilstValue[2 * iVar] > 0:
+                objSolution.setValue(ilstCellOf[iVar], ilstDigitOf[iVar] + 1)
+        return objSolution
+
+    def _makePartial(self):
+        """
+        Helper method to create a board from the variables currently set true
+        in the middle of the search.
+
+        Signature:
+            None -> SudokuBoard
+        """
+        return self._makeSolution()
+
+    def _search(self):
+        """
+        Helper generator method, which performs the search and yields each time
+        a solution is reached, i.e. all variables are assigned.
+
+        Signature:
+            None -> generator(None)
+        """
+        if not self._bFeasible:
+            return
+        iVars = self._iVars
+        objStats = self._objStats
+        ilstCellOf = self._ilstCellOf
+        ilstDigitOf = self._ilstDigitOf
+        #literal values: 1 - true, -1 - false, 0 - unassigned
+        ilstValue = self._ilstValue = [0] * (2 * iVars)
+        ilstLevel = [0] * iVars
+        lstReason = [None] * iVars
+        ilstTrail = self._ilstTrail = []
+        ilstTrailLim = []
+        lstWatches = [[] for _ in xrange(2 * iVars)]
+        lstConflicts = [None] * iVars
+        glstActivity = [0.0] * iVars
+        lstLearned = []
+        ilstSeen = [0] * iVars
+        ilstUnits = []
+        for lstClause in self._lstClauses:
+            if len(lstClause) == 1:
+                ilstUnits.append(lstClause[0])
+            else:
+                lstClause = list(lstClause)
+                lstWatches[lstClause[0]].append(lstClause)
+                lstWatches[lstClause[1]].append(lstClause)
+        #cells with fewer candidates are tried first before any conflicts
+        for iVar in xrange(iVars):
+            iCell = ilstCellOf[iVar]
+            glstActivity[iVar] = 1.0 / (self._ilstFirstVar[iCell + 1]
+                                                - self._ilstFirstVar[iCell])
+        #max-heap of the variables by the activity with the outdated entries
+        #left in it, and the activity of the latest entry per variable (-1 if
+        #it is popped); the variables are not removed, when assigned, and they
+        #are pushed back, when un-assigned, only if popped or bumped
+        lstHeap = []
+        glstInHeap = [-1.0] * iVars
+        gIncrement = 1.0
+        iMaxLearned = max(int(LEARNED_RATIO * len(self._lstClauses)), 100)
+        iRestarts = 0
+        iConflictsLeft = RESTART_BASE * _Luby(0)
+        iHead = 0
+
+        def Rebuild():
+            """
+            Re-creates the heap with a single up-to-date entry per variable.
+            """
+            lstHeap[:] = [(-glstActivity[iVar], iVar)
+                                                    for iVar in xrange(iVars)]
+            heapq.heapify(lstHeap)
+            glstInHeap[:] = glstActivity
+
+        def Propagate(iHead):
+            """
+            Assigns the implied literals until a fixpoint or a conflict.
+            Returns the new head of the trail and the conflicting clause (or
+            None).
+            """
+            while iHead < len(ilstTrail):
+                iLiteral = ilstTrail[iHead]
+                iHead += 1
+                if not (iLiteral & 1):
+                    #a digit is placed - all conflicting variables become false
+                    iVar = iLiteral >> 1
+                    tupConflicts = lstConflicts[iVar]
+                    if tupConflicts is None:
+                        tupConflicts = self._getConflicts(iVar)
+                        lstConflicts[iVar] = tupConflicts
+                    iLevel = len(ilstTrailLim)
+                    for iOther in tupConflicts:
+                        iValue = ilstValue[iOther]
+                        if iValue > 0:
+                            continue
+                        if iValue < 0:
+                            return iHead, (iOther, iLiteral ^ 1)
+                        ilstValue[iOther] = 1
+                        ilstValue[iOther ^ 1] = -1
+                        ilstLevel[iOther >> 1] = iLevel
+                        lstReason[iOther >> 1] = (iOther, iLiteral ^ 1)
+                        ilstTrail.append(iOther)
+                iFalse = iLiteral ^ 1
+                lstWatch = lstWatches[iFalse]
+                iRead = 0
+                iWrite = 0
+                iTotal = len(lstWatch)
+                while iRead < iTotal:
+                    lstClause = lstWatch[iRead]
+                    iRead += 1
+                    if not lstClause:
+                        #deleted learned clause
+                        continue
+                    if lstClause[0] == iFalse:
+                        lstClause[0] = lstClause[1]
+                        lstClause[1] = iFalse
+                    iFirst = lstClause[0]
+                    if ilstValue[iFirst] > 0:
+                        lstWatch[iWrite] = lstClause
+                        iWrite += 1
+                        continue
+                    for iIndex in xrange(2, len(lstClause)):
+                        iOther = lstClause[iIndex]
+                        if ilstValue[iOther] >= 0:
+                            lstClause[1] = iOther
+                            lstClause[iIndex] = iFalse
+                            lstWatches[iOther].append(lstClause)
+                            break
+                    else:
+                        lstWatch[iWrite] = lstClause
+                        iWrite += 1
+                        if ilstValue[iFirst] < 0:
+                            while iRead < iTotal:
+                                lstWatch[iWrite] = lstWatch[iRead]
+                                iWrite += 1
+                                iRead += 1
+                            del lstWatch[iWrite:]
+                            return iHead, lstClause
+                        ilstValue[iFirst] = 1
+                        ilstValue[iFirst ^ 1] = -1
+                        ilstLevel[iFirst >> 1] = len(ilstTrailLim)
+                        lstReason[iFirst >> 1] = lstClause
+                        ilstTrail.append(iFirst)
+                del lstWatch[iWrite:]
+            return iHead, None
+
+        def Backjump(iLevel):
+            """
+            Un-assigns all literals above the decision level.
+            """
+            if len(ilstTrailLim) > iLevel:
+                iMark = ilstTrailLim[iLevel]
+                for iIndex in xrange(len(ilstTrail) - 1, iMark - 1, -1):
+                    iLiteral = ilstTrail[iIndex]
+                    iVar = iLiteral >> 1
+                    ilstValue[iLiteral] = 0
+                    ilstValue[iLiteral ^ 1] = 0
+                    lstReason[iVar] = None
+                    if glstInHeap[iVar] != glstActivity[iVar]:
+                        glstInHeap[iVar] = glstActivity[iVar]
+                        heapq.heappush(lstHeap, (-glstActivity[iVar], iVar))
+                del ilstTrail[iMark:]
+                del ilstTrailLim[iLevel:]
+            return len(ilstTrail)
+
+        def Enqueue(iLiteral, gReason):
+            """
+            Assigns a literal at the current decision level.
+            """
+            iVar = iLiteral >> 1
+            ilstValue[iLiteral] = 1
+            ilstValue[iLiteral ^ 1] = -1
+            ilstLevel[iVar] = len(ilstTrailLim)
+            lstReason[iVar] = gReason
+            ilstTrail.append(iLiteral)
+
+        def Analyze(gConflict, gIncrement):
+            """
+            Derives the first UIP clause of a conflict, bumping the activity
+            of the involved variables. Returns the clause (the asserting
+            literal first, the literal of the back-jump level second), the
+            back-jump level and the new activity increment.
+            """
+            iLevel = len(ilstTrailLim)
+            ilstLearned = [0]
+            iPaths = 0
+            iLiteral = -1
+            iIndex = len(ilstTrail) - 1
+            gReason = gConflict
+            bRescale = False
+            while True:
+                for iOther in gReason:
+                    if iOther == iLiteral:
+                        continue
+                    iVar = iOther >> 1
+                    if not ilstSeen[iVar] and ilstLevel[iVar] > 0:
+                        ilstSeen[iVar] = 1
+                        glstActivity[iVar] += gIncrement
+                        if glstActivity[iVar] > ACTIVITY_LIMIT:
+                            bRescale = True
+                        if ilstLevel[iVar] >= iLevel:
+                            iPaths += 1
+                        else:
+                            ilstLearned.append(iOther)
+                while not ilstSeen[ilstTrail[iIndex] >> 1]:
+                    iIndex -= 1
+                iLiteral = ilstTrail[iIndex]
+                iIndex -= 1
+                ilstSeen[iLiteral >> 1] = 0
+                iPaths -= 1
+                if not iPaths:
+                    break
+                gReason = lstReason[iLiteral >> 1]
+            ilstLearned[0] = iLiteral ^ 1
+            #drop the literals implied by the other literals of the clause
+            ilstKept = [ilstLearned[0]]
+            for iOther in ilstLearned[1:]:
+                gReason = lstReason[iOther >> 1]
+                if gReason is None:
+                    ilstKept.append(iOther)
+                    continue
+                for iImplied in gReason:
+                    iVar = iImplied >> 1
+                    if (iVar != iOther >> 1 and not ilstSeen[iVar]
+                                                    and ilstLevel[iVar] > 0):
+                        ilstKept.append(iOther)
+                        break
+            for iOther in ilstLearned[1:]:
+                ilstSeen[iOther >> 1] = 0
+            iBackLevel = 0
+            for iIndex in xrange(1, len(ilstKept)):
+                iVarLevel = ilstLevel[ilstKept[iIndex] >> 1]
+                if iVarLevel > iBackLevel:
+                    iBackLevel = iVarLevel
+                    ilstKept[1], ilstKept[iIndex] = (ilstKept[iIndex],
+                                                                ilstKept[1])
+            gIncrement /= ACTIVITY_DECAY
+            if bRescale or gIncrement > ACTIVITY_LIMIT:
+                for iVar in xrange(iVars):
+                    glstActivity[iVar] *= 1.0 / ACTIVITY_LIMIT
+                gIncrement *= 1.0 / ACTIVITY_LIMIT
+                Rebuild()
+            return ilstKept, iBackLevel, gIncrement
+
+        Rebuild()
+        for iLiteral in ilstUnits:
+            if ilstValue[iLiteral] < 0:
+                return
+            if not ilstValue[iLiteral]:
+                Enqueue(iLiteral, None)
+        while True:
+            if objStats is None:
+                iHead, gConflict = Propagate(iHead)
+            else:
+                gStart = objStats.Timer()
+                iHead, gConflict = Propagate(iHead)
+                objStats.addTime(PHASE_PROPAGATION, objStats.Timer() - gStart)
+                objStats.Propagations += 1
+            if gConflict is not None:
+                if objStats is not None:
+                    objStats.Backtracks += 1
+                if not ilstTrailLim:
+                    return
+                ilstLearned, iBackLevel, gIncrement = Analyze(gConflict,
+                                                                    gIncrement)
+                iHead = Backjump(iBackLevel)
+                if len(ilstLearned) == 1:
+                    Enqueue(ilstLearned[0], None)
+                else:
+                    lstWatches[ilstLearned[0]].append(ilstLearned)
+                    lstWatches[ilstLearned[1]].append(ilstLearned)
+                    lstLearned.append(ilstLearned)
+                    Enqueue(ilstLearned[0], ilstLearned)
+                iConflictsLeft -= 1
+                continue
+            if iConflictsLeft <= 0:
+                iRestarts += 1
+                iConflictsLeft = RESTART_BASE * _Luby(iRestarts)
+                iHead = Backjump(0)
+                if len(lstLearned) > iMaxLearned:
+                    #the reasons of the level 0 literals are never analyzed
+                    lstLearned.sort(key = len)
+                    for lstClause in lstLearned[len(lstLearned) // 2:]:
+                        del lstClause[:]
+                    del lstLearned[len(lstLearned) // 2:]
+                    iMaxLearned = int(iMaxLearned * LEARNED_GROWTH)
+                if len(lstHeap) > HEAP_SLACK * iVars:
+                    #drop the outdated entries of the re-prioritized variables
+                    Rebuild()
+                continue
+            #pick the unassigned variable with the highest activity
+            iVar = -1
+            while lstHeap:
+                gPriority, iVar = heapq.heappop(lstHeap)
+                if -gPriority == glstInHeap[iVar]:
+                    glstInHeap[iVar] = -1.0
+                    if not ilstValue[2 * iVar]:
+                        break
+                iVar = -1
+            if iVar < 0:
+                yield None
+                #block the decisions leading to this solution
+                ilstBlocking = [ilstTrail[iMark] ^ 1
+                                    for iMark in reversed(ilstTrailLim)]
+                if not ilstBlocking:
+                    return
+                iHead = Backjump(len(ilstBlocking) - 1)
+                if len(ilstBlocking) == 1:
+                    Enqueue(ilstBlocking[0], None)
+                else:
+                    lstWatches[ilstBlocking[0]].append(ilstBlocking)
+                    lstWatches[ilstBlocking[1]].append(ilstBlocking)
+                    Enqueue(ilstBlocking[0], ilstBlocking)
+                continue
+            ilstTrailLim.append(len(ilstTrail))
+            Enqueue(2 * iVar, None)
+            if objStats is not None:
+                objStats.enterNode(len(ilstTrailLim), ilstCellOf[iVar],
+                                                        ilstDigitOf[iVar] + 1)
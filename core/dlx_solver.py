@@ -0,0 +1,345 @@
+#!/usr/bin/python
+"""
+Module sudoku_py.core.dlx_solver
+
+Implements the exact cover solver of the generic m x n sudoku puzzles based on
+the D. Knuth's Algorithm X over the dancing links structure.
+
+The puzzle is encoded as an exact cover matrix with 4 * N * N columns (each
+cell is filled, each digit is present in each row, column and box) and one row
+per each candidate digit of each empty cell. The constraints already satisfied
+by the givens and the placements excluded by them are not included into the
+matrix at all.
+
+The links are stored in flat integer arrays (left, right, up, down, column
+header per node) instead of per-node objects, and the search is iterative
+(explicit stack of the chosen nodes), thus the solutions can be yielded one by
+one.
+
+Classes:
+    DLXSolver
+
+Functions:
+    Solve()
+        SudokuBoard OR str/, int OR None/ -> list(SudokuBoard)
+"""
+
+__version__ = "0.0.1.0"
+__date__ = "16-10-2026"
+__status__ = "Development"
+
+__all__ = ['DLXSolver', 'Solve']
+
+#imports
+
+#+ other modules from the package
+
+from sudoku_py.core.solver_base import SolverBase
+
+from sudoku_py.core.solver_stats import PHASE_SETUP
+
+#functions
+
+def _Cover(iColumn, lstLeft, lstRight, lstUp, lstDown, lstHeader, lstSize):
+    """
+    Helper function to remove a column from the header list and all rows
+    intersecting this column from the other columns.
+
+    Signature:
+        int, list(int), list(int), list(int), list(int), list(int), list(int)
+            -> None
+    """
+    lstLeft[lstRight[iColumn]] = lstLeft[iColumn]
+    lstRight[lstLeft[iColumn]] = lstRight[iColumn]
+    iRowNode = lstDown[iColumn]
+    while iRowNode != iColumn:
+        iNode = lstRight[iRowNode]
+        while iNode != iRowNode:
+            lstUp[lstDown[iNode]] = lstUp[iNode]
+            lstDown[lstUp[iNode]] = lstDown[iNode]
+            lstSize[lstHeader[iNode]] -= 1
+            iNode = lstRight[iNode]
+        iRowNode = lstDown[iRowNode]
+
+def _Uncover(iColumn, lstLeft, lstRight, lstUp, lstDown, lstHeader, lstSize):
+    """
+    Helper function to restore a column removed by _Cover(), the operations are
+    performed in the exactly reversed order.
+
+    Signature:
+        int, list(int), list(int), list(int), list(int), list(int), list(int)
+            -> None
+    """
+    iRowNode = lstUp[iColumn]
+    while iRowNode != iColumn:
+        iNode = lstLeft[iRowNode]
+        while iNode != iRowNode:
+            lstSize[lstHeader[iNode]] += 1
+            lstUp[lstDown[iNode]] = iNode
+            lstDown[lstUp[iNode]] = iNode
+            iNode = lstLeft[iNode]
+        iRowNode = lstUp[iRowNode]
+    lstLeft[lstRight[iColumn]] = iColumn
+    lstRight[lstLeft[iColumn]] = iColumn
+
+def Solve(gPuzzle, iMaxSolutions = 1):
+    """
+    Finds up to the requested number of solutions of a puzzle.
+
+    Signature:
+        SudokuBoard OR str/, int OR None/ -> list(SudokuBoard)
+
+    Args:
+        gPuzzle: SudokuBoard instance or string, the puzzle definition
+        iMaxSolutions: (optional) positive integer or None, the maximum number
+            of solutions to find, None means all solutions; defaults to 1
+
+    Returns:
+        list(SudokuBoard): found solutions, empty list if there are none
+
+    Raises:
+        TypeError: the puzzle is neither a board nor a string, or the maximum
+            number of solutions is not an integer or None
+        ValueError: the puzzle string is malformed, or the maximum number of
+            solutions is not positive
+    """
+    return DLXSolver(gPuzzle).solve(iMaxSolutions)
+
+#classes
+
+class DLXSolver(SolverBase):
+    """
+    Dancing links exact cover solver of a single puzzle. The matrix is built
+    upon instantiation; the search is started by iterating over the generator
+    returned by the method iterSolutions(). Each instance is intended for a
+    single search.
+
+    Subclasses sudoku_py.core.solver_base.SolverBase.
+
+    Methods:
+        iterSolutions()
+            None -> generator(SudokuBoard)
+        solve(iMaxSolutions = 1)
+            /int OR None/ -> list(SudokuBoard)
+        countSolutions(iLimit = 2)
+            /int OR None/ -> int
+        solveLimited(iMaxSolutions = 1, objBudget = None)
+            /int OR None, SolveBudget OR None/ -> SolveResult
+
+    Attributes:
+        Name: str, read-only property, name of the engine
+        Puzzle: SudokuBoard, read-only property, the puzzle being solved
+        Stats: SolverStats OR None, read-only property, the attached
+            statistics collector
+    """
+
+    #class fields
+
+    _strName = 'dlx'
+
+    #special methods
+
+    def __init__(self, gPuzzle, objStats = None):
+        """
+        Builds the exact cover matrix of the puzzle.
+
+        Signature:
+            SudokuBoard OR str/, SolverStats OR None/ -> None
+
+        Args:
+            gPuzzle: SudokuBoard instance or string, the puzzle definition
+            objStats: (optional) sudoku_py.core.solver_stats.SolverStats
+                instance, the statistics collector, None (default) - no
+                statistics are collected
+
+        Raises:
+            TypeError: the argument is neither a board nor a string
+            ValueError: the string is not a proper puzzle definition
+        """
+        if objStats is not None:
+            gStart = objStats.Timer()
+        super(DLXSolver, self).__init__(gPuzzle, objStats)
+        objBoard = self._objBoard
+        iSize = objBoard.Size
+        iCells = objBoard.Cells
+        iBoxRows = objBoard.BoxRows
+        iBoxColumns = objBoard.BoxColumns
+        #constraint id -> column header index, 0 for the satisfied ones
+        ilstColumnOf = [0] * (4 * iCells)
+        iColumns = 0
+        ilstPlacements = []
+        for iCell in xrange(iCells):
+            iMask = objBoard.getCandidates(iCell)
+            if not objBoard.getValue(iCell):
+                iRow, iColumn = divmod(iCell, iSize)
+                iBox = ((iRow // iBoxRows) * iBoxRows
+                                                + iColumn // iBoxColumns)
+                for iDigit in xrange(iSize):
+                    if iMask & (1 << iDigit):
+                        ilstPlacements.append((iCell * iSize + iDigit, (iCell,
+                                        iCells + iRow * iSize + iDigit,
+                                        2 * iCells + iColumn * iSize + iDigit,
+                                        3 * iCells + iBox * iSize + iDigit)))
+        setUsed = set()
+        for _, tupConstraints in ilstPlacements:
+            setUsed.update(tupConstraints)
+        #the constraints not covered by any candidate - no solution possible
+        iRequired = 4 * iCells - 4 * objBoard.Filled
+        self._bFeasible = len(setUsed) == iRequired
+        for iConstraint in sorted(setUsed):
+            iColumns += 1
+            ilstColumnOf[iConstraint] = iColumns
+        iNodes = iColumns + 1 + 4 * len(ilstPlacements)
+        lstLeft = [0] * iNodes
+        lstRight = [0] * iNodes
+        lstUp = range(iNodes)
+        lstDown = range(iNodes)
+        lstHeader = [0] * iNodes
+        lstSize = [0] * (iColumns + 1)
+        ilstPlacementOf = [0] * iNodes
+        for iIndex in xrange(iColumns + 1):
+            lstLeft[iIndex] = iIndex - 1
+            lstRight[iIndex] = iIndex + 1
+            lstHeader[iIndex] = iIndex
+        lstLeft[0] = iColumns
+        lstRight[iColumns] = 0
+        iNode = iColumns + 1
+        for iPlacement, tupConstraints in ilstPlacements:
+            iFirst = iNode
+            for iConstraint in tupConstraints:
+                iHeader = ilstColumnOf[iConstraint]
+                lstHeader[iNode] = iHeader
+                ilstPlacementOf[iNode] = iPlacement
+                lstUp[iNode] = lstUp[iHeader]
+                lstDown[iNode] = iHeader
+                lstDown[lstUp[iHeader]] = iNode
+                lstUp[iHeader] = iNode
+                lstSize[iHeader] += 1
+                lstLeft[iNode] = iNode - 1
+                lstRight[iNode] = iNode + 1
+                iNode += 1
+            lstLeft[iFirst] = iNode - 1
+            lstRight[iNode - 1] = iFirst
+        self._tupLinks = (lstLeft, lstRight, lstUp, lstDown, lstHeader,
+                                                                    lstSize)
+        self._ilstPlacementOf = ilstPlacementOf
+        self._ilstChosen = []
+        if objStats is not None:
+            objStats.addTime(PHASE_SETUP, objStats.Timer() - gStart)
+
+    #helper methods
+
+    def _makeSolution(self):
+        """
+        Helper method to create a solved board from the currently chosen matrix
+        rows.
+
+        Signature:
+            None -> SudokuBoard
+        """
+        objSolution = self._objBoard.copy()
+        iSize = objSolution.Size
+        for iNode in self._ilstChosen:
+            iCell, iDigit = divmod(self._ilstPlacementOf[iNode], iSize)
+            objSolution.setValue(iCell, iDigit + 1)
+        return objSolution
+
+    def _makePartial(self):
+        """
+        Helper method to create a board from the currently chosen matrix rows
+        in the middle of the search.
+
+        Signature:
+            None -> SudokuBoard
+        """
+        return self._makeSolution()
+
+    def _countNode(self, objStats, iRowNode):
+        """
+        Helper method to register the just chosen matrix row as a visited node
+        of the search tree.
+
+        Signature:
+            SolverStats, int -> None
+        """
+        iCell, iDigit = divmod(self._ilstPlacementOf[iRowNode],
+                                                        self._objBoard.Size)
+        objStats.enterNode(len(self._ilstChosen), iCell, iDigit + 1)
+
+    def _search(self):
+        """
+        Helper generator method, which performs the search and yields each time
+        a solution is reached; the chosen matrix rows are kept in the 'private'
+        attribute _ilstChosen. The matrix is restored when the search is
+        finished or abandoned, thus the search can be repeated.
+
+        Signature:
+            None -> generator(None)
+        """
+        if not self._bFeasible:
+            return
+        lstLeft, lstRight, lstUp, lstDown, lstHeader, lstSize = self._tupLinks
+        tupArgs = self._tupLinks
+        ilstChosen = self._ilstChosen
+        objStats = self._objStats
+        bForward = True
+        try:
+            while True:
+                if bForward:
+                    if lstRight[0] == 0:
+                        yield None
+                        bForward = False
+                    else:
+                        #choose the column with the least number of rows
+                        iColumn = lstRight[0]
+                        iBest = iColumn
+                        iBestSize = lstSize[iColumn]
+                        while iColumn and iBestSize > 1:
+                            if lstSize[iColumn] < iBestSize:
+                                iBest = iColumn
+                                iBestSize = lstSize[iColumn]
+                            iColumn = lstRight[iColumn]
+                        if iBestSize:
+                            _Cover(iBest, *tupArgs)
+                            iRowNode = lstDown[iBest]
+                            ilstChosen.append(iRowNode)
+                            if objStats is not None:
+                                self._countNode(objStats, iRowNode)
+                            iNode = lstRight[iRowNode]
+                            while iNode != iRowNode:
+                                _Cover(lstHeader[iNode], *tupArgs)
+                                iNode = lstRight[iNode]
+                        else:
+                            if objStats is not None:
+                                objStats.Backtracks += 1
+                            bForward = False
+                else:
+                    if not ilstChosen:
+                        break
+                    iRowNode = ilstChosen.pop()
+                    iNode = lstLeft[iRowNode]
+                    while iNode != iRowNode:
+                        _Uncover(lstHeader[iNode], *tupArgs)
+                        iNode = lstLeft[iNode]
+                    iColumn = lstHeader[iRowNode]
+                    iRowNode = lstDown[iRowNode]
+                    if iRowNode == iColumn:
+                        _Uncover(iColumn, *tupArgs)
+                    else:
+                        ilstChosen.append(iRowNode)
+                        if objStats is not None:
+                            self._countNode(objStats, iRowNode)
+                        iNode = lstRight[iRowNode]
+                        while iNode != iRowNode:
+                            _Cover(lstHeader[iNode], *tupArgs)
+                            iNode = lstRight[iNode]
+                        bForward = True
+        finally:
+            #restore the matrix, if the search is abandoned at a solution
+            while ilstChosen:
+                iRowNode = ilstChosen.pop()
+                iNode = lstLeft[iRowNode]
+                while iNode != iRowNode:
+                    _Uncover(lstHeader[iNode], *tupArgs)
+                    iNode = lstLeft[iNode]
+                _Uncover(lstHeader[iRowNode], *tupArgs)
@@ -0,0 +1,378 @@
+#!/usr/bin/python
+"""
+Module sudoku_py.core.game
+
+Implements the model of an interactive game on a generic m x n sudoku board.
+
+Unlike the SudokuBoard the game board accepts the conflicting digits entered
+by the player and reports the conflicting cells. The state is updated
+incrementally per move (and per undo), instead of re-validating the whole
+grid:
+
+    *) per unit and digit - the positions of that digit within the unit as a
+        bitset and their count
+    *) per unit - the bitset of the present digits, thus the candidates of a
+        cell are three look-ups
+    *) per cell - the number of its units, where its digit is repeated; the
+        set of the conflicting cells is updated only when this number changes
+        from or to zero
+
+Thus a move touches the three units of the cell and only the cells, which
+enter or leave the conflicting state.
+
+Classes:
+    GameBoard
+"""
+
+__version__ = "0.0.1.0"
+__date__ = "16-10-2026"
+__status__ = "Development"
+
+__all__ = ['GameBoard']
+
+#imports
+
+#+ other modules from the package
+
+from sudoku_py.core.board import GetIndexTables, DigitToChar, ToBoard
+
+#classes
+
+class GameBoard(object):
+    """
+    Interactive game board with the incremental candidates and conflicts
+    tracking and the unlimited undo of the moves.
+
+    Methods:
+        move(iCell, iValue)
+            int, int -> None
+        undo()
+            None -> bool
+        getValue(iCell)
+            int -> int
+        isGiven(iCell)
+            int -> bool
+        getCandidates(iCell)
+            int -> int
+        isConflicting(iCell)
+            int -> bool
+        isSolved()
+            None -> bool
+
+    Attributes:
+        Puzzle: SudokuBoard, read-only property, the initial puzzle
+        Size: int, read-only property, size of the board N
+        Values: list(int), read-only property, copy of the cells' values
+        Conflicts: frozenset(int), read-only property, the conflicting cells
+        History: list(tuple(int, int, int)), read-only property, copy of the
+            moves as (cell, old value, new value) tuples
+    """
+
+    #special methods
+
+    def __init__(self, gPuzzle):
+        """
+        Initialization. The givens of the puzzle become the fixed cells.
+
+        Signature:
+            SudokuBoard OR str -> None
+
+        Args:
+            gPuzzle: SudokuBoard instance or string, the puzzle definition
+
+        Raises:
+            TypeError: the argument is neither a board nor a string
+            ValueError: the string is not a proper puzzle definition
+        """
+        objPuzzle = ToBoard(gPuzzle)
+        iSize = objPuzzle.Size
+        iCells = objPuzzle.Cells
+        arrRowOf, arrColumnOf, arrBoxOf, tupUnits, _ = GetIndexTables(
+                                    objPuzzle.BoxRows, objPuzzle.BoxColumns)
+        self._objPuzzle = objPuzzle.copy()
+        self._iSize = iSize
+        self._iFullMask = objPuzzle.FullMask
+        self._tupUnits = tupUnits
+        #per cell - the indexes of its 3 units and its positions within them
+        self._tuplstUnitsOf = tuple((arrRowOf[iCell],
+                                    iSize + arrColumnOf[iCell],
+                                    2 * iSize + arrBoxOf[iCell])
+                                                for iCell in xrange(iCells))
+        self._tuplstPositionsOf = tuple(tuple(tupUnits[iUnit].index(iCell)
+                                    for iUnit in self._tuplstUnitsOf[iCell])
+                                                for iCell in xrange(iCells))
+        self._ilstValues = [0] * iCells
+        self._iFilled = 0
+        self._ilstPlaces = [0] * (3 * iSize * iSize)
+        self._ilstCounts = [0] * (3 * iSize * iSize)
+        self._ilstMasks = [0] * (3 * iSize)
+        self._ilstConflicts = [0] * iCells
+        self._setConflicts = set()
+        self._lstHistory = []
+        for iCell, iValue in enumerate(objPuzzle.Values):
+            if iValue:
+                self._add(iCell, iValue)
+
+    def __str__(self):
+        """
+        Returns the grid as multiple lines of text with the boxes separated
+        and the conflicting cells marked by '*'.
+
+        Signature:
+            None -> str
+        """
+        objPuzzle = self._objPuzzle
+        iSize = self._iSize
+        iBoxRows = objPuzzle.BoxRows
+        iBoxColumns = objPuzzle.BoxColumns
+        strlstLines = []
+        strSeparator = '+'.join(['-' * (2 * iBoxColumns + 1)] * iBoxRows)
+        for iRow in xrange(iSize):
+            if iRow and not (iRow % iBoxRows):
+                strlstLines.append(strSeparator)
+            strLine = ''
+            for iColumn in xrange(iSize):
+                iCell = iRow * iSize + iColumn
+                if iColumn and not (iColumn % iBoxColumns):
+                    strLine += ' |'
+                if iCell in self._setConflicts:
+                    strMark = '*'
+                else:
+                    strMark = ' '
+                strLine += strMark + DigitToChar(self._ilstValues[iCell])
+            strlstLines.append(strLine + ' ')
+        return '\n'.join(strlstLines)
+
+    #helper methods
+
+    def _add(self, iCell, iValue):
+        """
+        Helper method to put a digit into an empty cell and to update the
+        units' state and the conflicts.
+
+        Signature:
+            int, int -> None
+        """
+        iSize = self._iSize
+        ilstPlaces = self._ilstPlaces
+        ilstCounts = self._ilstCounts
+        ilstConflicts = self._ilstConflicts
+        iDigit = iValue - 1
+        self._ilstValues[iCell] = iValue
+        self._iFilled += 1
+        for iUnit, iPosition in zip(self._tuplstUnitsOf[iCell],
+                                                self._tuplstPositionsOf[iCell]):
+            iIndex = iUnit * iSize + iDigit
+            iCount = ilstCounts[iIndex]
+            if not iCount:
+                self._ilstMasks[iUnit] |= 1 << iDigit
+            else:
+                if iCount == 1:
+                    iOther = self._tupUnits[iUnit][
+                                        ilstPlaces[iIndex].bit_length() - 1]
+                    ilstConflicts[iOther] += 1
+                    self._setConflicts.add(iOther)
+                ilstConflicts[iCell] += 1
+                self._setConflicts.add(iCell)
+            ilstPlaces[iIndex] |= 1 << iPosition
+            ilstCounts[iIndex] = iCount + 1
+
+    def _remove(self, iCell):
+        """
+        Helper method to clear a non-empty cell and to update the units' state
+        and the conflicts.
+
+        Signature:
+            int -> None
+        """
+        iSize = self._iSize
+        ilstPlaces = self._ilstPlaces
+        ilstCounts = self._ilstCounts
+        ilstConflicts = self._ilstConflicts
+        iDigit = self._ilstValues[iCell] - 1
+        self._ilstValues[iCell] = 0
+        self._iFilled -= 1
+        for iUnit, iPosition in zip(self._tuplstUnitsOf[iCell],
+                                                self._tuplstPositionsOf[iCell]):
+            iIndex = iUnit * iSize + iDigit
+            ilstPlaces[iIndex] &= ~(1 << iPosition)
+            iCount = ilstCounts[iIndex] - 1
+            ilstCounts[iIndex] = iCount
+            if not iCount:
+                self._ilstMasks[iUnit] &= ~(1 << iDigit)
+            else:
+                if iCount == 1:
+                    iOther = self._tupUnits[iUnit][
+                                        ilstPlaces[iIndex].bit_length() - 1]
+                    ilstConflicts[iOther] -= 1
+                    if not ilstConflicts[iOther]:
+                        self._setConflicts.discard(iOther)
+                ilstConflicts[iCell] -= 1
+        self._setConflicts.discard(iCell)
+
+    def _change(self, iCell, iValue):
+        """
+        Helper method to change the value of a cell (zero to clear it).
+
+        Signature:
+            int, int -> None
+        """
+        if self._ilstValues[iCell]:
+            self._remove(iCell)
+        if iValue:
+            self._add(iCell, iValue)
+
+    #public API
+
+    #properties
+
+    @property
+    def Puzzle(self):
+        """
+        Getter property for the initial puzzle.
+
+        Signature:
+            None -> SudokuBoard
+        """
+        return self._objPuzzle
+
+    @property
+    def Size(self):
+        """
+        Getter property for the size N of the board.
+
+        Signature:
+            None -> int
+        """
+        return self._iSize
+
+    @property
+    def Values(self):
+        """
+        Getter property for the copy of the values of all cells (row-major
+        order, zero for the empty cells).
+
+        Signature:
+            None -> list(int)
+        """
+        return self._ilstValues[:]
+
+    @property
+    def Conflicts(self):
+        """
+        Getter property for the conflicting cells, i.e. the cells with a digit
+        repeated in any of their units.
+
+        Signature:
+            None -> frozenset(int)
+        """
+        return frozenset(self._setConflicts)
+
+    @property
+    def History(self):
+        """
+        Getter property for the copy of the moves made (and not undone), as
+        (cell, old value, new value) tuples.
+
+        Signature:
+            None -> list(tuple(int, int, int))
+        """
+        return self._lstHistory[:]
+
+    #+ methods
+
+    def move(self, iCell, iValue):
+        """
+        Puts a digit into a cell or clears it. The conflicting digits are
+        accepted and reported via the Conflicts property.
+
+        Signature:
+            int, int -> None
+
+        Args:
+            iCell: non-negative integer, flat index of the cell
+            iValue: integer 0 to N, the digit to put, zero to clear the cell
+
+        Raises:
+            IndexError: the cell index is out of range
+            ValueError: the digit is out of range, or the cell is a given
+        """
+        if not (0 <= iCell < len(self._ilstValues)):
+            raise IndexError('Cell {} is out of range'.format(iCell))
+        if not (0 <= iValue <= self._iSize):
+            raise ValueError('Digit {} is out of range'.format(iValue))
+        if self._objPuzzle.getValue(iCell):
+            raise ValueError('Cell {} is a given'.format(iCell))
+        iOld = self._ilstValues[iCell]
+        if iOld != iValue:
+            self._change(iCell, iValue)
+            self._lstHistory.append((iCell, iOld, iValue))
+
+    def undo(self):
+        """
+        Reverts the last move.
+
+        Signature:
+            None -> bool
+
+        Returns:
+            bool: True if a move is reverted, False if there are no moves
+        """
+        if not self._lstHistory:
+            return False
+        iCell, iOld, _ = self._lstHistory.pop()
+        self._change(iCell, iOld)
+        return True
+
+    def getValue(self, iCell):
+        """
+        Returns the value of a cell, zero for an empty cell.
+
+        Signature:
+            int -> int
+        """
+        return self._ilstValues[iCell]
+
+    def isGiven(self, iCell):
+        """
+        Checks if a cell is a given of the puzzle.
+
+        Signature:
+            int -> bool
+        """
+        return bool(self._objPuzzle.getValue(iCell))
+
+    def getCandidates(self, iCell):
+        """
+        Returns the candidate digits of a cell as a bitset (bit k set means
+        digit k + 1 is not present in any of its units); zero for a non-empty
+        cell.
+
+        Signature:
+            int -> int
+        """
+        if self._ilstValues[iCell]:
+            return 0
+        ilstMasks = self._ilstMasks
+        iRow, iColumn, iBox = self._tuplstUnitsOf[iCell]
+        return ~(ilstMasks[iRow] | ilstMasks[iColumn]
+                                        | ilstMasks[iBox]) & self._iFullMask
+
+    def isConflicting(self, iCell):
+        """
+        Checks if the digit of a cell is repeated in any of its units.
+
+        Signature:
+            int -> bool
+        """
+        return bool(self._ilstConflicts[iCell])
+
+    def isSolved(self):
+        """
+        Checks if all cells are filled without conflicts.
+
+        Signature:
+            None -> bool
+        """
+        return (self._iFilled == len(self._ilstValues)
+                                                and not self._setConflicts)
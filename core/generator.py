@@ -0,0 +1,376 @@
+#!/usr/bin/python
+"""
+Module sudoku_py.core.generator
+
+Implements the generator of the uniquely solvable generic m x n sudoku puzzles
+by 'digging holes' into a randomly generated full grid.
+
+The clues are removed one at a time in a random order. After each removal the
+uniqueness is re-checked by searching for a solution, which differs from the
+known full grid in the just emptied cell. The checks are incremental:
+
+    *) a single solver is kept for the whole run, and its base state (the
+        candidates of each cell allowed by the current clues) is updated only
+        for the emptied cell and its peers instead of being re-built from the
+        whole board
+    *) each check starts from a copy of that base state with the known digit
+        excluded from the emptied cell, thus the search looks only for the
+        second solution
+    *) a clue, which could not be removed, is never re-checked, since removing
+        more clues can only add solutions
+
+Optionally, the generation is limited by a solve budget (see
+sudoku_py.core.solve_budget), which is attached to all searches as the
+statistics collector and is also checked before each attempt and each removal.
+
+Classes:
+    PuzzleGenerator
+
+Functions:
+    GeneratePuzzle()
+        /int, int, int OR None, type A, GridSource OR None, SolveBudget OR None/
+            -> tuple(SudokuBoard, SudokuBoard)
+"""
+
+__version__ = "0.0.1.0"
+__date__ = "17-10-2026"
+__status__ = "Development"
+
+__all__ = ['PuzzleGenerator', 'GeneratePuzzle']
+
+#imports
+
+#+ standard libraries
+
+import random
+
+#+ other modules from the package
+
+from sudoku_py.core.board import SudokuBoard
+
+from sudoku_py.core.propagation_solver import PropagationSolver
+
+#globals
+
+#+ attempts to complete a randomly seeded grid before giving up
+
+MAX_GRID_ATTEMPTS = 100
+
+#functions
+
+def GeneratePuzzle(iBoxRows = 3, iBoxColumns = 3, iMinClues = None,
+                            gSeed = None, objGrids = None, objBudget = None):
+    """
+    Generates a single uniquely solvable puzzle, see PuzzleGenerator.
+
+    Signature:
+        /int, int, int OR None, type A, GridSource OR None, SolveBudget OR None/
+            -> tuple(SudokuBoard, SudokuBoard)
+
+    Args:
+        iBoxRows: (optional) positive integer, number of rows in a box,
+            defaults to 3
+        iBoxColumns: (optional) positive integer, number of columns in a box,
+            defaults to 3
+        iMinClues: (optional) non-negative integer, the removal of the clues is
+            stopped when this number is reached; by default as many clues as
+            possible are removed
+        gSeed: (optional) any hashable type, seed of the random numbers
+            generator, by default - the system time / entropy
+        objGrids: (optional) sudoku_py.core.grid_source.GridSource instance
+            of the same box shape, the source of the full grids, by default
+            the grids are completed by the search
+        objBudget: (optional) sudoku_py.core.solve_budget.SolveBudget
+            instance, the limits of the generation, None (default) - unlimited
+
+    Returns:
+        tuple(SudokuBoard, SudokuBoard): the puzzle and its solution
+
+    Raises:
+        sudoku_py.core.solve_budget.BudgetExceeded: a limit of the budget is
+            reached
+    """
+    return PuzzleGenerator(iBoxRows, iBoxColumns, gSeed,
+                                    objGrids).generate(iMinClues, objBudget)
+
+#classes
+
+class _DiggingSolver(PropagationSolver):
+    """
+    Helper class - propagation solver bound to a full grid, which maintains the
+    base state of the candidates incrementally as the clues are removed and
+    restored, and which searches only for the solutions different from that
+    full grid in the specified cell.
+
+    Subclasses sudoku_py.core.propagation_solver.PropagationSolver.
+    """
+
+    #special methods
+
+    def __init__(self, objSolution, objStats = None):
+        """
+        Initializes the solver with all cells given.
+
+        Signature:
+            SudokuBoard/, SolverStats OR None/ -> None
+        """
+        self._iExcluded = -1
+        self._ilstBase = None
+        super(_DiggingSolver, self).__init__(objSolution.copy(), objStats)
+        self._ilstSolution = objSolution.Values
+        self._ilstBase = self._ilstCandidates[:]
+        self._ilstPreferred = self._ilstCandidates[:]
+        self._ilstBaseAssigned = self._ilstAssigned[:]
+
+    #helper methods
+
+    def _load(self):
+        """
+        Helper method to (re-) initialize the working state from the base state
+        and to exclude the known digit from the checked cell.
+
+        Signature:
+            None -> None
+        """
+        if self._ilstBase is None:
+            super(_DiggingSolver, self)._load()
+            return
+        ilstCandidates = self._ilstCandidates
+        ilstAssigned = self._ilstAssigned
+        ilstQueue = self._ilstQueue
+        ilstCandidates[:] = self._ilstBase
+        ilstAssigned[:] = self._ilstBaseAssigned
+        del self._ilstTrail[:]
+        del ilstQueue[:]
+        self._bDirty = False
+        iCell = self._iExcluded
+        if iCell >= 0:
+            ilstCandidates[iCell] &= ~(1 << (self._ilstSolution[iCell] - 1))
+        for iCell in xrange(self._iCells):
+            iMask = ilstCandidates[iCell]
+            if not (ilstAssigned[iCell] or (iMask & (iMask - 1))):
+                ilstQueue.append(iCell)
+
+    def _updateBase(self, iCell):
+        """
+        Helper method to re-calculate the base candidates of the empty cells
+        among the cell and its peers.
+
+        Signature:
+            int -> None
+        """
+        objBoard = self._objBoard
+        ilstBase = self._ilstBase
+        for iPeer in (iCell, ) + self._tupPeers[iCell]:
+            if not objBoard.getValue(iPeer):
+                ilstBase[iPeer] = objBoard.getCandidates(iPeer)
+
+    #public API
+
+    #+ methods
+
+    def removeClue(self, iCell):
+        """
+        Empties a cell.
+
+        Signature:
+            int -> None
+        """
+        self._objBoard.clearValue(iCell)
+        self._ilstBaseAssigned[iCell] = 0
+        self._updateBase(iCell)
+
+    def restoreClue(self, iCell):
+        """
+        Puts back the known digit into a cell.
+
+        Signature:
+            int -> None
+        """
+        iValue = self._ilstSolution[iCell]
+        self._objBoard.setValue(iCell, iValue)
+        self._ilstBase[iCell] = 1 << (iValue - 1)
+        self._ilstBaseAssigned[iCell] = 1
+        self._updateBase(iCell)
+
+    def hasOtherSolution(self, iCell):
+        """
+        Checks if the current puzzle has a solution with a digit other than the
+        known one in the specified cell.
+
+        Signature:
+            int -> bool
+        """
+        self._iExcluded = iCell
+        self._bDirty = True
+        try:
+            return self.countSolutions(1) > 0
+        finally:
+            self._iExcluded = -1
+
+class PuzzleGenerator(object):
+    """
+    Generator of the uniquely solvable puzzles of a specific box shape. The
+    full grids are generated by seeding the first row and some random cells
+    with random digits and completing the grid with the propagation solver;
+    then the clues are removed one at a time as long as the solution remains
+    unique. Alternatively, the full grids are taken from a grid source (see
+    sudoku_py.core.grid_source), which transforms them without the search.
+
+    Methods:
+        makeGrid(objBudget = None)
+            /SolveBudget OR None/ -> SudokuBoard
+        generate(iMinClues = None, objBudget = None)
+            /int OR None, SolveBudget OR None/
+                -> tuple(SudokuBoard, SudokuBoard)
+
+    Attributes:
+        BoxRows: int, read-only property, number of rows in a box
+        BoxColumns: int, read-only property, number of columns in a box
+    """
+
+    #special methods
+
+    def __init__(self, iBoxRows = 3, iBoxColumns = 3, gSeed = None,
+                                                            objGrids = None):
+        """
+        Initialization.
+
+        Signature:
+            /int, int, type A, GridSource OR None/ -> None
+
+        Args:
+            iBoxRows: (optional) positive integer, number of rows in a box,
+                defaults to 3
+            iBoxColumns: (optional) positive integer, number of columns in a
+                box, defaults to 3
+            gSeed: (optional) any hashable type, seed of the random numbers
+                generator, by default - the system time / entropy
+            objGrids: (optional) sudoku_py.core.grid_source.GridSource
+                instance of the same box shape, the source of the full grids,
+                by default the grids are completed by the search
+
+        Raises:
+            TypeError: any of the box dimensions is not an integer number
+            ValueError: any of the box dimensions is not positive, the board
+                is too large, or the grid source has another box shape
+        """
+        SudokuBoard(iBoxRows, iBoxColumns)
+        if not (objGrids is None or ((objGrids.BoxRows, objGrids.BoxColumns)
+                                                == (iBoxRows, iBoxColumns))):
+            raise ValueError('Grid source of another box shape')
+        self._iBoxRows = iBoxRows
+        self._iBoxColumns = iBoxColumns
+        self._objRandom = random.Random(gSeed)
+        self._objGrids = objGrids
+
+    #public API
+
+    #properties
+
+    @property
+    def BoxRows(self):
+        """
+        Getter property for the number of rows in a box.
+
+        Signature:
+            None -> int
+        """
+        return self._iBoxRows
+
+    @property
+    def BoxColumns(self):
+        """
+        Getter property for the number of columns in a box.
+
+        Signature:
+            None -> int
+        """
+        return self._iBoxColumns
+
+    #+ methods
+
+    def makeGrid(self, objBudget = None):
+        """
+        Generates a random full grid.
+
+        Signature:
+            /SolveBudget OR None/ -> SudokuBoard
+
+        Args:
+            objBudget: (optional) sudoku_py.core.solve_budget.SolveBudget
+                instance, the limits of the search, None (default) -
+                unlimited
+
+        Raises:
+            RuntimeError: failed to complete a randomly seeded grid
+            sudoku_py.core.solve_budget.BudgetExceeded: a limit of the budget
+                is reached
+        """
+        if self._objGrids is not None:
+            return self._objGrids.makeGrid()
+        objRandom = self._objRandom
+        iSize = self._iBoxRows * self._iBoxColumns
+        for _ in xrange(MAX_GRID_ATTEMPTS):
+            if objBudget is not None:
+                objBudget.check()
+            objBoard = SudokuBoard(self._iBoxRows, self._iBoxColumns)
+            ilstDigits = range(1, iSize + 1)
+            objRandom.shuffle(ilstDigits)
+            for iColumn, iValue in enumerate(ilstDigits):
+                objBoard.setValue(iColumn, iValue)
+            for iCell in objRandom.sample(xrange(iSize, objBoard.Cells),
+                                            min(iSize, objBoard.Cells - iSize)):
+                iMask = objBoard.getCandidates(iCell)
+                if iMask:
+                    ilstValues = [iDigit + 1 for iDigit in xrange(iSize)
+                                                    if iMask & (1 << iDigit)]
+                    objBoard.setValue(iCell, objRandom.choice(ilstValues))
+            lstSolutions = PropagationSolver(objBoard, objBudget).solve(1)
+            if lstSolutions:
+                return lstSolutions[0]
+        raise RuntimeError('Failed to generate a {} x {} grid'.format(
+                                            self._iBoxRows, self._iBoxColumns))
+
+    def generate(self, iMinClues = None, objBudget = None):
+        """
+        Generates a uniquely solvable puzzle.
+
+        Signature:
+            /int OR None, SolveBudget OR None/
+                -> tuple(SudokuBoard, SudokuBoard)
+
+        Args:
+            iMinClues: (optional) non-negative integer, the removal of the clues
+                is stopped when this number is reached; by default as many
+                clues as possible are removed
+            objBudget: (optional) sudoku_py.core.solve_budget.SolveBudget
+                instance, the limits of the generation, None (default) -
+                unlimited
+
+        Returns:
+            tuple(SudokuBoard, SudokuBoard): the puzzle and its solution
+
+        Raises:
+            RuntimeError: failed to complete a randomly seeded grid
+            sudoku_py.core.solve_budget.BudgetExceeded: a limit of the budget
+                is reached
+        """
+        objSolution = self.makeGrid(objBudget)
+        objChecker = _DiggingSolver(objSolution, objBudget)
+        iClues = objSolution.Cells
+        if iMinClues is None:
+            iMinClues = 0
+        ilstCells = range(iClues)
+        self._objRandom.shuffle(ilstCells)
+        for iCell in ilstCells:
+            if iClues <= iMinClues:
+                break
+            if objBudget is not None:
+                objBudget.check()
+            objChecker.removeClue(iCell)
+            if objChecker.hasOtherSolution(iCell):
+                objChecker.restoreClue(iCell)
+            else:
+                iClues -= 1
+        return objChecker.Puzzle.copy(), objSolution
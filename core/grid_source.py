@@ -0,0 +1,351 @@
+#!/usr/bin/python
+"""
+Module sudoku_py.core.grid_source
+
+Implements the fast source of the random full grids of a generic m x n sudoku
+without any search. A valid base grid is transformed by the randomly chosen
+validity preserving transformations (see also sudoku_py.core.canonical):
+
+    *) permutation of the bands (horizontal rows of boxes) and of the rows
+        within each band
+    *) permutation of the stacks (vertical columns of boxes) and of the
+        columns within each stack
+    *) relabeling of the digits
+    *) transposition - only for the square boxes (m = n), since otherwise the
+        box shape would change
+
+The initial base grid is the pattern, in which each row is the cyclic shift of
+the previous one, see BasePattern(). All grids transformed from the same base
+belong to its equivalence class, thus, optionally, the base is periodically
+replaced by a grid completed by the search (see PuzzleGenerator.makeGrid()),
+which mixes the other classes in at a small fraction of the search cost.
+
+The grids are produced as strings of N * N characters (see SudokuBoard.
+toString()), since building a board costs more than the transformation
+itself.
+
+Classes:
+    GridSource
+
+Functions:
+    BasePattern()
+        /int, int/ -> SudokuBoard
+"""
+
+__version__ = "0.0.1.0"
+__date__ = "17-10-2026"
+__status__ = "Development"
+
+__all__ = ['GridSource', 'BasePattern']
+
+#imports
+
+#+ standard libraries
+
+import itertools
+import operator
+import random
+import string
+
+#+ other modules from the package
+
+from sudoku_py.core.board import SudokuBoard, DigitToChar
+
+from sudoku_py.core.generator import PuzzleGenerator
+
+#globals
+
+#+ the permutations of up to this number of items are chosen from a table
+#+ instead of shuffling
+
+MAX_TABLE_ITEMS = 5
+
+#functions
+
+def _GetPermutations(iItems):
+    """
+    Helper function to create the table of all permutations of the items or
+    None, if there are too many of them.
+
+    Signature:
+        int -> list(tuple(int)) OR None
+    """
+    if iItems > MAX_TABLE_ITEMS:
+        return None
+    return list(itertools.permutations(xrange(iItems)))
+
+def _PatternString(iBoxRows, iBoxColumns):
+    """
+    Helper function to create the base pattern as a string.
+
+    Signature:
+        int, int -> str
+    """
+    iSize = iBoxRows * iBoxColumns
+    return ''.join(DigitToChar((iBoxColumns * (iRow % iBoxRows)
+                                + iRow // iBoxRows + iColumn) % iSize + 1)
+                    for iRow in xrange(iSize) for iColumn in xrange(iSize))
+
+def BasePattern(iBoxRows = 3, iBoxColumns = 3):
+    """
+    Creates the base pattern full grid: the row r = i * m + j (j < m) is the
+    first row cyclically shifted by j * n + i positions.
+
+    Signature:
+        /int, int/ -> SudokuBoard
+
+    Args:
+        iBoxRows: (optional) positive integer, number of rows in a box,
+            defaults to 3
+        iBoxColumns: (optional) positive integer, number of columns in a box,
+            defaults to 3
+
+    Returns:
+        SudokuBoard: the base pattern
+
+    Raises:
+        TypeError: any of the box dimensions is not an integer number
+        ValueError: any of the box dimensions is not positive, or the board is
+            too large
+    """
+    SudokuBoard(iBoxRows, iBoxColumns)
+    return SudokuBoard.fromString(_PatternString(iBoxRows, iBoxColumns),
+                                                        iBoxRows, iBoxColumns)
+
+#classes
+
+class GridSource(object):
+    """
+    Seedable source of the random full grids of a specific box shape, see the
+    module's documentation.
+
+    Methods:
+        makeString()
+            None -> str
+        makeGrid()
+            None -> SudokuBoard
+        iterStrings(iCount = None)
+            /int OR None/ -> generator(str)
+
+    Attributes:
+        BoxRows: int, read-only property, number of rows in a box
+        BoxColumns: int, read-only property, number of columns in a box
+        SearchEvery: int OR None, read-only property, period of the
+            replacement of the base grid by a searched grid
+    """
+
+    #special methods
+
+    def __init__(self, iBoxRows = 3, iBoxColumns = 3, gSeed = None,
+                                                        iSearchEvery = None):
+        """
+        Initialization.
+
+        Signature:
+            /int, int, type A, int OR None/ -> None
+
+        Args:
+            iBoxRows: (optional) positive integer, number of rows in a box,
+                defaults to 3
+            iBoxColumns: (optional) positive integer, number of columns in a
+                box, defaults to 3
+            gSeed: (optional) any hashable type, seed of the random numbers
+                generator, by default - the system time / entropy
+            iSearchEvery: (optional) positive integer or None, the base grid
+                is replaced by a grid completed by the search before the first
+                and then after each iSearchEvery grids; None (default) - the
+                base pattern is always used
+
+        Raises:
+            TypeError: any of the box dimensions or the period is not an
+                integer number
+            ValueError: any of the box dimensions or the period is not
+                positive, or the board is too large
+        """
+        SudokuBoard(iBoxRows, iBoxColumns)
+        if not (iSearchEvery is None or isinstance(iSearchEvery, (int, long))):
+            raise TypeError('Not an integer period of the search')
+        if not (iSearchEvery is None) and iSearchEvery < 1:
+            raise ValueError('Not positive period of the search')
+        self._iBoxRows = iBoxRows
+        self._iBoxColumns = iBoxColumns
+        self._iSearchEvery = iSearchEvery
+        self._objRandom = random.Random(gSeed)
+        iSize = iBoxRows * iBoxColumns
+        self._strDigits = ''.join(DigitToChar(iValue)
+                                            for iValue in xrange(1, iSize + 1))
+        if iSearchEvery is None:
+            self._objSearcher = None
+        else:
+            self._objSearcher = PuzzleGenerator(iBoxRows, iBoxColumns,
+                                            self._objRandom.getrandbits(64))
+        self._iCountdown = 0
+        self._tuplstRowPerms = _GetPermutations(iBoxRows)
+        self._tuplstColumnPerms = _GetPermutations(iBoxColumns)
+        self._setBase(_PatternString(iBoxRows, iBoxColumns))
+
+    #helper methods
+
+    def _setBase(self, strGrid):
+        """
+        Helper method to replace the base grid, which is kept as a list of the
+        row strings (and of the column strings for the square boxes).
+
+        Signature:
+            str -> None
+        """
+        iSize = len(self._strDigits)
+        strlstRows = [strGrid[iStart : iStart + iSize]
+                                for iStart in xrange(0, iSize * iSize, iSize)]
+        self._strlstlstBases = [strlstRows]
+        if self._iBoxRows == self._iBoxColumns:
+            self._strlstlstBases.append([''.join(strRow[iColumn]
+                                                    for strRow in strlstRows)
+                                                for iColumn in xrange(iSize)])
+
+    def _permuteLines(self, iGroups, iLines, tuplstGroupPerms,
+                                                            tuplstLinePerms):
+        """
+        Helper method to make a random permutation of the lines (rows or
+        columns), which keeps the groups (bands or stacks) together. The
+        permutation tables (if any) of the groups and of the lines within a
+        group are used instead of shuffling.
+
+        Signature:
+            int, int, list(tuple(int)) OR None, list(tuple(int)) OR None
+                -> list(int)
+        """
+        objRandom = self._objRandom
+        if tuplstGroupPerms is None:
+            ilstGroups = range(iGroups)
+            objRandom.shuffle(ilstGroups)
+        else:
+            ilstGroups = objRandom.choice(tuplstGroupPerms)
+        ilstResult = []
+        if tuplstLinePerms is None:
+            ilstLines = range(iLines)
+            for iGroup in ilstGroups:
+                objRandom.shuffle(ilstLines)
+                iStart = iGroup * iLines
+                ilstResult.extend(iStart + iLine for iLine in ilstLines)
+        else:
+            funChoice = objRandom.choice
+            for iGroup in ilstGroups:
+                iStart = iGroup * iLines
+                ilstResult.extend(iStart + iLine
+                                        for iLine in funChoice(tuplstLinePerms))
+        return ilstResult
+
+    #public API
+
+    #properties
+
+    @property
+    def BoxRows(self):
+        """
+        Getter property for the number of rows in a box.
+
+        Signature:
+            None -> int
+        """
+        return self._iBoxRows
+
+    @property
+    def BoxColumns(self):
+        """
+        Getter property for the number of columns in a box.
+
+        Signature:
+            None -> int
+        """
+        return self._iBoxColumns
+
+    @property
+    def SearchEvery(self):
+        """
+        Getter property for the period of the replacement of the base grid.
+
+        Signature:
+            None -> int OR None
+        """
+        return self._iSearchEvery
+
+    #+ methods
+
+    def makeString(self):
+        """
+        Generates a random full grid as a string.
+
+        Signature:
+            None -> str
+
+        Raises:
+            RuntimeError: failed to complete a randomly seeded grid (only with
+                the periodic search)
+        """
+        if self._objSearcher is not None:
+            if not self._iCountdown:
+                self._setBase(self._objSearcher.makeGrid().toString())
+                self._iCountdown = self._iSearchEvery
+            self._iCountdown -= 1
+        objRandom = self._objRandom
+        iBoxRows = self._iBoxRows
+        iBoxColumns = self._iBoxColumns
+        strlstlstBases = self._strlstlstBases
+        if len(strlstlstBases) > 1:
+            strlstRows = strlstlstBases[objRandom.getrandbits(1)]
+        else:
+            strlstRows = strlstlstBases[0]
+        #n bands of m rows each, m stacks of n columns each
+        tuplstRowPerms = self._tuplstRowPerms
+        tuplstColumnPerms = self._tuplstColumnPerms
+        ilstRows = self._permuteLines(iBoxColumns, iBoxRows, tuplstColumnPerms,
+                                                                tuplstRowPerms)
+        funColumns = operator.itemgetter(*self._permuteLines(iBoxRows,
+                                iBoxColumns, tuplstRowPerms, tuplstColumnPerms))
+        strDigits = self._strDigits
+        lstDigits = list(strDigits)
+        objRandom.shuffle(lstDigits)
+        strTable = string.maketrans(strDigits, ''.join(lstDigits))
+        return ''.join([''.join(funColumns(strlstRows[iRow]))
+                                    for iRow in ilstRows]).translate(strTable)
+
+    def makeGrid(self):
+        """
+        Generates a random full grid.
+
+        Signature:
+            None -> SudokuBoard
+
+        Raises:
+            RuntimeError: failed to complete a randomly seeded grid (only with
+                the periodic search)
+        """
+        return SudokuBoard.fromString(self.makeString(), self._iBoxRows,
+                                                            self._iBoxColumns)
+
+    def iterStrings(self, iCount = None):
+        """
+        Generator method, which yields the random full grids as strings.
+
+        Signature:
+            /int OR None/ -> generator(str)
+
+        Args:
+            iCount: (optional) non-negative integer or None, number of the
+                grids, None (default) means an endless stream
+
+        Yields:
+            str: a random full grid
+
+        Raises:
+            RuntimeError: failed to complete a randomly seeded grid (only with
+                the periodic search)
+        """
+        funMake = self.makeString
+        if iCount is None:
+            while True:
+                yield funMake()
+        else:
+            for _ in xrange(iCount):
+                yield funMake()
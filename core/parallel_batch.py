@@ -0,0 +1,294 @@
+#!/usr/bin/python
+"""
+Module sudoku_py.core.parallel_batch
+
+Implements the multiprocess version of the streaming batch solver, see the
+module sudoku_py.core.batch_solver. The puzzles are read lazily, grouped into
+chunks and spread over a pool of worker processes. The number of the chunks in
+flight is bounded, thus the memory consumption remains flat regardless of the
+size of the input.
+
+Two output modes are supported:
+    *) ordered - the results are yielded in the same order as the puzzles are
+        read (a slow chunk holds back the chunks solved after it)
+    *) unordered - the results are yielded as soon as their chunks are solved
+
+The worker processes ignore Ctrl+C, which is meant for the main process; the
+main process waits for the results with a timeout, thus it can be interrupted,
+and checks the health of the workers meanwhile - the pool does not report
+the chunk lost with a dead (e.g. killed) worker.
+
+Functions:
+    SolveParallel()
+        iterable(tuple(int, str))/, int OR None, bool, int, str, int OR None,
+            int OR None/ -> generator(BatchResult)
+    SolveFileParallel()
+        file/, int OR None, bool, int, str, int OR None, int OR None/
+            -> generator(BatchResult)
+"""
+
+__version__ = "0.0.1.0"
+__date__ = "17-10-2026"
+__status__ = "Development"
+
+__all__ = ['SolveParallel', 'SolveFileParallel']
+
+#imports
+
+#+ standard libraries
+
+import collections
+import itertools
+import multiprocessing
+import Queue
+import signal
+import traceback
+
+#+ other modules from the package
+
+from sudoku_py.core.solvers import DEF_ENGINE, GetEngine
+
+from sudoku_py.core.batch_solver import ReadPuzzles, SolvePuzzles
+
+#globals
+
+DEF_CHUNK_SIZE = 256
+
+#+ number of the chunks in flight per worker process
+
+CHUNKS_PER_PROCESS = 4
+
+#+ period of the checks of the workers' health by the main process, seconds -
+#+ also, the blocking wait cannot be interrupted by Ctrl+C
+
+POLL_PERIOD = 0.5
+
+#functions
+
+def _InitWorker():
+    """
+    Helper function executed at the start of a worker process. Ignores
+    Ctrl+C, which is meant for the main process.
+
+    Signature:
+        None -> None
+    """
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+def _SolveChunk(lstChunk, strEngine, iBoxRows, iBoxColumns):
+    """
+    Helper function executed in a worker process. Solves all puzzles of a
+    chunk. The exceptions are caught and returned as the formatted traceback,
+    since the pool does not report the failed tasks to the result callbacks.
+
+    Signature:
+        list(tuple(int, str)), str, int OR None, int OR None
+            -> tuple(list(BatchResult) OR None, str OR None)
+    """
+    try:
+        return list(SolvePuzzles(lstChunk, strEngine, iBoxRows,
+                                                        iBoxColumns)), None
+    except Exception:
+        return None, traceback.format_exc()
+
+def _IterChunks(iterPuzzles, iChunkSize):
+    """
+    Helper generator function, which groups the source items into lists.
+
+    Signature:
+        iterable(type A), int -> generator(list(type A))
+    """
+    iterSource = iter(iterPuzzles)
+    while True:
+        lstChunk = list(itertools.islice(iterSource, iChunkSize))
+        if not lstChunk:
+            break
+        yield lstChunk
+
+def _Unpack(tupResult):
+    """
+    Helper function to extract the results of a chunk or to re-raise the
+    exception occurred in the worker process.
+
+    Signature:
+        tuple(list(BatchResult) OR None, str OR None) -> list(BatchResult)
+
+    Raises:
+        RuntimeError: the chunk has failed in the worker process
+    """
+    lstResults, strError = tupResult
+    if lstResults is None:
+        raise RuntimeError('Worker process failed:\n{}'.format(strError))
+    return lstResults
+
+def _CheckWorkers(setWorkers):
+    """
+    Helper function to check, that none of the initial worker processes of
+    the pool has exited - the pool replaces a dead worker, but its chunk is
+    lost.
+
+    Signature:
+        set(int) -> None
+
+    Raises:
+        RuntimeError: a worker process has exited
+    """
+    setAlive = set(objProcess.pid
+                            for objProcess in multiprocessing.active_children())
+    if not setWorkers <= setAlive:
+        raise RuntimeError('Worker process has exited')
+
+def _WaitResult(objResult, setWorkers):
+    """
+    Helper function to wait for the results of a chunk submitted to the pool,
+    checking the health of the workers periodically.
+
+    Signature:
+        multiprocessing.pool.AsyncResult, set(int) -> list(BatchResult)
+
+    Raises:
+        RuntimeError: the chunk has failed, or a worker process has exited
+    """
+    while True:
+        try:
+            return _Unpack(objResult.get(POLL_PERIOD))
+        except multiprocessing.TimeoutError:
+            _CheckWorkers(setWorkers)
+
+def _WaitDone(objDone, setWorkers):
+    """
+    Helper function to wait for the results of any chunk submitted to the
+    pool, checking the health of the workers periodically.
+
+    Signature:
+        Queue.Queue, set(int) -> list(BatchResult)
+
+    Raises:
+        RuntimeError: the chunk has failed, or a worker process has exited
+    """
+    while True:
+        try:
+            return _Unpack(objDone.get(True, POLL_PERIOD))
+        except Queue.Empty:
+            _CheckWorkers(setWorkers)
+
+def SolveParallel(iterPuzzles, iProcesses = None, bOrdered = True,
+                    iChunkSize = DEF_CHUNK_SIZE, strEngine = DEF_ENGINE,
+                                        iBoxRows = None, iBoxColumns = None):
+    """
+    Generator function, which solves the puzzles in a pool of the worker
+    processes.
+
+    Signature:
+        iterable(tuple(int, str))/, int OR None, bool, int, str, int OR None,
+            int OR None/ -> generator(BatchResult)
+
+    Args:
+        iterPuzzles: iterable of pairs (line number, puzzle string), e.g. as
+            generated by sudoku_py.core.batch_solver.ReadPuzzles()
+        iProcesses: (optional) positive integer, number of the worker
+            processes, defaults to the number of the CPUs
+        bOrdered: (optional) boolean, if True (default) the results are yielded
+            in the input order, otherwise - as they are completed
+        iChunkSize: (optional) positive integer, number of the puzzles sent to
+            a worker process at once, defaults to DEF_CHUNK_SIZE
+        strEngine: (optional) string, name of the solver engine, defaults to
+            sudoku_py.core.solvers.DEF_ENGINE
+        iBoxRows: (optional) positive integer, number of rows in a box, the
+            default shape is derived from the puzzle length if not specified
+        iBoxColumns: (optional) positive integer, number of columns in a box,
+            the default shape is derived from the puzzle length if not
+            specified
+
+    Yields:
+        BatchResult: result of solving a single puzzle
+
+    Raises:
+        ValueError: unknown engine name, or not positive number of processes
+            or chunk size
+        RuntimeError: a chunk has failed in a worker process, or a worker
+            process has exited
+    """
+    GetEngine(strEngine)
+    if iProcesses is None:
+        iProcesses = multiprocessing.cpu_count()
+    if iProcesses < 1:
+        raise ValueError('Not positive number of processes')
+    if iChunkSize < 1:
+        raise ValueError('Not positive chunk size')
+    iWindow = iProcesses * CHUNKS_PER_PROCESS
+    tupArgs = (strEngine, iBoxRows, iBoxColumns)
+    setOthers = set(objProcess.pid
+                            for objProcess in multiprocessing.active_children())
+    objPool = multiprocessing.Pool(iProcesses, _InitWorker)
+    try:
+        setWorkers = set(objProcess.pid for objProcess
+                            in multiprocessing.active_children()) - setOthers
+        if bOrdered:
+            deqPending = collections.deque()
+            for lstChunk in _IterChunks(iterPuzzles, iChunkSize):
+                deqPending.append(objPool.apply_async(_SolveChunk,
+                                                        (lstChunk, ) + tupArgs))
+                while len(deqPending) >= iWindow:
+                    for objResult in _WaitResult(deqPending.popleft(),
+                                                                setWorkers):
+                        yield objResult
+            while deqPending:
+                for objResult in _WaitResult(deqPending.popleft(),
+                                                                setWorkers):
+                    yield objResult
+        else:
+            objDone = Queue.Queue()
+            iInFlight = 0
+            for lstChunk in _IterChunks(iterPuzzles, iChunkSize):
+                objPool.apply_async(_SolveChunk, (lstChunk, ) + tupArgs,
+                                                    callback = objDone.put)
+                iInFlight += 1
+                while iInFlight >= iWindow or not objDone.empty():
+                    for objResult in _WaitDone(objDone, setWorkers):
+                        yield objResult
+                    iInFlight -= 1
+            while iInFlight:
+                for objResult in _WaitDone(objDone, setWorkers):
+                    yield objResult
+                iInFlight -= 1
+        objPool.close()
+    finally:
+        objPool.terminate()
+        objPool.join()
+
+def SolveFileParallel(fFile, iProcesses = None, bOrdered = True,
+                    iChunkSize = DEF_CHUNK_SIZE, strEngine = DEF_ENGINE,
+                                        iBoxRows = None, iBoxColumns = None):
+    """
+    Generator function, which lazily reads the puzzles from a file object and
+    solves them in a pool of the worker processes, see SolveParallel().
+
+    Signature:
+        file/, int OR None, bool, int, str, int OR None, int OR None/
+            -> generator(BatchResult)
+
+    Args:
+        fFile: file-like object, any iterable over the text lines
+        iProcesses: (optional) positive integer, number of the worker
+            processes, defaults to the number of the CPUs
+        bOrdered: (optional) boolean, if True (default) the results are yielded
+            in the input order, otherwise - as they are completed
+        iChunkSize: (optional) positive integer, number of the puzzles sent to
+            a worker process at once, defaults to DEF_CHUNK_SIZE
+        strEngine: (optional) string, name of the solver engine, defaults to
+            sudoku_py.core.solvers.DEF_ENGINE
+        iBoxRows: (optional) positive integer, number of rows in a box
+        iBoxColumns: (optional) positive integer, number of columns in a box
+
+    Yields:
+        BatchResult: result of solving a single puzzle
+
+    Raises:
+        ValueError: unknown engine name, or not positive number of processes
+            or chunk size
+        RuntimeError: a chunk has failed in a worker process, or a worker
+            process has exited
+    """
+    return SolveParallel(ReadPuzzles(fFile), iProcesses, bOrdered, iChunkSize,
+                                        strEngine, iBoxRows, iBoxColumns)
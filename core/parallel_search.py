@@ -0,0 +1,384 @@
+#!/usr/bin/python
+"""
+Module sudoku_py.core.parallel_search
+
+Implements the parallel search of a single (hard, large) puzzle in a group of
+the worker processes, see also sudoku_py.core.parallel_batch for the parallel
+solving of many puzzles.
+
+The search tree of the puzzle is split at the shallow branch points into the
+disjoint sub-trees (sub-puzzles): first the main process expands the tree in
+the breadth-first order (see PropagationSolver.branch()) until there are
+enough sub-trees for all workers, then the workers search them with the
+engine suitable for the board size (see sudoku_py.core.solvers.PickEngine()),
+or with the specified one. With the propagation engine, when a worker is idle
+and there is no queued work, the busy workers give away the untried branches
+of their shallowest open branch points (see PropagationSolver.split()), thus
+the idle workers 'steal' the remaining large sub-trees. The workers check the
+shared state every CHECK_EVERY nodes, using the statistics collector
+interface (see sudoku_py.core.solver_stats).
+
+The CDCL engine (the default for the large boards) cannot give away its work,
+thus only the initial sub-trees are spread over the workers, and each worker
+builds its own SAT encoding and learns its own clauses. The parallel search
+pays off only for the puzzles, which are hard for a single CDCL solve; the
+typical 25 x 25 puzzles are solved by it in a fraction of a second, which the
+start of the workers and the repeated encoding alone exceed - use the
+sequential solve (see sudoku_py.core.solvers) for them.
+
+The main process is the broker: it queues the given away sub-trees, counts
+the sub-trees in progress and collects the solutions. As soon as the requested
+number of the solutions is found (e.g. two in the uniqueness mode), the
+search is cancelled in all workers.
+
+Functions:
+    SearchParallel()
+        SudokuBoard OR str/, int OR None, int OR None, str OR None/
+            -> list(SudokuBoard)
+    CountSolutionsParallel()
+        SudokuBoard OR str/, int OR None, int OR None, str OR None/ -> int
+"""
+
+__version__ = "0.0.1.0"
+__date__ = "17-10-2026"
+__status__ = "Development"
+
+__all__ = ['SearchParallel', 'CountSolutionsParallel']
+
+#imports
+
+#+ standard libraries
+
+import collections
+import multiprocessing
+import Queue
+import traceback
+
+#+ other modules from the package
+
+from sudoku_py.core.board import SudokuBoard, ToBoard
+
+from sudoku_py.core.propagation_solver import PropagationSolver
+
+from sudoku_py.core.solvers import GetEngine, PickEngine
+
+from sudoku_py.core.solver_stats import SolverStats
+
+from sudoku_py.core.solve_budget import STATUS_CANCELLED, BudgetExceeded
+
+#globals
+
+#+ period (in nodes) of the checks of the cancellation and the idle workers
+
+CHECK_EVERY = 256
+
+#+ number of the sub-trees per worker process created by the initial expansion
+
+SUBTREES_PER_PROCESS = 4
+
+#+ period of the checks of the workers' health by the main process, seconds
+
+POLL_PERIOD = 0.5
+
+#+ the longest wait for a worker process to exit, seconds
+
+JOIN_TIMEOUT = 1.0
+
+MSG_SOLUTION = 0
+
+MSG_SPLIT = 1
+
+MSG_DONE = 2
+
+MSG_ERROR = 3
+
+#classes
+
+class _StealMonitor(SolverStats):
+    """
+    Statistics collector of a worker process, which cancels the search, when
+    the shared event is set, and gives away the work, when there are idle
+    workers and no queued work.
+    """
+
+    #special methods
+
+    def __init__(self, objStop, objHunger, objResults):
+        """
+        Initialization. The work is not given away until the splitter is set.
+
+        Signature:
+            multiprocessing.Event, multiprocessing.Value, multiprocessing.Queue
+                -> None
+        """
+        super(_StealMonitor, self).__init__()
+        self._objStop = objStop
+        self._objHunger = objHunger
+        self._objResults = objResults
+        self._funSplit = None
+
+    #public API
+
+    def setSplitter(self, funSplit):
+        """
+        Sets the function detaching the work from the running search.
+
+        Signature:
+            callable() -> list(SudokuBoard) -> None
+        """
+        self._funSplit = funSplit
+
+    def enterNode(self, iDepth, iCell, iDigit):
+        """
+        Registers a visited node and periodically checks the shared state.
+
+        Signature:
+            int, int, int -> None
+
+        Raises:
+            BudgetExceeded: the search is cancelled
+        """
+        super(_StealMonitor, self).enterNode(iDepth, iCell, iDigit)
+        if not (self.Nodes % CHECK_EVERY):
+            if self._objStop.is_set():
+                raise BudgetExceeded(STATUS_CANCELLED)
+            objHunger = self._objHunger
+            if objHunger.value > 0 and self._funSplit is not None:
+                lstPuzzles = self._funSplit()
+                if lstPuzzles:
+                    #the queued work is counted at once, thus the other busy
+                    #workers do not give away their work for the same demand
+                    with objHunger.get_lock():
+                        objHunger.value -= len(lstPuzzles)
+                    self._objResults.put((MSG_SPLIT, [objPuzzle.toString()
+                                                for objPuzzle in lstPuzzles]))
+
+#functions
+
+def _Worker(objTasks, objResults, objStop, objHunger, iBoxRows, iBoxColumns,
+                                                iLimit, bBoards, strEngine):
+    """
+    Helper function executed in a worker process. Searches the queued
+    sub-trees one by one with the engine until the None sentinel is received;
+    reports the solutions, the given away sub-trees (only the propagation
+    engine gives its work away) and the end of each sub-tree.
+
+    Signature:
+        multiprocessing.Queue, multiprocessing.Queue, multiprocessing.Event,
+            multiprocessing.Value, int, int, int OR None, bool, str -> None
+    """
+    clsEngine = GetEngine(strEngine)
+    try:
+        while True:
+            with objHunger.get_lock():
+                objHunger.value += 1
+            strPuzzle = objTasks.get()
+            if strPuzzle is None:
+                break
+            objMonitor = _StealMonitor(objStop, objHunger, objResults)
+            if not objStop.is_set():
+                objSolver = clsEngine(SudokuBoard.fromString(strPuzzle,
+                                        iBoxRows, iBoxColumns), objMonitor)
+                if isinstance(objSolver, PropagationSolver):
+                    objMonitor.setSplitter(objSolver.split)
+                iCount = 0
+                try:
+                    for objSolution in objSolver.iterSolutions():
+                        if bBoards:
+                            objResults.put((MSG_SOLUTION,
+                                                    objSolution.toString()))
+                        else:
+                            objResults.put((MSG_SOLUTION, None))
+                        iCount += 1
+                        if iCount == iLimit:
+                            break
+                except BudgetExceeded:
+                    pass
+            objResults.put((MSG_DONE, objMonitor.Nodes))
+    except Exception:
+        objResults.put((MSG_ERROR, traceback.format_exc()))
+
+def _Expand(objBoard, iTarget, iLimit):
+    """
+    Helper function to split the puzzle into the sub-puzzles in the
+    breadth-first order until the target number of them is reached. The
+    sub-puzzles solved by the propagation alone are returned separately.
+
+    Signature:
+        SudokuBoard, int, int OR None -> tuple(list(SudokuBoard),
+            list(SudokuBoard))
+    """
+    deqPuzzles = collections.deque([objBoard])
+    lstSolutions = []
+    objSolver = PropagationSolver(objBoard)
+    while deqPuzzles and len(deqPuzzles) < iTarget:
+        if iLimit is not None and len(lstSolutions) >= iLimit:
+            break
+        objSolver.reset(deqPuzzles.popleft())
+        lstPuzzles = objSolver.branch()
+        if len(lstPuzzles) == 1:
+            lstSolutions.append(lstPuzzles[0])
+        else:
+            deqPuzzles.extend(lstPuzzles)
+    return list(deqPuzzles), lstSolutions
+
+def _Search(gPuzzle, iLimit, iProcesses, bBoards, strEngine):
+    """
+    Helper function, which performs the parallel search.
+
+    Signature:
+        SudokuBoard OR str, int OR None, int OR None, bool, str OR None
+            -> tuple(int, list(str))
+
+    Returns:
+        tuple(int, list(str)): the number of the solutions found and the
+            solutions (if requested), both not exceeding the limit
+
+    Raises:
+        TypeError: the puzzle is neither a board nor a string, or the limit
+            is not an integer or None
+        ValueError: the puzzle string is malformed, the limit is not positive,
+            the number of the processes is not positive, or the engine is
+            unknown
+        RuntimeError: a worker process has failed
+    """
+    if not (iLimit is None or isinstance(iLimit, (int, long))):
+        raise TypeError('Not an integer limit of solutions')
+    if not (iLimit is None) and iLimit < 1:
+        raise ValueError('Not positive limit of solutions')
+    objBoard = ToBoard(gPuzzle)
+    if strEngine is None:
+        strEngine = PickEngine(objBoard.Size)
+    GetEngine(strEngine)
+    if iProcesses is None:
+        iProcesses = multiprocessing.cpu_count()
+    if iProcesses < 1:
+        raise ValueError('Not positive number of processes')
+    lstPuzzles, lstSolved = _Expand(objBoard,
+                                    iProcesses * SUBTREES_PER_PROCESS, iLimit)
+    strlstSolutions = [objSolution.toString() for objSolution in lstSolved]
+    iCount = len(strlstSolutions)
+    if iLimit is not None and iCount >= iLimit:
+        return iLimit, strlstSolutions[:iLimit]
+    if not lstPuzzles:
+        return iCount, strlstSolutions
+    objTasks = multiprocessing.Queue()
+    objResults = multiprocessing.Queue()
+    objStop = multiprocessing.Event()
+    #idle workers minus the queued sub-trees
+    objHunger = multiprocessing.Value('i', -len(lstPuzzles))
+    for objPuzzle in lstPuzzles:
+        objTasks.put(objPuzzle.toString())
+    lstWorkers = [multiprocessing.Process(target = _Worker,
+                    args = (objTasks, objResults, objStop, objHunger,
+                            objBoard.BoxRows, objBoard.BoxColumns, iLimit,
+                                                        bBoards, strEngine))
+                                                for _ in xrange(iProcesses)]
+    for objWorker in lstWorkers:
+        objWorker.daemon = True
+        objWorker.start()
+    iPending = len(lstPuzzles)
+    try:
+        while iPending and (iLimit is None or iCount < iLimit):
+            try:
+                iKind, gData = objResults.get(True, POLL_PERIOD)
+            except Queue.Empty:
+                if not all(objWorker.is_alive() for objWorker in lstWorkers):
+                    raise RuntimeError('Worker process has exited')
+                continue
+            if iKind == MSG_SOLUTION:
+                iCount += 1
+                if bBoards:
+                    strlstSolutions.append(gData)
+            elif iKind == MSG_SPLIT:
+                iPending += len(gData)
+                for strPuzzle in gData:
+                    objTasks.put(strPuzzle)
+            elif iKind == MSG_DONE:
+                iPending -= 1
+            else:
+                raise RuntimeError('Worker process failed:\n{}'.format(gData))
+    finally:
+        objStop.set()
+        objTasks.cancel_join_thread()
+        for _ in lstWorkers:
+            objTasks.put(None)
+        for objWorker in lstWorkers:
+            objWorker.join(JOIN_TIMEOUT)
+            if objWorker.is_alive():
+                objWorker.terminate()
+                objWorker.join()
+    return iCount, strlstSolutions
+
+def SearchParallel(gPuzzle, iMaxSolutions = 1, iProcesses = None,
+                                                            strEngine = None):
+    """
+    Finds up to the requested number of solutions of a single puzzle in a
+    group of the worker processes, see the module's documentation. The order
+    of the solutions is not defined.
+
+    Signature:
+        SudokuBoard OR str/, int OR None, int OR None, str OR None/
+            -> list(SudokuBoard)
+
+    Args:
+        gPuzzle: SudokuBoard instance or string, the puzzle definition
+        iMaxSolutions: (optional) positive integer or None, the maximum number
+            of solutions to find, None means all solutions; defaults to 1
+        iProcesses: (optional) positive integer, number of the worker
+            processes, defaults to the number of the CPUs
+        strEngine: (optional) string, name of the engine searching the
+            sub-trees, by default it is picked by the board size, see
+            sudoku_py.core.solvers.PickEngine()
+
+    Returns:
+        list(SudokuBoard): found solutions, empty list if there are none
+
+    Raises:
+        TypeError: the puzzle is neither a board nor a string, or the maximum
+            number of solutions is not an integer or None
+        ValueError: the puzzle string is malformed, the maximum number of
+            solutions or the number of the processes is not positive, or the
+            engine is unknown
+        RuntimeError: a worker process has failed
+    """
+    objBoard = ToBoard(gPuzzle)
+    _, strlstSolutions = _Search(objBoard, iMaxSolutions, iProcesses, True,
+                                                                    strEngine)
+    return [SudokuBoard.fromString(strSolution, objBoard.BoxRows,
+                                                        objBoard.BoxColumns)
+                                            for strSolution in strlstSolutions]
+
+def CountSolutionsParallel(gPuzzle, iLimit = 2, iProcesses = None,
+                                                            strEngine = None):
+    """
+    Counts the solutions of a single puzzle in a group of the worker
+    processes, stopping as soon as the limit is reached. With the default
+    limit (the uniqueness mode) the result is 0, 1 or 2 (more than one
+    solution).
+
+    Signature:
+        SudokuBoard OR str/, int OR None, int OR None, str OR None/ -> int
+
+    Args:
+        gPuzzle: SudokuBoard instance or string, the puzzle definition
+        iLimit: (optional) positive integer or None, the maximum number of
+            solutions to count, None means all solutions; defaults to 2
+        iProcesses: (optional) positive integer, number of the worker
+            processes, defaults to the number of the CPUs
+        strEngine: (optional) string, name of the engine searching the
+            sub-trees, by default it is picked by the board size, see
+            sudoku_py.core.solvers.PickEngine()
+
+    Returns:
+        int: number of the found solutions, not exceeding the limit
+
+    Raises:
+        TypeError: the puzzle is neither a board nor a string, or the limit is
+            not an integer or None
+        ValueError: the puzzle string is malformed, the limit or the number of
+            the processes is not positive, or the engine is unknown
+        RuntimeError: a worker process has failed
+    """
+    iCount, _ = _Search(gPuzzle, iLimit, iProcesses, False, strEngine)
+    return iCount
@@ -0,0 +1,585 @@
+#!/usr/bin/python
+"""
+Module sudoku_py.core.propagation_solver
+
+Implements the constraint propagation solver of the generic m x n sudoku
+puzzles.
+
+The candidates of each cell are kept as integer bitsets. After each placement
+the naked singles (cells with a single candidate) and the hidden singles
+(digits with a single possible cell in a unit) are propagated until a fixpoint
+or a contradiction is reached. The search branches on the cell with the fewest
+candidates (MRV heuristic).
+
+Instead of copying the state at each branch point all changes of the
+candidates are recorded on a trail stack, and a backtrack simply rolls the
+trail back to the mark stored at the branch point. Thus the search loop does
+not allocate new state objects.
+
+The running search can give away the untried digits of its shallowest open
+branch point as the separate sub-puzzles (see split()), e.g. to another
+process, which makes the parallel search of a single puzzle possible.
+
+Classes:
+    PropagationSolver
+
+Functions:
+    Solve()
+        SudokuBoard OR str/, int OR None/ -> list(SudokuBoard)
+"""
+
+__version__ = "0.0.1.0"
+__date__ = "16-10-2026"
+__status__ = "Development"
+
+__all__ = ['PropagationSolver', 'Solve']
+
+#imports
+
+#+ other modules from the package
+
+from sudoku_py.core.board import GetIndexTables, ToBoard
+
+from sudoku_py.core.solver_base import SolverBase
+
+from sudoku_py.core.solver_stats import PHASE_SETUP, PHASE_PROPAGATION
+
+#globals
+
+#+ bitset size up to which the population count is looked up in a table
+
+POPCOUNT_TABLE_BITS = 16
+
+_ilstPopCount = [0] * (1 << POPCOUNT_TABLE_BITS)
+
+for iMask in xrange(1, 1 << POPCOUNT_TABLE_BITS):
+    _ilstPopCount[iMask] = _ilstPopCount[iMask >> 1] + (iMask & 1)
+
+del iMask
+
+#functions
+
+def _PopCount(iMask):
+    """
+    Helper function to count the set bits of a large bitset.
+
+    Signature:
+        int -> int
+    """
+    return bin(iMask).count('1')
+
+def Solve(gPuzzle, iMaxSolutions = 1):
+    """
+    Finds up to the requested number of solutions of a puzzle.
+
+    Signature:
+        SudokuBoard OR str/, int OR None/ -> list(SudokuBoard)
+
+    Args:
+        gPuzzle: SudokuBoard instance or string, the puzzle definition
+        iMaxSolutions: (optional) positive integer or None, the maximum number
+            of solutions to find, None means all solutions; defaults to 1
+
+    Returns:
+        list(SudokuBoard): found solutions, empty list if there are none
+
+    Raises:
+        TypeError: the puzzle is neither a board nor a string, or the maximum
+            number of solutions is not an integer or None
+        ValueError: the puzzle string is malformed, or the maximum number of
+            solutions is not positive
+    """
+    return PropagationSolver(gPuzzle).solve(iMaxSolutions)
+
+#classes
+
+class PropagationSolver(SolverBase):
+    """
+    Constraint propagation solver of a single puzzle with the MRV branching and
+    the trail based undo. The search is started by iterating over the generator
+    returned by the method iterSolutions(). An instance is intended for a
+    single search, but it can be re-loaded with another puzzle of the same
+    shape by the method reset(), which re-uses the allocated state.
+
+    Subclasses sudoku_py.core.solver_base.SolverBase.
+
+    Methods:
+        iterSolutions()
+            None -> generator(SudokuBoard)
+        solve(iMaxSolutions = 1)
+            /int OR None/ -> list(SudokuBoard)
+        countSolutions(iLimit = 2)
+            /int OR None/ -> int
+        solveLimited(iMaxSolutions = 1, objBudget = None)
+            /int OR None, SolveBudget OR None/ -> SolveResult
+        reduce()
+            None -> SudokuBoard OR None
+        branch()
+            None -> list(SudokuBoard)
+        split()
+            None -> list(SudokuBoard)
+        reset(gPuzzle)
+            SudokuBoard OR str -> None
+
+    Attributes:
+        Name: str, read-only property, name of the engine
+        Puzzle: SudokuBoard, read-only property, the puzzle being solved
+        Stats: SolverStats OR None, read-only property, the attached
+            statistics collector
+    """
+
+    #class fields
+
+    _strName = 'propagation'
+
+    #special methods
+
+    def __init__(self, gPuzzle, objStats = None):
+        """
+        Prepares the candidates of all cells and the queue of the singles.
+
+        Signature:
+            SudokuBoard OR str/, SolverStats OR None/ -> None
+
+        Args:
+            gPuzzle: SudokuBoard instance or string, the puzzle definition
+            objStats: (optional) sudoku_py.core.solver_stats.SolverStats
+                instance, the statistics collector, None (default) - no
+                statistics are collected
+
+        Raises:
+            TypeError: the argument is neither a board nor a string
+            ValueError: the string is not a proper puzzle definition
+        """
+        if objStats is not None:
+            gStart = objStats.Timer()
+        super(PropagationSolver, self).__init__(gPuzzle, objStats)
+        objBoard = self._objBoard
+        iCells = objBoard.Cells
+        _, _, _, self._tupUnits, self._tupPeers = GetIndexTables(
+                                        objBoard.BoxRows, objBoard.BoxColumns)
+        self._iCells = iCells
+        self._iFullMask = objBoard.FullMask
+        if objBoard.Size <= POPCOUNT_TABLE_BITS:
+            self._funPopCount = _ilstPopCount.__getitem__
+        else:
+            self._funPopCount = _PopCount
+        self._ilstCandidates = [0] * iCells
+        self._ilstAssigned = [0] * iCells
+        self._ilstTrail = []
+        self._ilstQueue = []
+        #per cell bitset of the digit to try first at a branch point, if any
+        self._ilstPreferred = None
+        self._ilstBranchCells = []
+        self._ilstBranchMasks = []
+        self._ilstBranchBits = []
+        self._load()
+        if objStats is not None:
+            objStats.addTime(PHASE_SETUP, objStats.Timer() - gStart)
+
+    #helper methods
+
+    def _load(self):
+        """
+        Helper method to (re-) initialize the candidates of all cells and the
+        queue of the singles from the stored puzzle board in the already
+        allocated lists.
+
+        Signature:
+            None -> None
+        """
+        objBoard = self._objBoard
+        ilstCandidates = self._ilstCandidates
+        ilstAssigned = self._ilstAssigned
+        ilstQueue = self._ilstQueue
+        del self._ilstTrail[:]
+        del ilstQueue[:]
+        self._bDirty = False
+        for iCell, iValue in enumerate(objBoard.Values):
+            if iValue:
+                ilstCandidates[iCell] = 1 << (iValue - 1)
+                ilstAssigned[iCell] = 1
+            else:
+                iMask = objBoard.getCandidates(iCell)
+                ilstCandidates[iCell] = iMask
+                ilstAssigned[iCell] = 0
+                if not (iMask & (iMask - 1)):
+                    ilstQueue.append(iCell)
+
+    def _assign(self, iCell, iBit):
+        """
+        Helper method to place a digit into a cell and to remove it from the
+        candidates of all peers. The peers left with a single candidate are
+        added to the queue.
+
+        Signature:
+            int, int -> bool
+
+        Args:
+            iCell: non-negative integer, flat index of the cell
+            iBit: integer, bitset of the single digit to place
+
+        Returns:
+            bool: False if a contradiction is found, True otherwise
+        """
+        ilstCandidates = self._ilstCandidates
+        ilstTrail = self._ilstTrail
+        ilstQueue = self._ilstQueue
+        ilstTrail.append(iCell + self._iCells)
+        ilstTrail.append(0)
+        self._ilstAssigned[iCell] = 1
+        iMask = ilstCandidates[iCell]
+        if iMask != iBit:
+            ilstTrail.append(iCell)
+            ilstTrail.append(iMask)
+            ilstCandidates[iCell] = iBit
+        for iPeer in self._tupPeers[iCell]:
+            iMask = ilstCandidates[iPeer]
+            if iMask & iBit:
+                ilstTrail.append(iPeer)
+                ilstTrail.append(iMask)
+                iMask ^= iBit
+                ilstCandidates[iPeer] = iMask
+                if not iMask:
+                    return False
+                if not (iMask & (iMask - 1)):
+                    ilstQueue.append(iPeer)
+        return True
+
+    def _propagate(self):
+        """
+        Helper method to propagate the naked and hidden singles until a
+        fixpoint or a contradiction is reached.
+
+        Signature:
+            None -> bool
+
+        Returns:
+            bool: False if a contradiction is found, True otherwise
+        """
+        ilstCandidates = self._ilstCandidates
+        ilstAssigned = self._ilstAssigned
+        ilstQueue = self._ilstQueue
+        iFullMask = self._iFullMask
+        while True:
+            while ilstQueue:
+                iCell = ilstQueue.pop()
+                if not ilstAssigned[iCell]:
+                    if not self._assign(iCell, ilstCandidates[iCell]):
+                        return False
+            bChanged = False
+            for tupUnit in self._tupUnits:
+                iOnce = 0
+                iTwice = 0
+                for iCell in tupUnit:
+                    iMask = ilstCandidates[iCell]
+                    iTwice |= iOnce & iMask
+                    iOnce |= iMask
+                if iOnce != iFullMask:
+                    return False
+                iHidden = iOnce & ~iTwice
+                if iHidden:
+                    for iCell in tupUnit:
+                        iMask = ilstCandidates[iCell] & iHidden
+                        if iMask and not ilstAssigned[iCell]:
+                            if iMask & (iMask - 1):
+                                return False
+                            if not self._assign(iCell, iMask):
+                                return False
+                            bChanged = True
+            if not (bChanged or ilstQueue):
+                return True
+
+    def _tryCounted(self, objStats, iCell, iBit):
+        """
+        Helper method to place a digit (unless the cell index is negative) and
+        to propagate the singles, counting and timing the propagation.
+
+        Signature:
+            SolverStats, int, int -> bool
+
+        Returns:
+            bool: False if a contradiction is found, True otherwise
+        """
+        gStart = objStats.Timer()
+        bResult = ((iCell < 0 or self._assign(iCell, iBit))
+                                                        and self._propagate())
+        objStats.addTime(PHASE_PROPAGATION, objStats.Timer() - gStart)
+        objStats.Propagations += 1
+        return bResult
+
+    def _undo(self, iMark):
+        """
+        Helper method to roll back the trail to the specified length.
+
+        Signature:
+            int -> None
+
+        Args:
+            iMark: non-negative integer, the length of the trail to restore
+        """
+        ilstTrail = self._ilstTrail
+        ilstCandidates = self._ilstCandidates
+        ilstAssigned = self._ilstAssigned
+        iCells = self._iCells
+        while len(ilstTrail) > iMark:
+            iOld = ilstTrail.pop()
+            iIndex = ilstTrail.pop()
+            if iIndex < iCells:
+                ilstCandidates[iIndex] = iOld
+            else:
+                ilstAssigned[iIndex - iCells] = iOld
+
+    def _pickCell(self):
+        """
+        Helper method to select the unassigned cell with the fewest candidates.
+        The ties are broken in favour of the cell with the most assigned peers,
+        which keeps the search away from the heavy-tailed behaviour of the
+        plain row-major tie breaking on sparse puzzles.
+
+        Signature:
+            None -> int
+
+        Returns:
+            int: flat index of the cell, or -1 if all cells are assigned
+        """
+        ilstCandidates = self._ilstCandidates
+        ilstAssigned = self._ilstAssigned
+        tupPeers = self._tupPeers
+        funPopCount = self._funPopCount
+        iBest = -1
+        iBestCount = self._iFullMask.bit_length() + 1
+        iBestDegree = -1
+        for iCell in xrange(self._iCells):
+            if not ilstAssigned[iCell]:
+                iCount = funPopCount(ilstCandidates[iCell])
+                if iCount < iBestCount:
+                    iBestCount = iCount
+                    iBestDegree = -1
+                if iCount == iBestCount:
+                    iDegree = 0
+                    for iPeer in tupPeers[iCell]:
+                        iDegree += ilstAssigned[iPeer]
+                    if iDegree > iBestDegree:
+                        iBest = iCell
+                        iBestDegree = iDegree
+        return iBest
+
+    def _makeSolution(self):
+        """
+        Helper method to create a solved board from the current state.
+
+        Signature:
+            None -> SudokuBoard
+        """
+        objSolution = self._objBoard.copy()
+        for iCell, iMask in enumerate(self._ilstCandidates):
+            if not objSolution.getValue(iCell):
+                objSolution.setValue(iCell, iMask.bit_length())
+        return objSolution
+
+    def _makePartial(self):
+        """
+        Helper method to create a board from the current state with only the
+        assigned cells filled.
+
+        Signature:
+            None -> SudokuBoard
+        """
+        objResult = self._objBoard.copy()
+        ilstAssigned = self._ilstAssigned
+        for iCell, iMask in enumerate(self._ilstCandidates):
+            if ilstAssigned[iCell] and not objResult.getValue(iCell):
+                objResult.setValue(iCell, iMask.bit_length())
+        return objResult
+
+    def _search(self):
+        """
+        Helper generator method, which performs the search and yields each time
+        a solution is reached, i.e. the candidates' state holds the solution.
+        The state left by a previous (possibly abandoned) search is re-loaded
+        from the puzzle first.
+
+        Signature:
+            None -> generator(None)
+        """
+        if self._bDirty:
+            self._load()
+        self._bDirty = True
+        objStats = self._objStats
+        if objStats is None:
+            if not self._propagate():
+                return
+        elif not self._tryCounted(objStats, -1, 0):
+            return
+        ilstCandidates = self._ilstCandidates
+        ilstTrail = self._ilstTrail
+        ilstQueue = self._ilstQueue
+        ilstPreferred = self._ilstPreferred
+        #the open branch points: cell, untried digits, trail mark and the
+        #digit being tried; kept as attributes for split()
+        ilstCells = self._ilstBranchCells = []
+        ilstMasks = self._ilstBranchMasks = []
+        ilstMarks = []
+        ilstBits = self._ilstBranchBits = []
+        while True:
+            iCell = self._pickCell()
+            if iCell < 0:
+                yield None
+            else:
+                ilstCells.append(iCell)
+                ilstMasks.append(ilstCandidates[iCell])
+                ilstMarks.append(len(ilstTrail))
+                ilstBits.append(0)
+            #try the next untried digit at the deepest open branch point
+            while ilstCells:
+                self._undo(ilstMarks[-1])
+                iMask = ilstMasks[-1]
+                if not iMask:
+                    ilstCells.pop()
+                    ilstMasks.pop()
+                    ilstMarks.pop()
+                    ilstBits.pop()
+                    continue
+                iBit = iMask & -iMask
+                if ilstPreferred is not None:
+                    iPreferred = ilstPreferred[ilstCells[-1]] & iMask
+                    if iPreferred:
+                        iBit = iPreferred
+                ilstMasks[-1] = iMask ^ iBit
+                ilstBits[-1] = iBit
+                del ilstQueue[:]
+                if objStats is None:
+                    if self._assign(ilstCells[-1], iBit) and self._propagate():
+                        break
+                else:
+                    objStats.enterNode(len(ilstCells), ilstCells[-1],
+                                                            iBit.bit_length())
+                    if self._tryCounted(objStats, ilstCells[-1], iBit):
+                        break
+                    objStats.Backtracks += 1
+            else:
+                break
+
+    #public API
+
+    #+ methods
+
+    def reduce(self):
+        """
+        Propagates the naked and hidden singles from the puzzle without any
+        branching.
+
+        Signature:
+            None -> SudokuBoard OR None
+
+        Returns:
+            SudokuBoard: copy of the puzzle with the singles placed, or None if
+                a contradiction is found
+        """
+        if self._bDirty:
+            self._load()
+        self._bDirty = True
+        if self._objStats is None:
+            bResult = self._propagate()
+        else:
+            bResult = self._tryCounted(self._objStats, -1, 0)
+        if not bResult:
+            return None
+        return self._makePartial()
+
+    def branch(self):
+        """
+        Propagates the naked and hidden singles from the puzzle and splits it
+        at the cell with the fewest candidates into the sub-puzzles - one per
+        candidate, without any search. The sub-puzzles partition the solutions
+        of the puzzle.
+
+        Signature:
+            None -> list(SudokuBoard)
+
+        Returns:
+            list(SudokuBoard): the sub-puzzles, a single solved board if the
+                puzzle is solved by the propagation, or an empty list if a
+                contradiction is found
+        """
+        objReduced = self.reduce()
+        if objReduced is None:
+            return []
+        iCell = self._pickCell()
+        if iCell < 0:
+            return [objReduced]
+        lstPuzzles = []
+        iMask = self._ilstCandidates[iCell]
+        while iMask:
+            iBit = iMask & -iMask
+            iMask ^= iBit
+            objPuzzle = objReduced.copy()
+            objPuzzle.setValue(iCell, iBit.bit_length())
+            lstPuzzles.append(objPuzzle)
+        return lstPuzzles
+
+    def split(self):
+        """
+        Detaches the untried digits at the shallowest open branch point of the
+        running search as the separate sub-puzzles, which the search will not
+        visit anymore. Intended to be called from the statistics collector
+        during the search, e.g. to share the work with another solver.
+
+        Signature:
+            None -> list(SudokuBoard)
+
+        Returns:
+            list(SudokuBoard): the detached sub-puzzles, empty list if there
+                are no untried digits left
+        """
+        ilstMasks = self._ilstBranchMasks
+        for iLevel, iMask in enumerate(ilstMasks):
+            if iMask:
+                break
+        else:
+            return []
+        ilstCells = self._ilstBranchCells
+        ilstBits = self._ilstBranchBits
+        objBase = self._objBoard.copy()
+        for iIndex in xrange(iLevel):
+            objBase.setValue(ilstCells[iIndex], ilstBits[iIndex].bit_length())
+        ilstMasks[iLevel] = 0
+        lstPuzzles = []
+        while iMask:
+            iBit = iMask & -iMask
+            iMask ^= iBit
+            objPuzzle = objBase.copy()
+            objPuzzle.setValue(ilstCells[iLevel], iBit.bit_length())
+            lstPuzzles.append(objPuzzle)
+        return lstPuzzles
+
+    def reset(self, gPuzzle):
+        """
+        Re-loads the solver with another puzzle of the same box shape, re-using
+        the already allocated state. Any search started before is invalidated.
+
+        Signature:
+            SudokuBoard OR str -> None
+
+        Args:
+            gPuzzle: SudokuBoard instance or string, the puzzle definition
+
+        Raises:
+            TypeError: the argument is neither a board nor a string
+            ValueError: the string is not a proper puzzle definition, or the
+                box shape of the puzzle is different
+        """
+        objBoard = ToBoard(gPuzzle)
+        if (objBoard.BoxRows != self._objBoard.BoxRows
+                            or objBoard.BoxColumns != self._objBoard.BoxColumns):
+            raise ValueError('Puzzle box shape {} x {} is not {} x {}'.format(
+                            objBoard.BoxRows, objBoard.BoxColumns,
+                            self._objBoard.BoxRows, self._objBoard.BoxColumns))
+        objStats = self._objStats
+        if objStats is not None:
+            gStart = objStats.Timer()
+        self._objBoard = objBoard
+        self._load()
+        if objStats is not None:
+            objStats.addTime(PHASE_SETUP, objStats.Timer() - gStart)
@@ -0,0 +1,301 @@
+#!/usr/bin/python
+"""
+Module sudoku_py.core.puzzle_factory
+
+Implements the bulk generation of the uniquely solvable puzzles of a target
+difficulty in a pool of the worker processes.
+
+The batch consists of the numbered slots. A worker fills a slot by generating
+the puzzles (see sudoku_py.core.generator) and rating them (see
+sudoku_py.core.rating) until one falls into the requested band of the
+difficulty levels, or until MAX_ATTEMPTS puzzles are rejected. The seed of
+each attempt is derived from the batch seed, the slot number and the attempt
+number, thus the content of a slot does not depend on the worker process
+filling it, nor on the number of the processes.
+
+The slots are written into a text file as soon as they are completed (in the
+order of completion), one per line: the puzzle, its rating, its level and the
+slot number, separated by tabs; an unfilled slot is recorded as a comment
+line. The first line of the file is a comment with the parameters of the
+batch. Thus the file can be read by sudoku_py.core.batch_solver.ReadPuzzles(),
+and an interrupted batch is resumed by re-running it with the same file - the
+recorded slots are not generated again.
+
+Functions:
+    ReadHeader()
+        str -> dict(str -> str) OR None
+    RunFactory()
+        str, int/, int, int, str OR None, str OR None, type A, int OR None,
+            int OR None, int, callable OR None/ -> dict(str -> int OR float)
+"""
+
+__version__ = "0.0.1.0"
+__date__ = "17-10-2026"
+__status__ = "Development"
+
+__all__ = ['MAX_ATTEMPTS', 'ReadHeader', 'RunFactory']
+
+#imports
+
+#+ standard libraries
+
+import os
+import random
+import multiprocessing
+import timeit
+import traceback
+
+#+ other modules from the package
+
+from sudoku_py.core.board import SudokuBoard
+
+from sudoku_py.core.generator import GeneratePuzzle
+
+from sudoku_py.core.rating import LEVELS, RatePuzzle
+
+#globals
+
+#+ rejected puzzles per slot before it is given up
+
+MAX_ATTEMPTS = 100
+
+#+ period of the waits for the results, seconds - the blocking wait cannot be
+#+ interrupted by Ctrl+C
+
+POLL_PERIOD = 0.25
+
+HEADER_PREFIX = '# sudoku_py puzzle factory'
+
+SKIPPED_PREFIX = '# skipped'
+
+_strlstLevels = [strLevel for strLevel, _ in LEVELS]
+
+#functions
+
+def _FillSlot(tupArgs):
+    """
+    Helper function executed in a worker process. Generates and rates the
+    puzzles until one falls into the band of the levels. The exceptions are
+    caught and returned as the formatted traceback.
+
+    Signature:
+        tuple(int, str, int, int, int OR None, set(str), int)
+            -> tuple(int, str OR None, float OR None, str OR None, int,
+                str OR None)
+
+    Returns:
+        tuple(int, str OR None, float OR None, str OR None, int, str OR None):
+            the slot number, the puzzle, its rating and level (all None, if
+            the slot is not filled), the number of the attempts and the error
+            traceback (None on success)
+    """
+    (iSlot, strSeed, iBoxRows, iBoxColumns, iMinClues, setLevels,
+                                                    iMaxAttempts) = tupArgs
+    try:
+        for iAttempt in xrange(iMaxAttempts):
+            objPuzzle, _ = GeneratePuzzle(iBoxRows, iBoxColumns, iMinClues,
+                                '{}:{}:{}'.format(strSeed, iSlot, iAttempt))
+            objRating = RatePuzzle(objPuzzle)
+            if objRating.Level in setLevels:
+                return (iSlot, objPuzzle.toString(), objRating.Rating,
+                                        objRating.Level, iAttempt + 1, None)
+        return iSlot, None, None, None, iMaxAttempts, None
+    except Exception:
+        return iSlot, None, None, None, 0, traceback.format_exc()
+
+def _MakeHeader(dictParameters):
+    """
+    Helper function to format the header line of the output file.
+
+    Signature:
+        dict(str -> str) -> str
+    """
+    return '{} {}\n'.format(HEADER_PREFIX, ' '.join('{}={}'.format(strKey,
+                dictParameters[strKey]) for strKey in sorted(dictParameters)))
+
+def _ReadSlots(strPath):
+    """
+    Helper function to read the recorded slot numbers from an existing output
+    file. An incomplete last line (the batch was killed while writing it) is
+    cut off.
+
+    Signature:
+        str -> set(int)
+    """
+    setSlots = set()
+    iComplete = 0
+    with open(strPath, 'rb+') as fFile:
+        for strLine in fFile:
+            if not strLine.endswith('\n'):
+                break
+            iComplete += len(strLine)
+            if strLine.startswith(SKIPPED_PREFIX) or not strLine.startswith(
+                                                                        '#'):
+                strlstTokens = strLine.split()
+                if strlstTokens:
+                    setSlots.add(int(strlstTokens[-1]))
+        fFile.truncate(iComplete)
+    return setSlots
+
+def ReadHeader(strPath):
+    """
+    Reads the parameters of a batch from the header of its output file.
+
+    Signature:
+        str -> dict(str -> str) OR None
+
+    Args:
+        strPath: string, path to the output file
+
+    Returns:
+        dict(str -> str): the parameters 'shape', 'seed', 'levels' and
+            'clues' as strings
+        None: the file does not exist, or it is not an output file of a batch
+
+    Raises:
+        IOError: the file cannot be read
+    """
+    if not os.path.isfile(strPath):
+        return None
+    with open(strPath, 'rb') as fFile:
+        strLine = fFile.readline()
+    if not (strLine.startswith(HEADER_PREFIX) and strLine.endswith('\n')):
+        return None
+    return dict(strItem.split('=', 1)
+                        for strItem in strLine[len(HEADER_PREFIX):].split())
+
+def RunFactory(strPath, iCount, iBoxRows = 3, iBoxColumns = 3,
+                strMinLevel = None, strMaxLevel = None, gSeed = None,
+                iMinClues = None, iProcesses = None,
+                iMaxAttempts = MAX_ATTEMPTS, funProgress = None):
+    """
+    Fills the slots 0 to iCount - 1 of a batch in a pool of the worker
+    processes, writing them into the output file as they are completed, see
+    the module's documentation. If the file already exists, the batch is
+    resumed: its parameters must match the header of the file, and only the
+    slots not recorded yet are filled.
+
+    Signature:
+        str, int/, int, int, str OR None, str OR None, type A, int OR None,
+            int OR None, int, callable OR None/ -> dict(str -> int OR float)
+
+    Args:
+        strPath: string, path to the output file
+        iCount: non-negative integer, total number of the slots in the batch
+        iBoxRows: (optional) positive integer, number of rows in a box,
+            defaults to 3
+        iBoxColumns: (optional) positive integer, number of columns in a box,
+            defaults to 3
+        strMinLevel: (optional) string, the easiest accepted difficulty level
+            (see sudoku_py.core.rating.LEVELS), None (default) - no lower
+            bound
+        strMaxLevel: (optional) string, the hardest accepted difficulty level,
+            None (default) - no upper bound
+        gSeed: (optional) any type with the stable string representation, the
+            seed of the batch; by default the seed is taken from the header of
+            the existing file, or chosen randomly for a new file
+        iMinClues: (optional) non-negative integer, the removal of the clues
+            is stopped at this number, by default - minimal puzzles
+        iProcesses: (optional) positive integer, number of the worker
+            processes, defaults to the number of the CPUs
+        iMaxAttempts: (optional) positive integer, number of the rejected
+            puzzles, after which a slot is given up, defaults to MAX_ATTEMPTS
+        funProgress: (optional) callable, which is called with the current
+            statistics (same as returned) after each completed slot
+
+    Returns:
+        dict(str -> int OR float): 'written' - the slots filled by this call,
+            'skipped' - the slots given up by this call, 'resumed' - the slots
+            found in the existing file, 'attempts' - the generated puzzles,
+            'seconds' and 'per_second' - the filled slots per second
+
+    Raises:
+        TypeError: any of the box dimensions is not an integer number
+        ValueError: any of the box dimensions, the number of the processes or
+            attempts is not positive, the board is too large, the level name
+            is unknown, the levels band is empty, or the existing file is not
+            an output file of the same batch
+        IOError: the output file cannot be read or written
+        RuntimeError: a slot has failed in a worker process
+    """
+    SudokuBoard(iBoxRows, iBoxColumns)
+    for strLevel in (strMinLevel, strMaxLevel):
+        if not (strLevel is None or strLevel in _strlstLevels):
+            raise ValueError('Unknown difficulty level {!r}'.format(strLevel))
+    iFirst = 0 if strMinLevel is None else _strlstLevels.index(strMinLevel)
+    iLast = (len(_strlstLevels) - 1 if strMaxLevel is None
+                                    else _strlstLevels.index(strMaxLevel))
+    if iFirst > iLast:
+        raise ValueError('Empty band of the levels {}-{}'.format(strMinLevel,
+                                                                strMaxLevel))
+    if iProcesses is None:
+        iProcesses = multiprocessing.cpu_count()
+    if iProcesses < 1 or iMaxAttempts < 1:
+        raise ValueError('Not positive number of processes or attempts')
+    dictHeader = ReadHeader(strPath)
+    if dictHeader is None and os.path.isfile(strPath):
+        raise ValueError('Not a puzzle factory file {!r}'.format(strPath))
+    if gSeed is None:
+        if dictHeader is None:
+            gSeed = random.SystemRandom().getrandbits(32)
+        else:
+            gSeed = dictHeader.get('seed')
+    dictParameters = {'shape' : '{}x{}'.format(iBoxRows, iBoxColumns),
+                        'seed' : str(gSeed),
+                        'levels' : '{}-{}'.format(_strlstLevels[iFirst],
+                                                        _strlstLevels[iLast]),
+                        'clues' : str(iMinClues)}
+    if dictHeader is None:
+        with open(strPath, 'wb') as fFile:
+            fFile.write(_MakeHeader(dictParameters))
+        setDone = set()
+    elif dictHeader != dictParameters:
+        raise ValueError('File {!r} belongs to another batch: {}'.format(
+                                strPath, _MakeHeader(dictHeader).strip()))
+    else:
+        setDone = _ReadSlots(strPath)
+    setLevels = set(_strlstLevels[iFirst : iLast + 1])
+    dictStats = {'written' : 0, 'skipped' : 0, 'attempts' : 0,
+                    'resumed' : len(setDone), 'seconds' : 0.0,
+                                                        'per_second' : 0.0}
+    lstTasks = [(iSlot, str(gSeed), iBoxRows, iBoxColumns, iMinClues,
+                                                    setLevels, iMaxAttempts)
+                        for iSlot in xrange(iCount) if not (iSlot in setDone)]
+    if not lstTasks:
+        return dictStats
+    gStart = timeit.default_timer()
+    objPool = multiprocessing.Pool(min(iProcesses, len(lstTasks)))
+    try:
+        iterResults = objPool.imap_unordered(_FillSlot, lstTasks)
+        with open(strPath, 'ab') as fFile:
+            for _ in xrange(len(lstTasks)):
+                while True:
+                    try:
+                        (iSlot, strPuzzle, gRating, strLevel, iAttempts,
+                                    strError) = iterResults.next(POLL_PERIOD)
+                        break
+                    except multiprocessing.TimeoutError:
+                        pass
+                if strError is not None:
+                    raise RuntimeError('Worker process failed:\n{}'.format(
+                                                                    strError))
+                if strPuzzle is None:
+                    fFile.write('{} {}\n'.format(SKIPPED_PREFIX, iSlot))
+                    dictStats['skipped'] += 1
+                else:
+                    fFile.write('{}\t{:.3f}\t{}\t{}\n'.format(strPuzzle,
+                                                gRating, strLevel, iSlot))
+                    dictStats['written'] += 1
+                fFile.flush()
+                dictStats['attempts'] += iAttempts
+                gElapsed = timeit.default_timer() - gStart
+                dictStats['seconds'] = round(gElapsed, 3)
+                dictStats['per_second'] = round(
+                                    dictStats['written'] / gElapsed, 2)
+                if funProgress is not None:
+                    funProgress(dict(dictStats))
+        objPool.close()
+    finally:
+        objPool.terminate()
+        objPool.join()
+    return dictStats
@@ -0,0 +1,381 @@
+#!/usr/bin/python
+"""
+Module sudoku_py.core.puzzle_library
+
+Implements the library file of the puzzles of a single box shape with the
+random access by index. All integers are big-endian.
+
+    *) header - magic bytes 'SPLB', format version, box rows, box columns,
+        number of the difficulty levels L
+    *) levels' index - per level (in the order of LEVELS from the module
+        sudoku_py.core.rating) the index of its first puzzle and the number of
+        its puzzles, 8 bytes each
+    *) records - the puzzles grouped by the level, each one a fixed size
+        record of the givens packed at ceil(log2(N + 1)) bits per cell
+
+The library is opened as a read-only memory map, thus only the header is read
+upon opening, and fetching the puzzle k is a single slice of the record at the
+offset calculated from k; the rest of the file is never parsed or loaded into
+the memory.
+
+Classes:
+    PuzzleLibrary
+
+Functions:
+    BuildLibrary()
+        iterable(tuple(SudokuBoard OR str, str OR int OR float)), str, int,
+            int -> list(int)
+"""
+
+__version__ = "0.0.1.0"
+__date__ = "16-10-2026"
+__status__ = "Development"
+
+__all__ = ['PuzzleLibrary', 'BuildLibrary']
+
+#imports
+
+#+ standard libraries
+
+import mmap
+import os
+import random
+import shutil
+import struct
+import tempfile
+
+#+ other modules from the package
+
+from sudoku_py.core.board import SudokuBoard, ToBoard
+
+from sudoku_py.core.rating import LEVELS, GetLevel
+
+from sudoku_py.core.savegame import PackBits, UnpackBits, GetCellBits
+
+#globals
+
+MAGIC = 'SPLB'
+
+FORMAT_VERSION = 1
+
+LEVEL_NAMES = tuple(strLevel for strLevel, _ in LEVELS)
+
+_objHeader = struct.Struct('>4sBBBB')
+
+_objLevel = struct.Struct('>QQ')
+
+#functions
+
+def _GetRecordSize(iBoxRows, iBoxColumns):
+    """
+    Helper function to calculate the size of a record in bytes.
+
+    Signature:
+        int, int -> int
+    """
+    iSize = iBoxRows * iBoxColumns
+    return (iSize * iSize * GetCellBits(iSize) + 7) // 8
+
+def BuildLibrary(gItems, strPath, iBoxRows = 3, iBoxColumns = 3):
+    """
+    Writes the library file from the puzzles with their difficulty levels or
+    ratings. The records of each level are spooled into a temporary file first
+    and then concatenated, thus the puzzles are not kept in the memory.
+
+    Signature:
+        iterable(tuple(SudokuBoard OR str, str OR int OR float)), str/, int,
+            int/ -> list(int)
+
+    Args:
+        gItems: iterable of tuples (puzzle, difficulty), where the puzzle is a
+            SudokuBoard instance or a string, and the difficulty is a name of
+            a level or a rating (see sudoku_py.core.rating.GetLevel())
+        strPath: string, path to the library file to be created
+        iBoxRows: (optional) positive integer, number of rows in a box,
+            defaults to 3
+        iBoxColumns: (optional) positive integer, number of columns in a box,
+            defaults to 3
+
+    Returns:
+        list(int): number of the puzzles per level
+
+    Raises:
+        TypeError: a puzzle is neither a board nor a string
+        ValueError: a puzzle string is malformed, a puzzle has a different box
+            shape, or the level name is unknown
+    """
+    iSize = SudokuBoard(iBoxRows, iBoxColumns).Size
+    iBits = GetCellBits(iSize)
+    lstSpools = [tempfile.TemporaryFile() for _ in LEVEL_NAMES]
+    ilstCounts = [0] * len(LEVEL_NAMES)
+    try:
+        for gPuzzle, gDifficulty in gItems:
+            objBoard = ToBoard(gPuzzle)
+            if (objBoard.BoxRows != iBoxRows
+                                    or objBoard.BoxColumns != iBoxColumns):
+                raise ValueError('Puzzle box shape {} x {} is not {} x {}'.format(
+                                        objBoard.BoxRows, objBoard.BoxColumns,
+                                        iBoxRows, iBoxColumns))
+            if not isinstance(gDifficulty, basestring):
+                gDifficulty = GetLevel(gDifficulty)
+            if not (gDifficulty in LEVEL_NAMES):
+                raise ValueError('Unknown difficulty level {!r}'.format(
+                                                                gDifficulty))
+            iLevel = LEVEL_NAMES.index(gDifficulty)
+            lstSpools[iLevel].write(PackBits(objBoard.Values, iBits))
+            ilstCounts[iLevel] += 1
+        with open(strPath, 'wb') as fFile:
+            fFile.write(_objHeader.pack(MAGIC, FORMAT_VERSION, iBoxRows,
+                                                iBoxColumns, len(LEVEL_NAMES)))
+            iStart = 0
+            for iCount in ilstCounts:
+                fFile.write(_objLevel.pack(iStart, iCount))
+                iStart += iCount
+            for fSpool in lstSpools:
+                fSpool.seek(0)
+                shutil.copyfileobj(fSpool, fFile)
+    finally:
+        for fSpool in lstSpools:
+            fSpool.close()
+    return ilstCounts
+
+#classes
+
+class PuzzleLibrary(object):
+    """
+    Read-only memory mapped library of the puzzles with O(1) access to a
+    puzzle by its index.
+
+    Methods:
+        getPuzzle(iIndex)
+            int -> SudokuBoard
+        getLevelRange(strLevel)
+            str -> tuple(int, int)
+        getRandom(strLevel = None, objRandom = None)
+            /str OR None, random.Random OR None/ -> SudokuBoard
+        close()
+            None -> None
+
+    Attributes:
+        BoxRows: int, read-only property, number of rows in a box
+        BoxColumns: int, read-only property, number of columns in a box
+        Levels: tuple(str), read-only property, names of the levels
+    """
+
+    #special methods
+
+    def __init__(self, strPath):
+        """
+        Opens the library file and reads its header.
+
+        Signature:
+            str -> None
+
+        Args:
+            strPath: string, path to the library file
+
+        Raises:
+            IOError: the file cannot be opened
+            ValueError: the file is not a library or it is truncated, or the
+                format version is not supported
+        """
+        with open(strPath, 'rb') as fFile:
+            if not os.fstat(fFile.fileno()).st_size:
+                raise ValueError('Not a puzzle library {}'.format(strPath))
+            self._objMap = mmap.mmap(fFile.fileno(), 0,
+                                                    access = mmap.ACCESS_READ)
+        try:
+            self._readHeader(strPath)
+        except Exception:
+            self._objMap.close()
+            raise
+
+    def __len__(self):
+        """
+        Returns the total number of the puzzles.
+
+        Signature:
+            None -> int
+        """
+        return self._iPuzzles
+
+    def __enter__(self):
+        """
+        Entering the context manager.
+
+        Signature:
+            None -> PuzzleLibrary
+        """
+        return self
+
+    def __exit__(self, *args):
+        """
+        Exiting the context manager - closes the library.
+
+        Signature:
+            type A, type B, type C -> None
+        """
+        self.close()
+
+    #helper methods
+
+    def _readHeader(self, strPath):
+        """
+        Helper method to parse the header and the levels' index.
+
+        Signature:
+            str -> None
+        """
+        objMap = self._objMap
+        iOffset = _objHeader.size
+        if len(objMap) < iOffset:
+            raise ValueError('Not a puzzle library {}'.format(strPath))
+        (strMagic, iVersion, iBoxRows, iBoxColumns,
+                            iLevels) = _objHeader.unpack(objMap[:iOffset])
+        if strMagic != MAGIC:
+            raise ValueError('Not a puzzle library {}'.format(strPath))
+        if iVersion != FORMAT_VERSION:
+            raise ValueError('Unsupported library version {}'.format(iVersion))
+        if len(objMap) < iOffset + iLevels * _objLevel.size:
+            raise ValueError('Truncated puzzle library {}'.format(strPath))
+        self._iBoxRows = iBoxRows
+        self._iBoxColumns = iBoxColumns
+        self._iSize = SudokuBoard(iBoxRows, iBoxColumns).Size
+        self._iBits = GetCellBits(self._iSize)
+        self._iRecord = _GetRecordSize(iBoxRows, iBoxColumns)
+        self._dictLevels = dict()
+        self._tupLevels = LEVEL_NAMES[:iLevels]
+        self._iPuzzles = 0
+        for strLevel in self._tupLevels:
+            self._dictLevels[strLevel] = _objLevel.unpack(
+                                objMap[iOffset : iOffset + _objLevel.size])
+            iOffset += _objLevel.size
+            self._iPuzzles += self._dictLevels[strLevel][1]
+        self._iData = iOffset
+        if len(objMap) < iOffset + self._iPuzzles * self._iRecord:
+            raise ValueError('Truncated puzzle library {}'.format(strPath))
+
+    #public API
+
+    #properties
+
+    @property
+    def BoxRows(self):
+        """
+        Getter property for the number of rows in a box.
+
+        Signature:
+            None -> int
+        """
+        return self._iBoxRows
+
+    @property
+    def BoxColumns(self):
+        """
+        Getter property for the number of columns in a box.
+
+        Signature:
+            None -> int
+        """
+        return self._iBoxColumns
+
+    @property
+    def Levels(self):
+        """
+        Getter property for the names of the difficulty levels.
+
+        Signature:
+            None -> tuple(str)
+        """
+        return self._tupLevels
+
+    #+ methods
+
+    def getPuzzle(self, iIndex):
+        """
+        Fetches a puzzle by its index.
+
+        Signature:
+            int -> SudokuBoard
+
+        Args:
+            iIndex: non-negative integer, the index of the puzzle
+
+        Returns:
+            SudokuBoard: the puzzle
+
+        Raises:
+            IndexError: the index is out of range
+        """
+        if not (0 <= iIndex < self._iPuzzles):
+            raise IndexError('Puzzle {} is out of range'.format(iIndex))
+        iRecord = self._iRecord
+        iOffset = self._iData + iIndex * iRecord
+        iSize = self._iSize
+        objBoard = SudokuBoard(self._iBoxRows, self._iBoxColumns)
+        for iCell, iValue in enumerate(UnpackBits(
+                                self._objMap[iOffset : iOffset + iRecord],
+                                                    iSize * iSize, self._iBits)):
+            if iValue:
+                objBoard.setValue(iCell, iValue)
+        return objBoard
+
+    def getLevelRange(self, strLevel):
+        """
+        Returns the range of the indexes of the puzzles of a level.
+
+        Signature:
+            str -> tuple(int, int)
+
+        Args:
+            strLevel: string, name of the level
+
+        Returns:
+            tuple(int, int): the index of the first puzzle and the number of
+                the puzzles of the level
+
+        Raises:
+            ValueError: the level is unknown
+        """
+        tupRange = self._dictLevels.get(strLevel, None)
+        if tupRange is None:
+            raise ValueError('Unknown difficulty level {!r}'.format(strLevel))
+        return tupRange
+
+    def getRandom(self, strLevel = None, objRandom = None):
+        """
+        Fetches a random puzzle of the specified level or of any level.
+
+        Signature:
+            /str OR None, random.Random OR None/ -> SudokuBoard
+
+        Args:
+            strLevel: (optional) string, name of the level, by default - any
+            objRandom: (optional) random.Random instance, by default the
+                module level random numbers generator is used
+
+        Returns:
+            SudokuBoard: the puzzle
+
+        Raises:
+            ValueError: the level is unknown, or there are no puzzles of the
+                level
+        """
+        if objRandom is None:
+            objRandom = random
+        if strLevel is None:
+            iStart, iCount = 0, self._iPuzzles
+        else:
+            iStart, iCount = self.getLevelRange(strLevel)
+        if not iCount:
+            raise ValueError('No puzzles of the level {!r}'.format(strLevel))
+        return self.getPuzzle(iStart + objRandom.randrange(iCount))
+
+    def close(self):
+        """
+        Closes the memory map.
+
+        Signature:
+            None -> None
+        """
+        self._objMap.close()
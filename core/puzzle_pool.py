@@ -0,0 +1,400 @@
+#!/usr/bin/python
+"""
+Module sudoku_py.core.puzzle_pool
+
+Implements the pool of the ready (pre-generated) puzzles per difficulty level,
+thus a new game never waits for the generation.
+
+The pool is an SQLite database (see also sudoku_py.core.solution_cache), which
+persists between runs and is shared by two processes:
+
+    *) the user's process only takes the puzzles out of the pool
+    *) a background worker process generates the puzzles (see
+        sudoku_py.core.generator), rates them (see sudoku_py.core.rating) and
+        adds each one to its level, if that level holds less than the target
+        depth; then it sleeps until a puzzle is taken
+
+The levels are not equally likely to be generated (e.g. the 'expert' 9 x 9
+puzzles are rare), thus after MAX_MISSES generated puzzles without any
+addition the worker also sleeps until a puzzle is taken, instead of spinning
+for the rare levels. The worker runs with the lowered priority and ignores
+Ctrl+C, which is meant for the user's process.
+
+Classes:
+    PuzzlePool
+"""
+
+__version__ = "0.0.1.0"
+__date__ = "17-10-2026"
+__status__ = "Development"
+
+__all__ = ['DEF_DEPTH', 'PuzzlePool']
+
+#imports
+
+#+ standard libraries
+
+import os
+import signal
+import sqlite3
+import multiprocessing
+import traceback
+
+#+ other modules from the package
+
+from sudoku_py.core.board import SudokuBoard
+
+from sudoku_py.core.generator import GeneratePuzzle
+
+from sudoku_py.core.rating import LEVELS, RatePuzzle
+
+#globals
+
+#+ target number of the puzzles per level
+
+DEF_DEPTH = 10
+
+#+ generated puzzles without any addition, after which the worker sleeps
+
+MAX_MISSES = 200
+
+#+ the longest sleep of the worker between the checks of the pool, seconds
+
+IDLE_PERIOD = 5.0
+
+#+ increment of the worker's niceness
+
+WORKER_NICENESS = 10
+
+#+ the longest wait for the worker process to exit, seconds
+
+JOIN_TIMEOUT = 1.0
+
+LEVEL_NAMES = tuple(strLevel for strLevel, _ in LEVELS)
+
+_SQL_CREATE = ('CREATE TABLE IF NOT EXISTS pool (id INTEGER PRIMARY KEY, '
+                'rows INTEGER, columns INTEGER, level TEXT, puzzle TEXT)')
+
+_SQL_COUNT = ('SELECT level, COUNT(*) FROM pool WHERE rows = ? AND '
+                                            'columns = ? GROUP BY level')
+
+_SQL_INSERT = ('INSERT INTO pool (rows, columns, level, puzzle) '
+                                                        'VALUES (?, ?, ?, ?)')
+
+_SQL_FIRST = ('SELECT id, puzzle FROM pool WHERE rows = ? AND columns = ? AND '
+                                        'level = ? ORDER BY id LIMIT 1')
+
+_SQL_DELETE = 'DELETE FROM pool WHERE id = ?'
+
+#functions
+
+def _Connect(strPath):
+    """
+    Helper function to open the database and to create its table.
+
+    Signature:
+        str -> sqlite3.Connection
+    """
+    objDatabase = sqlite3.connect(strPath)
+    objDatabase.execute(_SQL_CREATE)
+    objDatabase.commit()
+    return objDatabase
+
+def _GetCounts(objDatabase, iBoxRows, iBoxColumns):
+    """
+    Helper function to count the puzzles of each level.
+
+    Signature:
+        sqlite3.Connection, int, int -> dict(str -> int)
+    """
+    dictCounts = dict((strLevel, 0) for strLevel in LEVEL_NAMES)
+    for strLevel, iCount in objDatabase.execute(_SQL_COUNT,
+                                                    (iBoxRows, iBoxColumns)):
+        dictCounts[strLevel] = iCount
+    return dictCounts
+
+def _Refill(strPath, iBoxRows, iBoxColumns, iDepth, objWake, objStop):
+    """
+    Helper function executed in the background worker process. Keeps the
+    levels topped up to the depth until the stop event is set, see the
+    module's documentation. The exceptions are printed to stderr, since there
+    is no one to report them to.
+
+    Signature:
+        str, int, int, int, multiprocessing.Event, multiprocessing.Event
+            -> None
+    """
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    try:
+        os.nice(WORKER_NICENESS)
+    except (AttributeError, OSError):
+        pass
+    try:
+        objDatabase = _Connect(strPath)
+        try:
+            iMisses = 0
+            while not objStop.is_set():
+                dictCounts = _GetCounts(objDatabase, iBoxRows, iBoxColumns)
+                if iMisses >= MAX_MISSES or all(iCount >= iDepth
+                                        for iCount in dictCounts.itervalues()):
+                    objWake.wait(IDLE_PERIOD)
+                    if objWake.is_set():
+                        objWake.clear()
+                        iMisses = 0
+                    continue
+                objPuzzle, _ = GeneratePuzzle(iBoxRows, iBoxColumns)
+                strLevel = RatePuzzle(objPuzzle).Level
+                if dictCounts[strLevel] < iDepth:
+                    objDatabase.execute(_SQL_INSERT, (iBoxRows, iBoxColumns,
+                                            strLevel, objPuzzle.toString()))
+                    objDatabase.commit()
+                    iMisses = 0
+                else:
+                    iMisses += 1
+        finally:
+            objDatabase.close()
+    except Exception:
+        traceback.print_exc()
+
+#classes
+
+class PuzzlePool(object):
+    """
+    Persistent pool of the ready puzzles of a specific box shape per
+    difficulty level, topped up by a background worker process, see the
+    module's documentation. An instance is meant for a single thread.
+
+    Methods:
+        start()
+            None -> None
+        stop()
+            None -> None
+        getCounts()
+            None -> dict(str -> int)
+        pop(strLevel = None)
+            /str OR None/ -> SudokuBoard OR None
+        close()
+            None -> None
+
+    Attributes:
+        BoxRows: int, read-only property, number of rows in a box
+        BoxColumns: int, read-only property, number of columns in a box
+        Depth: int, read-only property, target number of the puzzles per level
+        Running: bool, read-only property, the worker process is alive
+    """
+
+    #special methods
+
+    def __init__(self, strPath, iBoxRows = 3, iBoxColumns = 3,
+                                                        iDepth = DEF_DEPTH):
+        """
+        Initialization. The database file and its table are created if they do
+        not exist yet. The worker process is not started.
+
+        Signature:
+            str/, int, int, int/ -> None
+
+        Args:
+            strPath: string, path to the SQLite database file
+            iBoxRows: (optional) positive integer, number of rows in a box,
+                defaults to 3
+            iBoxColumns: (optional) positive integer, number of columns in a
+                box, defaults to 3
+            iDepth: (optional) positive integer, target number of the puzzles
+                per level, defaults to DEF_DEPTH
+
+        Raises:
+            TypeError: any of the box dimensions or the depth is not an
+                integer number
+            ValueError: any of the box dimensions or the depth is not
+                positive, or the board is too large
+            sqlite3.Error: the database cannot be opened or created
+        """
+        SudokuBoard(iBoxRows, iBoxColumns)
+        if not isinstance(iDepth, (int, long)):
+            raise TypeError('Not an integer depth of the pool')
+        if iDepth < 1:
+            raise ValueError('Not positive depth of the pool')
+        self._strPath = strPath
+        self._iBoxRows = iBoxRows
+        self._iBoxColumns = iBoxColumns
+        self._iDepth = iDepth
+        self._objDatabase = _Connect(strPath)
+        self._objWake = multiprocessing.Event()
+        self._objStop = multiprocessing.Event()
+        self._objWorker = None
+
+    def __enter__(self):
+        """
+        Entering the context manager.
+
+        Signature:
+            None -> PuzzlePool
+        """
+        return self
+
+    def __exit__(self, *args):
+        """
+        Exiting the context manager - stops the worker and closes the
+        database.
+
+        Signature:
+            type A, type B, type C -> None
+        """
+        self.close()
+
+    #public API
+
+    #properties
+
+    @property
+    def BoxRows(self):
+        """
+        Getter property for the number of rows in a box.
+
+        Signature:
+            None -> int
+        """
+        return self._iBoxRows
+
+    @property
+    def BoxColumns(self):
+        """
+        Getter property for the number of columns in a box.
+
+        Signature:
+            None -> int
+        """
+        return self._iBoxColumns
+
+    @property
+    def Depth(self):
+        """
+        Getter property for the target number of the puzzles per level.
+
+        Signature:
+            None -> int
+        """
+        return self._iDepth
+
+    @property
+    def Running(self):
+        """
+        Getter property for the state of the worker process.
+
+        Signature:
+            None -> bool
+        """
+        return self._objWorker is not None and self._objWorker.is_alive()
+
+    #+ methods
+
+    def start(self):
+        """
+        Starts the background worker process, unless it is running already.
+
+        Signature:
+            None -> None
+
+        Raises:
+            ValueError: the pool is closed
+        """
+        if self._objDatabase is None:
+            raise ValueError('Puzzle pool is closed')
+        if self.Running:
+            return
+        self._objStop.clear()
+        self._objWorker = multiprocessing.Process(target = _Refill,
+                    args = (self._strPath, self._iBoxRows, self._iBoxColumns,
+                                self._iDepth, self._objWake, self._objStop))
+        self._objWorker.daemon = True
+        self._objWorker.start()
+
+    def stop(self):
+        """
+        Stops the background worker process (if running). A puzzle being
+        generated is abandoned.
+
+        Signature:
+            None -> None
+        """
+        objWorker = self._objWorker
+        if objWorker is None:
+            return
+        self._objStop.set()
+        self._objWake.set()
+        objWorker.join(JOIN_TIMEOUT)
+        if objWorker.is_alive():
+            objWorker.terminate()
+            objWorker.join()
+        self._objWorker = None
+        self._objWake.clear()
+
+    def getCounts(self):
+        """
+        Counts the ready puzzles of each level.
+
+        Signature:
+            None -> dict(str -> int)
+
+        Raises:
+            ValueError: the pool is closed
+        """
+        if self._objDatabase is None:
+            raise ValueError('Puzzle pool is closed')
+        return _GetCounts(self._objDatabase, self._iBoxRows, self._iBoxColumns)
+
+    def pop(self, strLevel = None):
+        """
+        Takes the oldest ready puzzle of a level out of the pool and wakes up
+        the worker to replace it.
+
+        Signature:
+            /str OR None/ -> SudokuBoard OR None
+
+        Args:
+            strLevel: (optional) string, the difficulty level (see
+                sudoku_py.core.rating.LEVELS), None (default) - the level with
+                the most ready puzzles
+
+        Returns:
+            SudokuBoard: the puzzle
+            None: there are no ready puzzles of the level
+
+        Raises:
+            ValueError: the pool is closed, or the level name is unknown
+        """
+        if self._objDatabase is None:
+            raise ValueError('Puzzle pool is closed')
+        if strLevel is None:
+            dictCounts = self.getCounts()
+            strLevel = max(LEVEL_NAMES, key = dictCounts.get)
+        elif not (strLevel in LEVEL_NAMES):
+            raise ValueError('Unknown difficulty level {!r}'.format(strLevel))
+        objDatabase = self._objDatabase
+        tupShape = (self._iBoxRows, self._iBoxColumns)
+        while True:
+            tupRow = objDatabase.execute(_SQL_FIRST,
+                                            tupShape + (strLevel, )).fetchone()
+            if tupRow is None:
+                return None
+            #the same pool may be used by another process
+            iDeleted = objDatabase.execute(_SQL_DELETE,
+                                                    (tupRow[0], )).rowcount
+            objDatabase.commit()
+            if iDeleted:
+                break
+        self._objWake.set()
+        return SudokuBoard.fromString(str(tupRow[1]), *tupShape)
+
+    def close(self):
+        """
+        Stops the worker process and closes the database.
+
+        Signature:
+            None -> None
+        """
+        self.stop()
+        if self._objDatabase is not None:
+            self._objDatabase.close()
+            self._objDatabase = None
@@ -0,0 +1,578 @@
+#!/usr/bin/python
+"""
+Module sudoku_py.core.rating
+
+Implements the logical (human style) solver of the generic m x n sudoku
+puzzles, which rates the difficulty of a puzzle by the techniques required to
+solve it.
+
+At each step the techniques are tried in the order of their cost, and the
+first one making progress is applied:
+
+    *) hidden single, naked single
+    *) locked candidates (pointing and claiming)
+    *) naked and hidden pairs, X-wing
+    *) naked and hidden triples, swordfish
+    *) naked and hidden quads
+
+The candidates are kept as integer bitsets per cell; the units, the peers and
+the box / line intersections are precomputed once per box shape, thus no
+technique re-scans the grid to find its units.
+
+The rating is a float number: its integer part is the cost of the hardest
+technique used (see TECHNIQUES), or UNSOLVED_COST if the techniques are not
+sufficient; its fractional part grows with the total cost of all steps. Thus
+the ratings are ordered by the hardest technique first, and by the amount of
+work second. The ratings are converted into the named difficulty levels by
+the function GetLevel().
+
+Classes:
+    RatingStep
+    DifficultyRating
+    LogicalSolver
+
+Functions:
+    GetLevel()
+        int OR float -> str
+    RatePuzzle()
+        SudokuBoard OR str -> DifficultyRating
+"""
+
+__version__ = "0.0.1.0"
+__date__ = "16-10-2026"
+__status__ = "Development"
+
+__all__ = ['TECHNIQUES', 'LEVELS', 'RatingStep', 'DifficultyRating',
+            'LogicalSolver', 'GetLevel', 'RatePuzzle']
+
+#imports
+
+#+ standard libraries
+
+import collections
+import itertools
+
+#+ other modules from the package
+
+from sudoku_py.core.board import GetIndexTables, ToBoard
+
+#globals
+
+#+ names and costs of the techniques in the order they are tried
+
+HIDDEN_SINGLE = 'hidden single'
+
+NAKED_SINGLE = 'naked single'
+
+LOCKED_CANDIDATES = 'locked candidates'
+
+NAKED_SUBSETS = ('naked pair', 'naked triple', 'naked quad')
+
+HIDDEN_SUBSETS = ('hidden pair', 'hidden triple', 'hidden quad')
+
+FISHES = ('X-wing', 'swordfish')
+
+TECHNIQUES = collections.OrderedDict([(HIDDEN_SINGLE, 1), (NAKED_SINGLE, 2),
+                        (LOCKED_CANDIDATES, 3), (NAKED_SUBSETS[0], 4),
+                        (HIDDEN_SUBSETS[0], 5), (FISHES[0], 6),
+                        (NAKED_SUBSETS[1], 7), (HIDDEN_SUBSETS[1], 8),
+                        (FISHES[1], 9), (NAKED_SUBSETS[2], 10),
+                        (HIDDEN_SUBSETS[2], 11)])
+
+UNSOLVED_COST = 12
+
+#+ difficulty levels as the maximum cost of the hardest technique
+
+LEVELS = (('easy', 2), ('medium', 3), ('hard', 8), ('expert', 11),
+                                                    ('extreme', UNSOLVED_COST))
+
+_dictIntersections = dict()
+
+#functions
+
+def _GetIntersections(iBoxRows, iBoxColumns):
+    """
+    Helper function to get the (cached) box / line intersections for the
+    specific box shape.
+
+    Signature:
+        int, int -> tuple(tuple(tuple(int), tuple(int), tuple(int)))
+
+    Returns:
+        tuple(tuple(tuple(int), tuple(int), tuple(int))): per each pair of a
+            box and a row or a column crossing it - the cells of the
+            intersection, the rest of the box and the rest of the line
+    """
+    tupKey = (iBoxRows, iBoxColumns)
+    tupIntersections = _dictIntersections.get(tupKey, None)
+    if tupIntersections is None:
+        _, _, _, tupUnits, _ = GetIndexTables(iBoxRows, iBoxColumns)
+        iSize = iBoxRows * iBoxColumns
+        lstIntersections = []
+        for tupBox in tupUnits[2 * iSize:]:
+            setBox = set(tupBox)
+            for tupLine in tupUnits[:2 * iSize]:
+                setCommon = setBox.intersection(tupLine)
+                if setCommon:
+                    lstIntersections.append((tuple(sorted(setCommon)),
+                        tuple(iCell for iCell in tupBox
+                                            if not (iCell in setCommon)),
+                        tuple(iCell for iCell in tupLine
+                                            if not (iCell in setCommon))))
+        tupIntersections = tuple(lstIntersections)
+        _dictIntersections[tupKey] = tupIntersections
+    return tupIntersections
+
+def _BitCount(iMask):
+    """
+    Helper function to count the set bits of a bitset.
+
+    Signature:
+        int -> int
+    """
+    return bin(iMask).count('1')
+
+def _Bits(iMask):
+    """
+    Helper function to list the indexes of the set bits of a bitset.
+
+    Signature:
+        int -> list(int)
+    """
+    lstBits = []
+    while iMask:
+        iBit = iMask & -iMask
+        lstBits.append(iBit.bit_length() - 1)
+        iMask ^= iBit
+    return lstBits
+
+def GetLevel(gRating):
+    """
+    Converts a rating into the name of the difficulty level.
+
+    Signature:
+        int OR float -> str
+
+    Args:
+        gRating: int or float, the rating, see DifficultyRating
+
+    Returns:
+        str: one of 'easy', 'medium', 'hard', 'expert', 'extreme'
+    """
+    iCost = int(gRating)
+    for strLevel, iMaxCost in LEVELS:
+        if iCost <= iMaxCost:
+            return strLevel
+    return LEVELS[-1][0]
+
+def RatePuzzle(gPuzzle, objBudget = None):
+    """
+    Rates the difficulty of a puzzle, see LogicalSolver.rate().
+
+    Signature:
+        SudokuBoard OR str/, SolveBudget OR None/ -> DifficultyRating
+
+    Args:
+        gPuzzle: SudokuBoard instance or string, the puzzle definition
+        objBudget: (optional) sudoku_py.core.solve_budget.SolveBudget
+            instance, its deadline and cancellation are checked before each
+            step, None (default) - unlimited
+
+    Returns:
+        DifficultyRating: the rating and the steps taken
+
+    Raises:
+        TypeError: the argument is neither a board nor a string
+        ValueError: the string is not a proper puzzle definition
+        sudoku_py.core.solve_budget.BudgetExceeded: the budget's deadline is
+            passed or it is cancelled
+    """
+    return LogicalSolver(gPuzzle).rate(objBudget)
+
+#classes
+
+class RatingStep(collections.namedtuple('RatingStep',
+                                ['Technique', 'Placed', 'Eliminated'])):
+    """
+    A single step of the logical solution, a named tuple.
+
+    Attributes:
+        Technique: str, the name of the technique applied
+        Placed: tuple(tuple(int, int)), the placed (cell index, digit) pairs
+        Eliminated: tuple(tuple(int, int)), the eliminated (cell index, digit)
+            candidates
+    """
+
+    __slots__ = ()
+
+class DifficultyRating(collections.namedtuple('DifficultyRating',
+                                ['Rating', 'Level', 'Solved', 'Steps'])):
+    """
+    Result of the rating of a puzzle, a named tuple.
+
+    Attributes:
+        Rating: float, the rating - the cost of the hardest technique used plus
+            the fraction growing with the total cost of the steps
+        Level: str, the name of the difficulty level, see GetLevel()
+        Solved: bool, the puzzle is solved by the techniques
+        Steps: tuple(RatingStep), the steps taken
+    """
+
+    __slots__ = ()
+
+class LogicalSolver(object):
+    """
+    Logical solver of a single puzzle, which applies the human style
+    techniques step by step in the order of their cost.
+
+    Methods:
+        step()
+            None -> RatingStep OR None
+        rate(objBudget = None)
+            /SolveBudget OR None/ -> DifficultyRating
+
+    Attributes:
+        Board: SudokuBoard, read-only property, the current state of the board
+        Candidates: list(int), read-only property, copy of the candidates'
+            bitsets of all cells, zero for the filled cells
+    """
+
+    #special methods
+
+    def __init__(self, gPuzzle):
+        """
+        Prepares the candidates of all cells.
+
+        Signature:
+            SudokuBoard OR str -> None
+
+        Args:
+            gPuzzle: SudokuBoard instance or string, the puzzle definition
+
+        Raises:
+            TypeError: the argument is neither a board nor a string
+            ValueError: the string is not a proper puzzle definition
+        """
+        objBoard = ToBoard(gPuzzle).copy()
+        iBoxRows = objBoard.BoxRows
+        iBoxColumns = objBoard.BoxColumns
+        iSize = objBoard.Size
+        _, _, _, tupUnits, self._tupPeers = GetIndexTables(iBoxRows,
+                                                                iBoxColumns)
+        self._tupUnits = tupUnits
+        self._tupRows = tupUnits[:iSize]
+        self._tupColumns = tupUnits[iSize : 2 * iSize]
+        self._tupIntersections = _GetIntersections(iBoxRows, iBoxColumns)
+        self._objBoard = objBoard
+        self._iSize = iSize
+        self._ilstCandidates = [objBoard.getCandidates(iCell)
+                                            for iCell in xrange(objBoard.Cells)]
+
+    #helper methods
+
+    def _place(self, iCell, iDigit):
+        """
+        Helper method to place a digit into a cell and to remove it from the
+        candidates of the peers.
+
+        Signature:
+            int, int -> None
+        """
+        ilstCandidates = self._ilstCandidates
+        self._objBoard.setValue(iCell, iDigit)
+        ilstCandidates[iCell] = 0
+        iMask = ~(1 << (iDigit - 1))
+        for iPeer in self._tupPeers[iCell]:
+            ilstCandidates[iPeer] &= iMask
+
+    def _eliminate(self, strTechnique, lstEliminated):
+        """
+        Helper method to remove the candidates and to make the step record.
+
+        Signature:
+            str, list(tuple(int, int)) -> RatingStep
+        """
+        ilstCandidates = self._ilstCandidates
+        for iCell, iDigit in lstEliminated:
+            ilstCandidates[iCell] &= ~(1 << (iDigit - 1))
+        return RatingStep(strTechnique, (), tuple(lstEliminated))
+
+    def _findHiddenSingle(self):
+        """
+        Helper method to find and to place a digit, which has a single
+        possible cell in a unit.
+
+        Signature:
+            None -> RatingStep OR None
+        """
+        ilstCandidates = self._ilstCandidates
+        for tupUnit in self._tupUnits:
+            iOnce = 0
+            iTwice = 0
+            for iCell in tupUnit:
+                iMask = ilstCandidates[iCell]
+                iTwice |= iOnce & iMask
+                iOnce |= iMask
+            iHidden = iOnce & ~iTwice
+            if iHidden:
+                iBit = iHidden & -iHidden
+                for iCell in tupUnit:
+                    if ilstCandidates[iCell] & iBit:
+                        iDigit = iBit.bit_length()
+                        self._place(iCell, iDigit)
+                        return RatingStep(HIDDEN_SINGLE, ((iCell, iDigit), ),
+                                                                            ())
+        return None
+
+    def _findNakedSingle(self):
+        """
+        Helper method to find and to place a digit into a cell with a single
+        candidate.
+
+        Signature:
+            None -> RatingStep OR None
+        """
+        for iCell, iMask in enumerate(self._ilstCandidates):
+            if iMask and not (iMask & (iMask - 1)):
+                iDigit = iMask.bit_length()
+                self._place(iCell, iDigit)
+                return RatingStep(NAKED_SINGLE, ((iCell, iDigit), ), ())
+        return None
+
+    def _findLockedCandidates(self):
+        """
+        Helper method to find the digits confined to the intersection of a box
+        and a line within one of them, and to remove them from the rest of the
+        other one.
+
+        Signature:
+            None -> RatingStep OR None
+        """
+        ilstCandidates = self._ilstCandidates
+        for tupCommon, tupBoxRest, tupLineRest in self._tupIntersections:
+            iCommon = 0
+            for iCell in tupCommon:
+                iCommon |= ilstCandidates[iCell]
+            if not iCommon:
+                continue
+            iBoxRest = 0
+            for iCell in tupBoxRest:
+                iBoxRest |= ilstCandidates[iCell]
+            iLineRest = 0
+            for iCell in tupLineRest:
+                iLineRest |= ilstCandidates[iCell]
+            #pointing - confined within the box, claiming - within the line
+            for iLocked, tupTargets in (
+                            (iCommon & ~iBoxRest & iLineRest, tupLineRest),
+                            (iCommon & ~iLineRest & iBoxRest, tupBoxRest)):
+                if iLocked:
+                    lstEliminated = [(iCell, iDigit + 1)
+                                    for iCell in tupTargets
+                                    for iDigit in _Bits(ilstCandidates[iCell]
+                                                                    & iLocked)]
+                    return self._eliminate(LOCKED_CANDIDATES, lstEliminated)
+        return None
+
+    def _findNakedSubset(self, iOrder):
+        """
+        Helper method to find N cells of a unit with N candidates in total,
+        and to remove these candidates from the rest of the unit.
+
+        Signature:
+            int -> RatingStep OR None
+        """
+        ilstCandidates = self._ilstCandidates
+        for tupUnit in self._tupUnits:
+            lstCells = [iCell for iCell in tupUnit
+                            if 1 < _BitCount(ilstCandidates[iCell]) <= iOrder]
+            if len(lstCells) < iOrder:
+                continue
+            for tupCells in itertools.combinations(lstCells, iOrder):
+                iUnion = 0
+                for iCell in tupCells:
+                    iUnion |= ilstCandidates[iCell]
+                if _BitCount(iUnion) != iOrder:
+                    continue
+                lstEliminated = [(iCell, iDigit + 1) for iCell in tupUnit
+                                    if not (iCell in tupCells)
+                                    for iDigit in _Bits(ilstCandidates[iCell]
+                                                                    & iUnion)]
+                if lstEliminated:
+                    return self._eliminate(NAKED_SUBSETS[iOrder - 2],
+                                                                lstEliminated)
+        return None
+
+    def _findHiddenSubset(self, iOrder):
+        """
+        Helper method to find N digits confined to N cells of a unit, and to
+        remove the other candidates from these cells.
+
+        Signature:
+            int -> RatingStep OR None
+        """
+        ilstCandidates = self._ilstCandidates
+        for tupUnit in self._tupUnits:
+            #positions within the unit as a bitset per digit
+            ilstPlaces = [0] * self._iSize
+            for iPosition, iCell in enumerate(tupUnit):
+                for iDigit in _Bits(ilstCandidates[iCell]):
+                    ilstPlaces[iDigit] |= 1 << iPosition
+            lstDigits = [iDigit for iDigit, iPlaces in enumerate(ilstPlaces)
+                                            if 1 < _BitCount(iPlaces) <= iOrder]
+            if len(lstDigits) < iOrder:
+                continue
+            for tupDigits in itertools.combinations(lstDigits, iOrder):
+                iUnion = 0
+                iDigitsMask = 0
+                for iDigit in tupDigits:
+                    iUnion |= ilstPlaces[iDigit]
+                    iDigitsMask |= 1 << iDigit
+                if _BitCount(iUnion) != iOrder:
+                    continue
+                lstEliminated = [(tupUnit[iPosition], iDigit + 1)
+                                for iPosition in _Bits(iUnion)
+                                for iDigit in _Bits(
+                                    ilstCandidates[tupUnit[iPosition]]
+                                                                & ~iDigitsMask)]
+                if lstEliminated:
+                    return self._eliminate(HIDDEN_SUBSETS[iOrder - 2],
+                                                                lstEliminated)
+        return None
+
+    def _findFish(self, iOrder):
+        """
+        Helper method to find N lines (rows or columns), where a digit is
+        confined to the same N crossing lines, and to remove this digit from
+        the rest of the crossing lines. N = 2 is X-wing, N = 3 is swordfish.
+
+        Signature:
+            int -> RatingStep OR None
+        """
+        ilstCandidates = self._ilstCandidates
+        for tupBases, tupCovers in ((self._tupRows, self._tupColumns),
+                                        (self._tupColumns, self._tupRows)):
+            for iDigit in xrange(self._iSize):
+                iBit = 1 << iDigit
+                lstLines = []
+                for iLine, tupLine in enumerate(tupBases):
+                    iPlaces = 0
+                    for iPosition, iCell in enumerate(tupLine):
+                        if ilstCandidates[iCell] & iBit:
+                            iPlaces |= 1 << iPosition
+                    if 1 < _BitCount(iPlaces) <= iOrder:
+                        lstLines.append((iLine, iPlaces))
+                if len(lstLines) < iOrder:
+                    continue
+                for tupLines in itertools.combinations(lstLines, iOrder):
+                    iUnion = 0
+                    for _, iPlaces in tupLines:
+                        iUnion |= iPlaces
+                    if _BitCount(iUnion) != iOrder:
+                        continue
+                    setBases = set(iLine for iLine, _ in tupLines)
+                    lstEliminated = [(iCell, iDigit + 1)
+                                    for iCover in _Bits(iUnion)
+                                    for iPosition, iCell in enumerate(
+                                                        tupCovers[iCover])
+                                    if not (iPosition in setBases)
+                                        and ilstCandidates[iCell] & iBit]
+                    if lstEliminated:
+                        return self._eliminate(FISHES[iOrder - 2],
+                                                                lstEliminated)
+        return None
+
+    #public API
+
+    #properties
+
+    @property
+    def Board(self):
+        """
+        Getter property for the current state of the board.
+
+        Signature:
+            None -> SudokuBoard
+        """
+        return self._objBoard
+
+    @property
+    def Candidates(self):
+        """
+        Getter property for the copy of the candidates' bitsets of all cells.
+
+        Signature:
+            None -> list(int)
+        """
+        return self._ilstCandidates[:]
+
+    #+ methods
+
+    def step(self):
+        """
+        Applies the cheapest technique making progress.
+
+        Signature:
+            None -> RatingStep OR None
+
+        Returns:
+            RatingStep: the step made, or None if the board is solved, stuck
+                (no technique makes progress) or contradictory (an empty cell
+                without candidates)
+        """
+        objBoard = self._objBoard
+        ilstCandidates = self._ilstCandidates
+        for iCell, iMask in enumerate(ilstCandidates):
+            if not (iMask or objBoard.getValue(iCell)):
+                return None
+        objStep = self._findHiddenSingle() or self._findNakedSingle()
+        if objStep is None:
+            objStep = (self._findLockedCandidates()
+                        or self._findNakedSubset(2)
+                        or self._findHiddenSubset(2)
+                        or self._findFish(2)
+                        or self._findNakedSubset(3)
+                        or self._findHiddenSubset(3)
+                        or self._findFish(3)
+                        or self._findNakedSubset(4)
+                        or self._findHiddenSubset(4))
+        return objStep
+
+    def rate(self, objBudget = None):
+        """
+        Applies the techniques until the board is solved or no technique makes
+        progress, and rates the difficulty.
+
+        Signature:
+            /SolveBudget OR None/ -> DifficultyRating
+
+        Args:
+            objBudget: (optional) sudoku_py.core.solve_budget.SolveBudget
+                instance, its deadline and cancellation are checked before
+                each step, None (default) - unlimited
+
+        Returns:
+            DifficultyRating: the rating and the steps taken
+
+        Raises:
+            sudoku_py.core.solve_budget.BudgetExceeded: the budget's deadline
+                is passed or it is cancelled
+        """
+        lstSteps = []
+        iHardest = 0
+        iTotal = 0
+        while True:
+            if objBudget is not None:
+                objBudget.check()
+            objStep = self.step()
+            if objStep is None:
+                break
+            lstSteps.append(objStep)
+            iCost = TECHNIQUES[objStep.Technique]
+            iTotal += iCost
+            iHardest = max(iHardest, iCost)
+        bSolved = self._objBoard.isComplete()
+        if not bSolved:
+            iHardest = UNSOLVED_COST
+        fRating = iHardest + float(iTotal) / (iTotal + self._objBoard.Cells)
+        return DifficultyRating(fRating, GetLevel(iHardest), bSolved,
+                                                                tuple(lstSteps))
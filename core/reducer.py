@@ -0,0 +1,325 @@
+#!/usr/bin/python
+"""
+Module sudoku_py.core.reducer
+
+Implements the reduction of a uniquely solvable puzzle to a minimal one, i.e.
+to a puzzle, from which no clue can be removed without losing the uniqueness
+of the solution.
+
+A clue is redundant, if the puzzle without it has no solution with another
+digit in that cell. Removing the clues can only add the solutions, thus a
+clue found necessary is never checked again, while a clue found redundant is
+removed only if no other clue has been removed since its check started;
+otherwise it is checked again against the reduced puzzle.
+
+The checks run in a group of the worker processes, one per worker at a time.
+Each committed removal increments the shared version of the puzzle; the
+checks started against an older version are stopped (moot) as soon as the
+worker notices the change - every CHECK_EVERY search nodes, see the
+statistics collector interface in sudoku_py.core.solver_stats - and their
+clues are queued again.
+
+Functions:
+    IsRedundant()
+        SudokuBoard OR str, int -> bool
+    IsMinimal()
+        SudokuBoard OR str -> bool
+    ReducePuzzle()
+        SudokuBoard OR str/, int OR None, type A/ -> SudokuBoard
+"""
+
+__version__ = "0.0.1.0"
+__date__ = "17-10-2026"
+__status__ = "Development"
+
+__all__ = ['IsRedundant', 'IsMinimal', 'ReducePuzzle']
+
+#imports
+
+#+ standard libraries
+
+import collections
+import multiprocessing
+import Queue
+import random
+import traceback
+
+#+ other modules from the package
+
+from sudoku_py.core.board import SudokuBoard, ToBoard
+
+from sudoku_py.core.propagation_solver import PropagationSolver
+
+from sudoku_py.core.solver_stats import SolverStats
+
+from sudoku_py.core.solve_budget import STATUS_CANCELLED, BudgetExceeded
+
+#globals
+
+#+ period (in nodes) of the checks of the puzzle's version in the workers
+
+CHECK_EVERY = 64
+
+OUTCOME_REDUNDANT = 0
+
+OUTCOME_NEEDED = 1
+
+OUTCOME_MOOT = 2
+
+#+ period of the checks of the workers' health by the main process, seconds -
+#+ also, the blocking wait cannot be interrupted by Ctrl+C
+
+POLL_PERIOD = 0.5
+
+#+ the longest wait for a worker process to exit, seconds
+
+JOIN_TIMEOUT = 1.0
+
+#classes
+
+class _VersionMonitor(SolverStats):
+    """
+    Statistics collector of a check in a worker process, which stops the
+    search, when the shared version of the puzzle differs from the checked
+    one.
+    """
+
+    #special methods
+
+    def __init__(self, objVersion, iVersion):
+        """
+        Initialization.
+
+        Signature:
+            multiprocessing.Value, int -> None
+        """
+        super(_VersionMonitor, self).__init__()
+        self._objVersion = objVersion
+        self._iVersion = iVersion
+
+    #public API
+
+    def enterNode(self, iDepth, iCell, iDigit):
+        """
+        Registers a visited node and periodically checks the shared version.
+
+        Signature:
+            int, int, int -> None
+
+        Raises:
+            BudgetExceeded: the check is moot
+        """
+        super(_VersionMonitor, self).enterNode(iDepth, iCell, iDigit)
+        if not (self.Nodes % CHECK_EVERY):
+            if self._objVersion.value != self._iVersion:
+                raise BudgetExceeded(STATUS_CANCELLED)
+
+#functions
+
+def _CheckRedundant(objBoard, iCell, objStats):
+    """
+    Helper function to check a clue with the optional statistics collector
+    attached to the searches.
+
+    Signature:
+        SudokuBoard, int, SolverStats OR None -> bool
+    """
+    objPuzzle = objBoard.copy()
+    iValue = objPuzzle.getValue(iCell)
+    objPuzzle.clearValue(iCell)
+    iMask = objPuzzle.getCandidates(iCell) & ~(1 << (iValue - 1))
+    iDigit = 0
+    while iMask:
+        if iMask & 1:
+            objPuzzle.setValue(iCell, iDigit + 1)
+            if PropagationSolver(objPuzzle, objStats).countSolutions(1):
+                return False
+            objPuzzle.clearValue(iCell)
+        iMask >>= 1
+        iDigit += 1
+    return True
+
+def _CheckClue(strPuzzle, iBoxRows, iBoxColumns, iCell, iVersion,
+                                                                objVersion):
+    """
+    Helper function to check a clue in a worker process against the puzzle of
+    the specified version, unless that version is outdated.
+
+    Signature:
+        str, int, int, int, int, multiprocessing.Value -> int
+    """
+    if objVersion.value != iVersion:
+        return OUTCOME_MOOT
+    objBoard = SudokuBoard.fromString(strPuzzle, iBoxRows, iBoxColumns)
+    try:
+        if _CheckRedundant(objBoard, iCell,
+                                        _VersionMonitor(objVersion, iVersion)):
+            return OUTCOME_REDUNDANT
+        return OUTCOME_NEEDED
+    except BudgetExceeded:
+        return OUTCOME_MOOT
+
+def _Worker(objTasks, objResults, objVersion, iBoxRows, iBoxColumns):
+    """
+    Helper function executed in a worker process. Checks the queued clues one
+    by one until the None sentinel is received, and reports the outcome of
+    each check together with its cell and version. An exception is reported
+    as the formatted traceback and ends the worker.
+
+    Signature:
+        multiprocessing.Queue, multiprocessing.Queue, multiprocessing.Value,
+            int, int -> None
+    """
+    iCell = iVersion = None
+    try:
+        while True:
+            tupTask = objTasks.get()
+            if tupTask is None:
+                break
+            strPuzzle, iCell, iVersion = tupTask
+            iOutcome = _CheckClue(strPuzzle, iBoxRows, iBoxColumns, iCell,
+                                                        iVersion, objVersion)
+            objResults.put((iCell, iVersion, iOutcome, None))
+    except Exception:
+        objResults.put((iCell, iVersion, None, traceback.format_exc()))
+
+def IsRedundant(gPuzzle, iCell):
+    """
+    Checks if a clue can be removed from a uniquely solvable puzzle without
+    losing the uniqueness of the solution.
+
+    Signature:
+        SudokuBoard OR str, int -> bool
+
+    Args:
+        gPuzzle: SudokuBoard instance or string, the uniquely solvable puzzle
+        iCell: non-negative integer, index of a cell with a clue
+
+    Returns:
+        bool: True if the puzzle without the clue is still uniquely solvable
+
+    Raises:
+        TypeError: the puzzle is neither a board nor a string
+        ValueError: the puzzle string is malformed, or the cell is empty
+        IndexError: the cell index is out of range
+    """
+    objBoard = ToBoard(gPuzzle)
+    if not objBoard.getValue(iCell):
+        raise ValueError('Cell {} has no clue'.format(iCell))
+    return _CheckRedundant(objBoard, iCell, None)
+
+def IsMinimal(gPuzzle):
+    """
+    Checks if no clue can be removed from a uniquely solvable puzzle without
+    losing the uniqueness of the solution.
+
+    Signature:
+        SudokuBoard OR str -> bool
+
+    Args:
+        gPuzzle: SudokuBoard instance or string, the uniquely solvable puzzle
+
+    Returns:
+        bool: True if the puzzle is minimal
+
+    Raises:
+        TypeError: the puzzle is neither a board nor a string
+        ValueError: the puzzle string is malformed
+    """
+    objBoard = ToBoard(gPuzzle)
+    return not any(_CheckRedundant(objBoard, iCell, None)
+                    for iCell in xrange(objBoard.Cells)
+                                                if objBoard.getValue(iCell))
+
+def ReducePuzzle(gPuzzle, iProcesses = None, gSeed = None):
+    """
+    Removes the redundant clues from a uniquely solvable puzzle until it is
+    minimal, see the module's documentation. The clues are checked in a
+    random order, thus different minimal puzzles can be obtained from the same
+    puzzle.
+
+    Signature:
+        SudokuBoard OR str/, int OR None, type A/ -> SudokuBoard
+
+    Args:
+        gPuzzle: SudokuBoard instance or string, the uniquely solvable puzzle
+        iProcesses: (optional) positive integer, number of the worker
+            processes, defaults to the number of the CPUs; with 1 the clues
+            are checked in the current process
+        gSeed: (optional) any hashable type, seed of the random order of the
+            checks, by default - the system time / entropy
+
+    Returns:
+        SudokuBoard: the minimal puzzle with the same solution
+
+    Raises:
+        TypeError: the puzzle is neither a board nor a string
+        ValueError: the puzzle string is malformed, the puzzle is not uniquely
+            solvable, or the number of the processes is not positive
+        RuntimeError: a check has failed in a worker process
+    """
+    objBoard = ToBoard(gPuzzle).copy()
+    if iProcesses is None:
+        iProcesses = multiprocessing.cpu_count()
+    if iProcesses < 1:
+        raise ValueError('Not positive number of processes')
+    if PropagationSolver(objBoard).countSolutions(2) != 1:
+        raise ValueError('Puzzle is not uniquely solvable')
+    ilstClues = [iCell for iCell in xrange(objBoard.Cells)
+                                                if objBoard.getValue(iCell)]
+    random.Random(gSeed).shuffle(ilstClues)
+    if iProcesses == 1:
+        for iCell in ilstClues:
+            if _CheckRedundant(objBoard, iCell, None):
+                objBoard.clearValue(iCell)
+        return objBoard
+    deqPending = collections.deque(ilstClues)
+    iVersion = 0
+    objVersion = multiprocessing.Value('i', iVersion)
+    objTasks = multiprocessing.Queue()
+    objResults = multiprocessing.Queue()
+    lstWorkers = [multiprocessing.Process(target = _Worker,
+                    args = (objTasks, objResults, objVersion, objBoard.BoxRows,
+                                                        objBoard.BoxColumns))
+                                                for _ in xrange(iProcesses)]
+    for objWorker in lstWorkers:
+        objWorker.daemon = True
+        objWorker.start()
+    try:
+        strPuzzle = objBoard.toString()
+        iInFlight = 0
+        while deqPending or iInFlight:
+            while deqPending and iInFlight < iProcesses:
+                objTasks.put((strPuzzle, deqPending.popleft(), iVersion))
+                iInFlight += 1
+            try:
+                iCell, iChecked, iOutcome, strError = objResults.get(True,
+                                                                POLL_PERIOD)
+            except Queue.Empty:
+                if not all(objWorker.is_alive() for objWorker in lstWorkers):
+                    raise RuntimeError('Worker process has exited')
+                continue
+            iInFlight -= 1
+            if iOutcome is None:
+                raise RuntimeError('Worker process failed:\n{}'.format(
+                                                                    strError))
+            if iOutcome == OUTCOME_REDUNDANT and iChecked == iVersion:
+                objBoard.clearValue(iCell)
+                strPuzzle = objBoard.toString()
+                iVersion += 1
+                objVersion.value = iVersion
+            elif iOutcome != OUTCOME_NEEDED:
+                #moot - checked against an outdated puzzle
+                deqPending.append(iCell)
+    finally:
+        #stops the running checks as moot
+        objVersion.value = -1
+        objTasks.cancel_join_thread()
+        for _ in lstWorkers:
+            objTasks.put(None)
+        for objWorker in lstWorkers:
+            objWorker.join(JOIN_TIMEOUT)
+            if objWorker.is_alive():
+                objWorker.terminate()
+                objWorker.join()
+    return objBoard
@@ -0,0 +1,304 @@
+#!/usr/bin/python
+"""
+Module sudoku_py.core.savegame
+
+Implements the compact versioned binary format of the saved games (see
+sudoku_py.core.game.GameBoard). All integers are big-endian.
+
+    *) header - magic bytes 'SPSG', format version, box rows, box columns
+    *) number of the moves in the history - unsigned variable length integer
+    *) cells' values - packed at ceil(log2(N + 1)) bits per cell
+    *) givens - bitmap, one bit per cell
+    *) history - per move: the zigzag encoded difference of the cell index
+        from the previous move's cell as an unsigned variable length integer,
+        followed by the new value as one byte; the old values are restored by
+        replaying the moves from the givens
+    *) checksum - CRC-32 of all preceding bytes, 4 bytes
+
+A game is saved by a single write and loaded by a single read of the whole
+file.
+
+Functions:
+    PackBits()
+        list(int), int -> str
+    UnpackBits()
+        str, int, int -> list(int)
+    GetCellBits()
+        int -> int
+    DumpGame()
+        GameBoard -> str
+    LoadGameData()
+        str -> GameBoard
+    SaveGame()
+        GameBoard, file -> None
+    LoadGame()
+        file -> GameBoard
+"""
+
+__version__ = "0.0.1.0"
+__date__ = "16-10-2026"
+__status__ = "Development"
+
+__all__ = ['PackBits', 'UnpackBits', 'GetCellBits', 'DumpGame',
+            'LoadGameData', 'SaveGame', 'LoadGame']
+
+#imports
+
+#+ standard libraries
+
+import binascii
+import struct
+import zlib
+
+#+ other modules from the package
+
+from sudoku_py.core.board import SudokuBoard
+
+from sudoku_py.core.game import GameBoard
+
+#globals
+
+MAGIC = 'SPSG'
+
+FORMAT_VERSION = 1
+
+_objHeader = struct.Struct('>4sBBB')
+
+_objChecksum = struct.Struct('>I')
+
+#functions
+
+def PackBits(ilstValues, iBits):
+    """
+    Packs the non-negative integers at the fixed number of bits each, the
+    last byte is padded with zero bits.
+
+    Signature:
+        list(int), int -> str
+
+    Args:
+        ilstValues: list(int), the values, each less than 2 ** iBits
+        iBits: positive integer, number of bits per value
+
+    Returns:
+        str: the packed bytes
+    """
+    iBytes = (len(ilstValues) * iBits + 7) // 8
+    iAccumulator = 0
+    for iValue in ilstValues:
+        iAccumulator = (iAccumulator << iBits) | iValue
+    iAccumulator <<= iBytes * 8 - len(ilstValues) * iBits
+    if not iBytes:
+        return ''
+    return binascii.unhexlify('{:0{}x}'.format(iAccumulator, 2 * iBytes))
+
+def UnpackBits(strData, iCount, iBits):
+    """
+    Unpacks the fixed bit width integers packed by PackBits().
+
+    Signature:
+        str, int, int -> list(int)
+
+    Args:
+        strData: str, the packed bytes
+        iCount: non-negative integer, number of the values
+        iBits: positive integer, number of bits per value
+
+    Returns:
+        list(int): the values
+    """
+    if not iCount:
+        return []
+    iAccumulator = int(binascii.hexlify(strData), 16)
+    iAccumulator >>= len(strData) * 8 - iCount * iBits
+    iMask = (1 << iBits) - 1
+    ilstValues = [0] * iCount
+    for iIndex in xrange(iCount - 1, -1, -1):
+        ilstValues[iIndex] = iAccumulator & iMask
+        iAccumulator >>= iBits
+    return ilstValues
+
+def _EncodeVarInt(iValue, barrData):
+    """
+    Helper function to append an unsigned integer as a variable length
+    sequence of bytes (7 bits per byte, the high bit set on all bytes but the
+    last one).
+
+    Signature:
+        int, bytearray -> None
+    """
+    while iValue > 0x7F:
+        barrData.append((iValue & 0x7F) | 0x80)
+        iValue >>= 7
+    barrData.append(iValue)
+
+def _DecodeVarInt(barrData, iOffset):
+    """
+    Helper function to read an unsigned variable length integer.
+
+    Signature:
+        bytearray, int -> tuple(int, int)
+
+    Returns:
+        tuple(int, int): the value and the offset after it
+
+    Raises:
+        ValueError: the data is truncated
+    """
+    iValue = 0
+    iShift = 0
+    while True:
+        if iOffset >= len(barrData):
+            raise ValueError('Truncated saved game data')
+        iByte = barrData[iOffset]
+        iOffset += 1
+        iValue |= (iByte & 0x7F) << iShift
+        if iByte < 0x80:
+            return iValue, iOffset
+        iShift += 7
+
+def GetCellBits(iSize):
+    """
+    Calculates the number of bits per cell's value ceil(log2(N + 1)).
+
+    Signature:
+        int -> int
+
+    Args:
+        iSize: positive integer, the size of the board N
+
+    Returns:
+        int: number of bits
+    """
+    return iSize.bit_length()
+
+def DumpGame(objGame):
+    """
+    Serializes a game into the binary format.
+
+    Signature:
+        GameBoard -> str
+
+    Args:
+        objGame: sudoku_py.core.game.GameBoard instance
+
+    Returns:
+        str: the binary data
+    """
+    objPuzzle = objGame.Puzzle
+    iSize = objPuzzle.Size
+    lstHistory = objGame.History
+    barrData = bytearray(_objHeader.pack(MAGIC, FORMAT_VERSION,
+                                    objPuzzle.BoxRows, objPuzzle.BoxColumns))
+    _EncodeVarInt(len(lstHistory), barrData)
+    barrData.extend(PackBits(objGame.Values, GetCellBits(iSize)))
+    barrData.extend(PackBits([int(bool(iValue))
+                                    for iValue in objPuzzle.Values], 1))
+    iPrevious = 0
+    for iCell, _, iValue in lstHistory:
+        iDelta = iCell - iPrevious
+        _EncodeVarInt((iDelta << 1) if iDelta >= 0 else ((-iDelta << 1) - 1),
+                                                                    barrData)
+        barrData.append(iValue)
+        iPrevious = iCell
+    barrData.extend(_objChecksum.pack(zlib.crc32(bytes(barrData))
+                                                                & 0xFFFFFFFF))
+    return bytes(barrData)
+
+def LoadGameData(strData):
+    """
+    De-serializes a game from the binary format, the moves are replayed, thus
+    they can be undone.
+
+    Signature:
+        str -> GameBoard
+
+    Args:
+        strData: str, the binary data
+
+    Returns:
+        GameBoard: the restored game
+
+    Raises:
+        ValueError: the data is malformed, truncated or corrupted, or the
+            format version is not supported
+    """
+    iHeader = _objHeader.size
+    iTail = _objChecksum.size
+    if len(strData) < iHeader + iTail:
+        raise ValueError('Truncated saved game data')
+    strMagic, iVersion, iBoxRows, iBoxColumns = _objHeader.unpack(
+                                                            strData[:iHeader])
+    if strMagic != MAGIC:
+        raise ValueError('Not a saved game data')
+    if iVersion != FORMAT_VERSION:
+        raise ValueError('Unsupported saved game version {}'.format(iVersion))
+    (iChecksum, ) = _objChecksum.unpack(strData[-iTail:])
+    if zlib.crc32(strData[:-iTail]) & 0xFFFFFFFF != iChecksum:
+        raise ValueError('Saved game checksum mismatch')
+    objPuzzle = SudokuBoard(iBoxRows, iBoxColumns)
+    iSize = objPuzzle.Size
+    iCells = objPuzzle.Cells
+    barrData = bytearray(strData[:-iTail])
+    iMoves, iOffset = _DecodeVarInt(barrData, iHeader)
+    iCellBits = GetCellBits(iSize)
+    iValuesBytes = (iCells * iCellBits + 7) // 8
+    iGivensBytes = (iCells + 7) // 8
+    if iOffset + iValuesBytes + iGivensBytes > len(barrData):
+        raise ValueError('Truncated saved game data')
+    ilstValues = UnpackBits(strData[iOffset : iOffset + iValuesBytes],
+                                                            iCells, iCellBits)
+    iOffset += iValuesBytes
+    ilstGivens = UnpackBits(strData[iOffset : iOffset + iGivensBytes],
+                                                                    iCells, 1)
+    iOffset += iGivensBytes
+    for iCell, bGiven in enumerate(ilstGivens):
+        if bGiven:
+            objPuzzle.setValue(iCell, ilstValues[iCell])
+    objGame = GameBoard(objPuzzle)
+    iCell = 0
+    for _ in xrange(iMoves):
+        iZigZag, iOffset = _DecodeVarInt(barrData, iOffset)
+        if iOffset >= len(barrData):
+            raise ValueError('Truncated saved game data')
+        iCell += (iZigZag >> 1) if not (iZigZag & 1) else -((iZigZag + 1) >> 1)
+        try:
+            objGame.move(iCell, barrData[iOffset])
+        except IndexError:
+            raise ValueError('Improper move in saved game data')
+        iOffset += 1
+    if iOffset != len(barrData) or objGame.Values != ilstValues:
+        raise ValueError('Inconsistent saved game data')
+    return objGame
+
+def SaveGame(objGame, fFile):
+    """
+    Writes a game into a binary file object by a single write.
+
+    Signature:
+        GameBoard, file -> None
+
+    Args:
+        objGame: sudoku_py.core.game.GameBoard instance
+        fFile: file object opened for writing in the binary mode
+    """
+    fFile.write(DumpGame(objGame))
+
+def LoadGame(fFile):
+    """
+    Reads a game from a binary file object by a single read.
+
+    Signature:
+        file -> GameBoard
+
+    Args:
+        fFile: file object opened for reading in the binary mode
+
+    Returns:
+        GameBoard: the restored game
+
+    Raises:
+        ValueError: the data is malformed, truncated or corrupted, or the
+            format version is not supported
+    """
+    return LoadGameData(fFile.read())
@@ -0,0 +1,430 @@
+#!/usr/bin/python
+"""
+Module sudoku_py.core.solution_cache
+
+Implements the two-level cache of the puzzles' solutions placed in front of
+the solver engines. The entries are keyed by the hash of the canonical form of
+the puzzle (see sudoku_py.core.canonical), thus all equivalent puzzles share a
+single entry, and they hold the solution of the canonical form (or None for an
+unsolvable puzzle) and the difficulty rating (if known).
+
+    *) level 1 - in-process LRU dictionary with the bounded number of entries
+    *) level 2 - optional on-disk SQLite database, which persists between runs;
+        the entries found on the disk are promoted into the level 1
+
+The canonicalization of a puzzle to be solved is limited to CANONICAL_TIMEOUT
+seconds (see the method SolutionCache.solve()); a puzzle taking longer is
+solved directly, bypassing the cache, thus the hashing never eats up the time
+meant for the search.
+
+Classes:
+    CacheEntry
+    SolutionCache
+"""
+
+__version__ = "0.0.1.0"
+__date__ = "17-10-2026"
+__status__ = "Development"
+
+__all__ = ['CacheEntry', 'SolutionCache']
+
+#imports
+
+#+ standard libraries
+
+import collections
+import sqlite3
+import threading
+
+#+ other modules from the package
+
+from sudoku_py.core.board import SudokuBoard, ToBoard
+
+from sudoku_py.core.canonical import GetCanonicalMapping, HashBoard
+
+from sudoku_py.core.solvers import DEF_ENGINE, GetEngine
+
+from sudoku_py.core.rating import RatePuzzle
+
+from sudoku_py.core.solve_budget import (STATUS_COMPLETE, STATUS_TIMEOUT,
+                                    BudgetExceeded, SolveResult, SolveBudget)
+
+#globals
+
+DEF_CACHE_SIZE = 4096
+
+#+ the longest canonicalization of a puzzle to be solved, seconds
+
+CANONICAL_TIMEOUT = 0.5
+
+_SQL_CREATE = ('CREATE TABLE IF NOT EXISTS solutions '
+                        '(key TEXT PRIMARY KEY, solution TEXT, rating REAL)')
+
+_SQL_SELECT = 'SELECT solution, rating FROM solutions WHERE key = ?'
+
+_SQL_INSERT = ('INSERT OR REPLACE INTO solutions (key, solution, rating) '
+                                                            'VALUES (?, ?, ?)')
+
+#classes
+
+class CacheEntry(collections.namedtuple('CacheEntry', ['Solution', 'Rating'])):
+    """
+    Cached result of solving a puzzle, a named tuple.
+
+    Attributes:
+        Solution: SudokuBoard OR None, the solution, None if the puzzle has
+            no solution
+        Rating: int OR float OR None, the difficulty rating, None if unknown
+    """
+
+    __slots__ = ()
+
+class SolutionCache(object):
+    """
+    Two-level cache of the solutions. The method solve() looks up the cache
+    first and falls back to the solver engine, storing its result. An instance
+    can be shared by several threads, but not by several processes; the same
+    database file, however, can be opened by several processes.
+
+    Methods:
+        lookup(gPuzzle)
+            SudokuBoard OR str -> CacheEntry OR None
+        store(gPuzzle, objSolution, gRating = None)
+            SudokuBoard OR str, SudokuBoard OR None/, int OR float OR None/
+                -> None
+        solve(gPuzzle, strEngine = DEF_ENGINE, objBudget = None)
+            SudokuBoard OR str/, str, SolveBudget OR None/ -> CacheEntry
+        close()
+            None -> None
+
+    Attributes:
+        Hits: int, read-only property, number of the look-ups found in the
+            memory
+        DiskHits: int, read-only property, number of the look-ups found on the
+            disk only
+        Misses: int, read-only property, number of the look-ups not found
+        Size: int, read-only property, number of the entries in the memory
+    """
+
+    #special methods
+
+    def __init__(self, strPath = None, iMaxSize = DEF_CACHE_SIZE):
+        """
+        Initialization. The database file and its table are created if they do
+        not exist yet.
+
+        Signature:
+            /str OR None, int/ -> None
+
+        Args:
+            strPath: (optional) string, path to the SQLite database file, by
+                default only the in-memory level is used
+            iMaxSize: (optional) positive integer, the maximum number of the
+                entries kept in the memory, defaults to DEF_CACHE_SIZE
+
+        Raises:
+            TypeError: the maximum size is not an integer
+            ValueError: the maximum size is not positive
+            sqlite3.Error: the database cannot be opened or created
+        """
+        if not isinstance(iMaxSize, (int, long)):
+            raise TypeError('Not an integer cache size')
+        if iMaxSize < 1:
+            raise ValueError('Not positive cache size')
+        self._iMaxSize = iMaxSize
+        self._dictEntries = collections.OrderedDict()
+        self._objLock = threading.Lock()
+        self._iHits = 0
+        self._iDiskHits = 0
+        self._iMisses = 0
+        if strPath is None:
+            self._objDatabase = None
+        else:
+            self._objDatabase = sqlite3.connect(strPath,
+                                                check_same_thread = False)
+            self._objDatabase.execute(_SQL_CREATE)
+            self._objDatabase.commit()
+
+    def __enter__(self):
+        """
+        Entering the context manager.
+
+        Signature:
+            None -> SolutionCache
+        """
+        return self
+
+    def __exit__(self, *args):
+        """
+        Exiting the context manager - closes the database.
+
+        Signature:
+            type A, type B, type C -> None
+        """
+        self.close()
+
+    #helper methods
+
+    def _get(self, strKey):
+        """
+        Helper method to look up the raw entry (canonical solution string or
+        None, rating) by the key in both levels. An entry found is moved to the
+        most recently used position of the level 1.
+
+        Signature:
+            str -> tuple(str OR None, int OR float OR None) OR None
+        """
+        with self._objLock:
+            tupEntry = self._dictEntries.pop(strKey, None)
+            if tupEntry is not None:
+                self._iHits += 1
+            elif self._objDatabase is not None:
+                tupEntry = self._objDatabase.execute(_SQL_SELECT,
+                                                        (strKey, )).fetchone()
+                if tupEntry is not None:
+                    tupEntry = (tupEntry[0], tupEntry[1])
+                    self._iDiskHits += 1
+            if tupEntry is None:
+                self._iMisses += 1
+            else:
+                self._remember(strKey, tupEntry)
+        return tupEntry
+
+    def _remember(self, strKey, tupEntry):
+        """
+        Helper method to put an entry into the level 1, evicting the least
+        recently used entries if the maximum size is exceeded. Must be called
+        with the lock acquired.
+
+        Signature:
+            str, tuple(str OR None, int OR float OR None) -> None
+        """
+        dictEntries = self._dictEntries
+        dictEntries.pop(strKey, None)
+        dictEntries[strKey] = tupEntry
+        while len(dictEntries) > self._iMaxSize:
+            dictEntries.popitem(last = False)
+
+    def _put(self, strKey, tupEntry):
+        """
+        Helper method to store a raw entry in both levels.
+
+        Signature:
+            str, tuple(str OR None, int OR float OR None) -> None
+        """
+        with self._objLock:
+            self._remember(strKey, tupEntry)
+            if self._objDatabase is not None:
+                self._objDatabase.execute(_SQL_INSERT, (strKey, ) + tupEntry)
+                self._objDatabase.commit()
+
+    def _lookup(self, objMapping, strKey):
+        """
+        Helper method to look up a puzzle with the already calculated canonical
+        mapping and key.
+
+        Signature:
+            CanonicalMapping, str -> CacheEntry OR None
+        """
+        tupEntry = self._get(strKey)
+        if tupEntry is None:
+            return None
+        strSolution, gRating = tupEntry
+        if strSolution is None:
+            return CacheEntry(None, gRating)
+        objBoard = objMapping.Board
+        objSolution = SudokuBoard.fromString(strSolution, objBoard.BoxRows,
+                                                        objBoard.BoxColumns)
+        return CacheEntry(objMapping.toOriginal(objSolution), gRating)
+
+    def _store(self, objMapping, strKey, objSolution, gRating):
+        """
+        Helper method to store a solution with the already calculated canonical
+        mapping and key.
+
+        Signature:
+            CanonicalMapping, str, SudokuBoard OR None, int OR float OR None
+                -> None
+        """
+        if objSolution is None:
+            strSolution = None
+        else:
+            strSolution = objMapping.fromOriginal(objSolution).toString()
+        self._put(strKey, (strSolution, gRating))
+
+    #public API
+
+    #properties
+
+    @property
+    def Hits(self):
+        """
+        Getter property for the number of the look-ups found in the memory.
+
+        Signature:
+            None -> int
+        """
+        return self._iHits
+
+    @property
+    def DiskHits(self):
+        """
+        Getter property for the number of the look-ups found on the disk only.
+
+        Signature:
+            None -> int
+        """
+        return self._iDiskHits
+
+    @property
+    def Misses(self):
+        """
+        Getter property for the number of the look-ups not found.
+
+        Signature:
+            None -> int
+        """
+        return self._iMisses
+
+    @property
+    def Size(self):
+        """
+        Getter property for the number of the entries in the memory.
+
+        Signature:
+            None -> int
+        """
+        return len(self._dictEntries)
+
+    #+ methods
+
+    def lookup(self, gPuzzle):
+        """
+        Looks up the solution and the rating of a puzzle.
+
+        Signature:
+            SudokuBoard OR str -> CacheEntry OR None
+
+        Args:
+            gPuzzle: SudokuBoard instance or string, the puzzle definition
+
+        Returns:
+            CacheEntry: the solution of the puzzle (not of its canonical form)
+                and the rating, or None if the puzzle is not cached
+
+        Raises:
+            TypeError: the puzzle is neither a board nor a string
+            ValueError: the puzzle string is malformed
+        """
+        objMapping = GetCanonicalMapping(gPuzzle)
+        return self._lookup(objMapping, HashBoard(objMapping.Board))
+
+    def store(self, gPuzzle, objSolution, gRating = None):
+        """
+        Stores the solution and the rating of a puzzle in both levels.
+
+        Signature:
+            SudokuBoard OR str, SudokuBoard OR None/, int OR float OR None/
+                -> None
+
+        Args:
+            gPuzzle: SudokuBoard instance or string, the puzzle definition
+            objSolution: SudokuBoard instance, the solution of the puzzle, or
+                None if the puzzle has no solution
+            gRating: (optional) int or float, the difficulty rating, None
+                (default) if unknown
+
+        Raises:
+            TypeError: the puzzle is neither a board nor a string
+            ValueError: the puzzle string is malformed
+        """
+        objMapping = GetCanonicalMapping(gPuzzle)
+        self._store(objMapping, HashBoard(objMapping.Board), objSolution,
+                                                                        gRating)
+
+    def solve(self, gPuzzle, strEngine = DEF_ENGINE, objBudget = None):
+        """
+        Returns the cached solution of a puzzle, or solves it with the
+        specified engine, rates it (see sudoku_py.core.rating) and caches the
+        result. The canonical form is calculated only once per call; if it
+        takes longer than CANONICAL_TIMEOUT, the puzzle is solved and rated
+        without the cache. The budget covers the canonicalization and the
+        rating as well: if the canonicalization is cancelled or the search is
+        abandoned due to the budget's limit, nothing is cached; if the rating
+        is abandoned, the solution is cached without the rating.
+
+        Signature:
+            SudokuBoard OR str/, str, SolveBudget OR None/ -> CacheEntry
+
+        Args:
+            gPuzzle: SudokuBoard instance or string, the puzzle definition
+            strEngine: (optional) string, name of the solver engine, defaults to
+                DEF_ENGINE
+            objBudget: (optional) sudoku_py.core.solve_budget.SolveBudget
+                instance, the limits of the search, None (default) - unlimited
+
+        Returns:
+            CacheEntry: the solution (None if there is none) and the rating
+
+        Raises:
+            TypeError: the puzzle is neither a board nor a string
+            ValueError: the puzzle string is malformed, or the engine is
+                unknown
+            sudoku_py.core.solve_budget.BudgetExceeded: a limit of the budget
+                is reached, the partial result is attached
+        """
+        clsEngine = GetEngine(strEngine)
+        objBoard = ToBoard(gPuzzle)
+        if objBudget is None:
+            objToken = None
+        else:
+            objToken = objBudget.Token
+        try:
+            objMapping = GetCanonicalMapping(objBoard,
+                            SolveBudget(CANONICAL_TIMEOUT, objToken = objToken))
+        except BudgetExceeded as objError:
+            if objError.Reason != STATUS_TIMEOUT:
+                #the search has not started - the best state is the puzzle
+                raise BudgetExceeded(objError.Reason, SolveResult([],
+                                objError.Reason, objBoard.copy(), objBudget))
+            #too slow to hash - solved without the cache
+            objMapping = None
+        if objMapping is None:
+            objEntry = None
+        else:
+            strKey = HashBoard(objMapping.Board)
+            objEntry = self._lookup(objMapping, strKey)
+        if objEntry is None:
+            if objBudget is None:
+                lstSolutions = clsEngine(objBoard).solve(1)
+            else:
+                objResult = clsEngine(objBoard, objBudget).solveLimited(1,
+                                                                    objBudget)
+                if objResult.Status != STATUS_COMPLETE:
+                    raise BudgetExceeded(objResult.Status, objResult)
+                lstSolutions = objResult.Solutions
+            if lstSolutions:
+                objSolution = lstSolutions[0]
+                try:
+                    gRating = RatePuzzle(objBoard, objBudget).Rating
+                except BudgetExceeded:
+                    gRating = None
+            else:
+                objSolution = None
+                gRating = None
+            if objMapping is not None:
+                self._store(objMapping, strKey, objSolution, gRating)
+            objEntry = CacheEntry(objSolution, gRating)
+        return objEntry
+
+    def close(self):
+        """
+        Closes the database, the in-memory level remains usable.
+
+        Signature:
+            None -> None
+        """
+        with self._objLock:
+            if self._objDatabase is not None:
+                self._objDatabase.close()
+                self._objDatabase = None
@@ -0,0 +1,310 @@
+#!/usr/bin/python
+"""
+Module sudoku_py.core.solve_budget
+
+Implements the limits of a single solve call: the wall-clock deadline, the
+budget of the search tree nodes and the cooperative cancellation by another
+thread.
+
+The budget is a statistics collector (see sudoku_py.core.solver_stats), thus
+the engines check it at each visited node of the search tree without any
+changes. The node budget is checked at each node, the deadline and the
+cancellation - at every CHECK_EVERY nodes. When a limit is reached the
+BudgetExceeded exception is raised from inside the search, which is caught by
+SolverBase.solveLimited() and turned into a partial result.
+
+While the search goes deeper the budget keeps a snapshot of the engine's state
+(as a board) at the deepest branch point reached, which is returned as the
+best state, if no solution is found.
+
+Classes:
+    BudgetExceeded
+    CancelToken
+    SolveResult
+    SolveBudget
+"""
+
+__version__ = "0.0.1.0"
+__date__ = "16-10-2026"
+__status__ = "Development"
+
+__all__ = ['STATUS_COMPLETE', 'STATUS_TIMEOUT', 'STATUS_NODE_LIMIT',
+            'STATUS_CANCELLED', 'BudgetExceeded', 'CancelToken', 'SolveResult',
+            'SolveBudget']
+
+#imports
+
+#+ standard libraries
+
+import collections
+import threading
+
+#+ other modules from the package
+
+from sudoku_py.core.solver_stats import SolverStats, DEF_MAX_SAMPLES
+
+#globals
+
+STATUS_COMPLETE = 'complete'
+
+STATUS_TIMEOUT = 'timeout'
+
+STATUS_NODE_LIMIT = 'node limit'
+
+STATUS_CANCELLED = 'cancelled'
+
+#+ period (in nodes) of the deadline and cancellation checks
+
+CHECK_EVERY = 64
+
+#classes
+
+class BudgetExceeded(Exception):
+    """
+    Raised when a limit of a solve call is reached.
+
+    Attributes:
+        Reason: str, one of 'timeout', 'node limit', 'cancelled'
+        Result: SolveResult OR None, the partial result, if available
+    """
+
+    #special methods
+
+    def __init__(self, strReason, objResult = None):
+        """
+        Initialization.
+
+        Signature:
+            str/, SolveResult OR None/ -> None
+
+        Args:
+            strReason: string, the reached limit
+            objResult: (optional) SolveResult, the partial result
+        """
+        super(BudgetExceeded, self).__init__(strReason)
+        self.Reason = strReason
+        self.Result = objResult
+
+class CancelToken(object):
+    """
+    Thread-safe flag to request the cancellation of one or more solve calls
+    from another thread.
+
+    Methods:
+        cancel()
+            None -> None
+
+    Attributes:
+        Cancelled: bool, read-only property, the cancellation is requested
+    """
+
+    #special methods
+
+    def __init__(self):
+        """
+        Initialization.
+
+        Signature:
+            None -> None
+        """
+        self._objEvent = threading.Event()
+
+    #public API
+
+    #properties
+
+    @property
+    def Cancelled(self):
+        """
+        Getter property for the cancellation flag.
+
+        Signature:
+            None -> bool
+        """
+        return self._objEvent.is_set()
+
+    #+ methods
+
+    def cancel(self):
+        """
+        Requests the cancellation.
+
+        Signature:
+            None -> None
+        """
+        self._objEvent.set()
+
+class SolveResult(collections.namedtuple('SolveResult',
+                                    ['Solutions', 'Status', 'Best', 'Stats'])):
+    """
+    Result of a limited solve call, a named tuple.
+
+    Attributes:
+        Solutions: list(SudokuBoard), the solutions found
+        Status: str, 'complete' if the search is finished or the requested
+            number of solutions is found, otherwise the reached limit -
+            'timeout', 'node limit' or 'cancelled'
+        Best: SudokuBoard, the first solution, if any is found, otherwise the
+            deepest partial state reached (at least the puzzle itself)
+        Stats: SolveBudget, the statistics of the search
+    """
+
+    __slots__ = ()
+
+class SolveBudget(SolverStats):
+    """
+    Statistics collector, which enforces the limits of a solve call. The
+    deadline is counted from the instantiation.
+
+    Subclasses sudoku_py.core.solver_stats.SolverStats.
+
+    Methods:
+        enterNode(iDepth, iCell, iDigit)
+            int, int, int -> None
+        check()
+            None -> None
+        setSnapshot(funSnapshot)
+            callable() -> SudokuBoard OR None -> None
+        addTime(strPhase, gSeconds)
+            str, float -> None
+        reset()
+            None -> None
+        asDict()
+            None -> dict(str -> int OR float OR dict)
+
+    Attributes:
+        Elapsed: float, read-only property, seconds since the instantiation
+        Best: SudokuBoard OR None, read-only property, the deepest partial
+            state reached
+        Token: CancelToken OR None, read-only property, the cancellation token
+        (see also SolverStats)
+    """
+
+    #special methods
+
+    def __init__(self, gTimeout = None, iMaxNodes = None, objToken = None,
+                            iSampleEvery = 0, iMaxSamples = DEF_MAX_SAMPLES):
+        """
+        Initialization.
+
+        Signature:
+            /float OR None, int OR None, CancelToken OR None, int, int/ -> None
+
+        Args:
+            gTimeout: (optional) non-negative float, the wall-clock limit in
+                seconds, None (default) - unlimited
+            iMaxNodes: (optional) non-negative integer, the maximum number of
+                the visited nodes, None (default) - unlimited
+            objToken: (optional) CancelToken instance, None (default) - the
+                call cannot be cancelled
+            iSampleEvery: (optional) non-negative integer, every this node is
+                sampled, zero (default) - no sampling
+            iMaxSamples: (optional) non-negative integer, the sampling stops
+                when this number of the samples is collected
+
+        Raises:
+            ValueError: a negative argument
+        """
+        if ((gTimeout is not None and gTimeout < 0)
+                                or (iMaxNodes is not None and iMaxNodes < 0)):
+            raise ValueError('Negative solve budget')
+        super(SolveBudget, self).__init__(iSampleEvery, iMaxSamples)
+        self._gStart = self.Timer()
+        if gTimeout is None:
+            self._gDeadline = None
+        else:
+            self._gDeadline = self._gStart + gTimeout
+        self._iMaxNodes = iMaxNodes
+        self._objToken = objToken
+        self._funSnapshot = None
+        self._objBest = None
+
+    #public API
+
+    #properties
+
+    @property
+    def Elapsed(self):
+        """
+        Getter property for the time since the instantiation.
+
+        Signature:
+            None -> float
+        """
+        return self.Timer() - self._gStart
+
+    @property
+    def Best(self):
+        """
+        Getter property for the deepest partial state reached.
+
+        Signature:
+            None -> SudokuBoard OR None
+        """
+        return self._objBest
+
+    @property
+    def Token(self):
+        """
+        Getter property for the cancellation token.
+
+        Signature:
+            None -> CancelToken OR None
+        """
+        return self._objToken
+
+    #+ methods
+
+    def setSnapshot(self, funSnapshot):
+        """
+        Sets the function, which returns the current state of the engine as a
+        board; it is called each time a new depth is reached.
+
+        Signature:
+            callable() -> SudokuBoard OR None -> None
+
+        Args:
+            funSnapshot: callable without arguments, or None to stop the
+                snapshots
+        """
+        self._funSnapshot = funSnapshot
+
+    def check(self):
+        """
+        Checks the cancellation and the deadline.
+
+        Signature:
+            None -> None
+
+        Raises:
+            BudgetExceeded: the call is cancelled or the deadline is passed
+        """
+        if self._objToken is not None and self._objToken.Cancelled:
+            raise BudgetExceeded(STATUS_CANCELLED)
+        if self._gDeadline is not None and self.Timer() > self._gDeadline:
+            raise BudgetExceeded(STATUS_TIMEOUT)
+
+    def enterNode(self, iDepth, iCell, iDigit):
+        """
+        Registers a visited node of the search tree and checks the limits.
+
+        Signature:
+            int, int, int -> None
+
+        Args:
+            iDepth: positive integer, the depth of the branch point
+            iCell: non-negative integer, flat index of the cell
+            iDigit: positive integer, the digit tentatively placed
+
+        Raises:
+            BudgetExceeded: a limit is reached
+        """
+        if iDepth > self.MaxDepth and self._funSnapshot is not None:
+            objBoard = self._funSnapshot()
+            if self._objBest is None or objBoard.Filled > self._objBest.Filled:
+                self._objBest = objBoard
+        super(SolveBudget, self).enterNode(iDepth, iCell, iDigit)
+        if self._iMaxNodes is not None and self.Nodes > self._iMaxNodes:
+            raise BudgetExceeded(STATUS_NODE_LIMIT)
+        if not (self.Nodes % CHECK_EVERY):
+            self.check()
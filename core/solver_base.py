@@ -0,0 +1,356 @@
+#!/usr/bin/python
+"""
+Module sudoku_py.core.solver_base
+
+Implements the prototype class of the sudoku solver engines, which defines the
+common API shared by all engines.
+
+Classes:
+    SolverBase
+"""
+
+__version__ = "0.0.1.0"
+__date__ = "16-10-2026"
+__status__ = "Development"
+
+__all__ = ['SolverBase']
+
+#imports
+
+#+ other modules from the package
+
+from sudoku_py.core.board import ToBoard
+
+from sudoku_py.core.solver_stats import PHASE_SEARCH
+
+from sudoku_py.core.solve_budget import (STATUS_COMPLETE, BudgetExceeded,
+                                                    SolveResult, SolveBudget)
+
+#functions
+
+def _CheckLimit(iLimit):
+    """
+    Helper function to check the limit on the number of solutions.
+
+    Signature:
+        int OR None -> None
+
+    Raises:
+        TypeError: the limit is not an integer or None
+        ValueError: the limit is not positive
+    """
+    if not (iLimit is None or isinstance(iLimit, (int, long))):
+        raise TypeError('Not an integer limit of solutions')
+    if not (iLimit is None) and iLimit < 1:
+        raise ValueError('Not positive limit of solutions')
+
+#classes
+
+class SolverBase(object):
+    """
+    Prototype class of a solver engine bound to a single puzzle. The subclasses
+    must re-define the 'private' class attribute _strName - the name of the
+    engine - and implement the 'private' methods _search() and _makeSolution().
+
+    The generator method _search() must perform the search and yield (None)
+    each time a solution is reached, keeping that solution in the engine's
+    internal state until the search is resumed. The method _makeSolution()
+    must convert that internal state into a board. Thus the solutions are
+    counted without being materialized as boards.
+
+    An optional statistics collector (see sudoku_py.core.solver_stats) can be
+    attached upon instantiation. The base class times the search and counts
+    the solutions; the sub-classes must time their set-up and count the nodes,
+    checking the collector for None only once per search or per node. The
+    limits of a solve call (see sudoku_py.core.solve_budget) are enforced via
+    the same collector interface.
+
+    Methods:
+        iterSolutions()
+            None -> generator(SudokuBoard)
+        solve(iMaxSolutions = 1)
+            /int OR None/ -> list(SudokuBoard)
+        countSolutions(iLimit = 2)
+            /int OR None/ -> int
+        solveLimited(iMaxSolutions = 1, objBudget = None)
+            /int OR None, SolveBudget OR None/ -> SolveResult
+
+    Attributes:
+        Name: str, read-only property, name of the engine
+        Puzzle: SudokuBoard, read-only property, the puzzle being solved
+        Stats: SolverStats OR None, read-only property, the attached
+            statistics collector
+    """
+
+    #class fields
+
+    _strName = 'Prototype'
+
+    #special methods
+
+    def __init__(self, gPuzzle, objStats = None):
+        """
+        Stores the puzzle to be solved and the statistics collector.
+
+        Signature:
+            SudokuBoard OR str/, SolverStats OR None/ -> None
+
+        Args:
+            gPuzzle: SudokuBoard instance or string, the puzzle definition
+            objStats: (optional) sudoku_py.core.solver_stats.SolverStats
+                instance, the statistics collector, None (default) - no
+                statistics are collected
+
+        Raises:
+            TypeError: the argument is neither a board nor a string
+            ValueError: the string is not a proper puzzle definition
+        """
+        self._objBoard = ToBoard(gPuzzle)
+        self._objStats = objStats
+
+    #helper methods
+
+    def _search(self):
+        """
+        Helper generator method, which performs the search and yields (None)
+        each time a solution is reached. Must be implemented by the
+        sub-classes.
+
+        Signature:
+            None -> generator(None)
+
+        Raises:
+            NotImplementedError: the method is not re-defined
+        """
+        raise NotImplementedError('{} engine does not implement {}'.format(
+                                                    self._strName, '_search()'))
+
+    def _makeSolution(self):
+        """
+        Helper method to create a solved board from the internal state of the
+        engine, when a solution is reached. Must be implemented by the
+        sub-classes.
+
+        Signature:
+            None -> SudokuBoard
+
+        Raises:
+            NotImplementedError: the method is not re-defined
+        """
+        raise NotImplementedError('{} engine does not implement {}'.format(
+                                            self._strName, '_makeSolution()'))
+
+    def _makePartial(self):
+        """
+        Helper method to create a board from the internal state of the engine
+        in the middle of the search, i.e. the puzzle with the currently placed
+        digits. The sub-classes should re-define it, by default the copy of the
+        puzzle is returned.
+
+        Signature:
+            None -> SudokuBoard
+        """
+        return self._objBoard.copy()
+
+    def _timeSearch(self, objStats):
+        """
+        Helper generator method, which wraps the search, adding the time spent
+        inside it to the 'search' phase and counting the solutions.
+
+        Signature:
+            SolverStats -> generator(None)
+        """
+        fTimer = objStats.Timer
+        itSearch = self._search()
+        try:
+            while True:
+                gStart = fTimer()
+                try:
+                    next(itSearch)
+                except StopIteration:
+                    return
+                finally:
+                    objStats.addTime(PHASE_SEARCH, fTimer() - gStart)
+                objStats.Solutions += 1
+                yield None
+        finally:
+            itSearch.close()
+
+    def _runSearch(self):
+        """
+        Helper method to start the search, timed if a statistics collector is
+        attached.
+
+        Signature:
+            None -> generator(None)
+        """
+        if self._objStats is None:
+            return self._search()
+        return self._timeSearch(self._objStats)
+
+    #public API
+
+    #properties
+
+    @property
+    def Name(self):
+        """
+        Getter property for the name of the engine.
+
+        Signature:
+            None -> str
+        """
+        return self._strName
+
+    @property
+    def Puzzle(self):
+        """
+        Getter property for the puzzle being solved.
+
+        Signature:
+            None -> SudokuBoard
+        """
+        return self._objBoard
+
+    @property
+    def Stats(self):
+        """
+        Getter property for the attached statistics collector.
+
+        Signature:
+            None -> SolverStats OR None
+        """
+        return self._objStats
+
+    #+ methods
+
+    def iterSolutions(self):
+        """
+        Generator method, which performs the search and yields the solutions
+        as they are found.
+
+        Signature:
+            None -> generator(SudokuBoard)
+
+        Yields:
+            SudokuBoard: a solution of the puzzle
+        """
+        for _ in self._runSearch():
+            yield self._makeSolution()
+
+    def solve(self, iMaxSolutions = 1):
+        """
+        Finds up to the requested number of solutions of the puzzle.
+
+        Signature:
+            /int OR None/ -> list(SudokuBoard)
+
+        Args:
+            iMaxSolutions: (optional) positive integer or None, the maximum
+                number of solutions to find, None means all solutions; defaults
+                to 1
+
+        Returns:
+            list(SudokuBoard): found solutions, empty list if there are none
+
+        Raises:
+            TypeError: the maximum number of solutions is not an integer or
+                None
+            ValueError: the maximum number of solutions is not positive
+        """
+        _CheckLimit(iMaxSolutions)
+        lstSolutions = []
+        for objSolution in self.iterSolutions():
+            lstSolutions.append(objSolution)
+            if len(lstSolutions) == iMaxSolutions:
+                break
+        return lstSolutions
+
+    def countSolutions(self, iLimit = 2):
+        """
+        Counts the solutions of the puzzle without creating the solved boards.
+        The search stops as soon as the limit is reached, e.g. with the
+        default limit the result is 0, 1 or 2 (more than one solution).
+
+        Signature:
+            /int OR None/ -> int
+
+        Args:
+            iLimit: (optional) positive integer or None, the maximum number of
+                solutions to count, None means all solutions; defaults to 2
+
+        Returns:
+            int: number of the found solutions, not exceeding the limit
+
+        Raises:
+            TypeError: the limit is not an integer or None
+            ValueError: the limit is not positive
+        """
+        _CheckLimit(iLimit)
+        iCount = 0
+        for _ in self._runSearch():
+            iCount += 1
+            if iCount == iLimit:
+                break
+        return iCount
+
+    def solveLimited(self, iMaxSolutions = 1, objBudget = None):
+        """
+        Finds up to the requested number of solutions of the puzzle within the
+        limits of a budget. When a limit is reached the search is abandoned
+        and the partial result is returned. During the call the budget is
+        attached as the statistics collector instead of the engine's own one.
+
+        Signature:
+            /int OR None, SolveBudget OR None/ -> SolveResult
+
+        Args:
+            iMaxSolutions: (optional) positive integer or None, the maximum
+                number of solutions to find, None means all solutions; defaults
+                to 1
+            objBudget: (optional) sudoku_py.core.solve_budget.SolveBudget
+                instance, by default the attached collector is used, if it is
+                a budget, otherwise the search is unlimited
+
+        Returns:
+            SolveResult: the solutions found, the status ('complete' or the
+                reached limit), the best state and the statistics
+
+        Raises:
+            TypeError: the maximum number of solutions is not an integer or
+                None
+            ValueError: the maximum number of solutions is not positive
+        """
+        _CheckLimit(iMaxSolutions)
+        if objBudget is None:
+            if isinstance(self._objStats, SolveBudget):
+                objBudget = self._objStats
+            else:
+                objBudget = SolveBudget()
+        objSaved = self._objStats
+        self._objStats = objBudget
+        objBudget.setSnapshot(self._makePartial)
+        lstSolutions = []
+        strStatus = STATUS_COMPLETE
+        try:
+            objBudget.check()
+            itSolutions = self.iterSolutions()
+            try:
+                for objSolution in itSolutions:
+                    lstSolutions.append(objSolution)
+                    if len(lstSolutions) == iMaxSolutions:
+                        break
+            finally:
+                itSolutions.close()
+        except BudgetExceeded as objError:
+            strStatus = objError.Reason
+        finally:
+            self._objStats = objSaved
+            objBudget.setSnapshot(None)
+        if lstSolutions:
+            objBest = lstSolutions[0]
+        elif objBudget.Best is not None:
+            objBest = objBudget.Best
+        else:
+            objBest = self._objBoard.copy()
+        return SolveResult(lstSolutions, strStatus, objBest, objBudget)
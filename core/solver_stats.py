@@ -0,0 +1,219 @@
+#!/usr/bin/python
+"""
+Module sudoku_py.core.solver_stats
+
+Implements the optional statistics collector of the solver engines. A
+collector is passed to the engine upon instantiation and it accumulates:
+
+    *) nodes - number of the search tree nodes visited, i.e. the tentative
+        placements made at the branch points
+    *) backtracks - number of the nodes, which led to a contradiction
+    *) propagations - number of the constraint propagation runs (engines
+        without the propagation do not report them)
+    *) max depth - the deepest branch point reached
+    *) solutions - number of the solutions reached
+    *) time per phase - 'setup' (building of the engine's state), 'search'
+        (the whole search, excluding the time spent by the caller between the
+        solutions) and 'propagation' (part of the search spent in the
+        constraint propagation); thus the branching time is the difference
+        between the 'search' and 'propagation' phases
+    *) optionally - every k-th node of the search tree as a sample
+
+The engines look up their collector only once per search and check it for
+None on the hot path, thus without a collector attached no attribute look-ups
+or calls are made per node. A single collector can be shared by several
+solvers run one after another, e.g. over a batch of the puzzles.
+
+Classes:
+    TreeSample
+    SolverStats
+"""
+
+__version__ = "0.0.1.0"
+__date__ = "16-10-2026"
+__status__ = "Development"
+
+__all__ = ['PHASE_SETUP', 'PHASE_SEARCH', 'PHASE_PROPAGATION', 'TreeSample',
+            'SolverStats']
+
+#imports
+
+#+ standard libraries
+
+import collections
+import timeit
+
+#globals
+
+PHASE_SETUP = 'setup'
+
+PHASE_SEARCH = 'search'
+
+PHASE_PROPAGATION = 'propagation'
+
+DEF_MAX_SAMPLES = 10000
+
+#classes
+
+class TreeSample(collections.namedtuple('TreeSample',
+                                        ['Node', 'Depth', 'Cell', 'Digit'])):
+    """
+    Sampled node of the search tree, a named tuple.
+
+    Attributes:
+        Node: int, the ordinal number of the node (from 1)
+        Depth: int, the depth of the branch point (from 1)
+        Cell: int, flat index of the cell
+        Digit: int, the digit tentatively placed
+    """
+
+    __slots__ = ()
+
+class SolverStats(object):
+    """
+    Accumulator of the search statistics of the solver engines. The counters
+    are public attributes updated by the engines directly; the timer used for
+    the phases is timeit.default_timer.
+
+    Methods:
+        enterNode(iDepth, iCell, iDigit)
+            int, int, int -> None
+        addTime(strPhase, gSeconds)
+            str, float -> None
+        reset()
+            None -> None
+        asDict()
+            None -> dict(str -> int OR float OR dict)
+
+    Attributes:
+        Nodes: int, number of the visited nodes
+        Backtracks: int, number of the nodes led to a contradiction
+        Propagations: int, number of the constraint propagation runs
+        MaxDepth: int, the deepest branch point reached
+        Solutions: int, number of the solutions reached
+        Times: dict(str -> float), seconds spent per phase
+        Samples: list(TreeSample), the sampled nodes
+        SampleEvery: int, read-only property, the sampling period, zero if the
+            sampling is disabled
+    """
+
+    #class fields
+
+    Timer = staticmethod(timeit.default_timer)
+
+    #special methods
+
+    def __init__(self, iSampleEvery = 0, iMaxSamples = DEF_MAX_SAMPLES):
+        """
+        Initialization.
+
+        Signature:
+            /int, int/ -> None
+
+        Args:
+            iSampleEvery: (optional) non-negative integer, every this node is
+                sampled, zero (default) - no sampling
+            iMaxSamples: (optional) non-negative integer, the sampling stops
+                when this number of the samples is collected
+
+        Raises:
+            ValueError: a negative argument
+        """
+        if iSampleEvery < 0 or iMaxSamples < 0:
+            raise ValueError('Negative sampling parameter')
+        self._iSampleEvery = iSampleEvery
+        self._iMaxSamples = iMaxSamples
+        self.reset()
+
+    def __str__(self):
+        """
+        Returns a single line summary.
+
+        Signature:
+            None -> str
+        """
+        gSearch = self.Times.get(PHASE_SEARCH, 0.0)
+        gPropagation = self.Times.get(PHASE_PROPAGATION, 0.0)
+        return ('nodes {}, backtracks {}, propagations {}, max depth {}, '
+                'solutions {}, setup {:.6f} s, search {:.6f} s '
+                '(propagation {:.6f} s)').format(self.Nodes, self.Backtracks,
+                        self.Propagations, self.MaxDepth, self.Solutions,
+                        self.Times.get(PHASE_SETUP, 0.0), gSearch, gPropagation)
+
+    #public API
+
+    #properties
+
+    @property
+    def SampleEvery(self):
+        """
+        Getter property for the sampling period.
+
+        Signature:
+            None -> int
+        """
+        return self._iSampleEvery
+
+    #+ methods
+
+    def enterNode(self, iDepth, iCell, iDigit):
+        """
+        Registers a visited node of the search tree.
+
+        Signature:
+            int, int, int -> None
+
+        Args:
+            iDepth: positive integer, the depth of the branch point
+            iCell: non-negative integer, flat index of the cell
+            iDigit: positive integer, the digit tentatively placed
+        """
+        self.Nodes += 1
+        if iDepth > self.MaxDepth:
+            self.MaxDepth = iDepth
+        if (self._iSampleEvery and not (self.Nodes % self._iSampleEvery)
+                                and len(self.Samples) < self._iMaxSamples):
+            self.Samples.append(TreeSample(self.Nodes, iDepth, iCell, iDigit))
+
+    def addTime(self, strPhase, gSeconds):
+        """
+        Adds the time spent in a phase.
+
+        Signature:
+            str, float -> None
+
+        Args:
+            strPhase: string, name of the phase
+            gSeconds: non-negative float, the time in seconds
+        """
+        self.Times[strPhase] = self.Times.get(strPhase, 0.0) + gSeconds
+
+    def reset(self):
+        """
+        Clears all counters, times and samples.
+
+        Signature:
+            None -> None
+        """
+        self.Nodes = 0
+        self.Backtracks = 0
+        self.Propagations = 0
+        self.MaxDepth = 0
+        self.Solutions = 0
+        self.Times = dict()
+        self.Samples = []
+
+    def asDict(self):
+        """
+        Returns the counters and times as a JSON serializable dictionary, the
+        samples are not included.
+
+        Signature:
+            None -> dict(str -> int OR float OR dict)
+        """
+        return {'nodes' : self.Nodes,
+                'backtracks' : self.Backtracks,
+                'propagations' : self.Propagations,
+                'max_depth' : self.MaxDepth,
+                'solutions' : self.Solutions,
+                'times' : dict(self.Times)}
@@ -0,0 +1,310 @@
+#!/usr/bin/python
+"""
+Module sudoku_py.core.solvers
+
+Common entry point to all solver engines, which share the same API. The engine
+is selected by its name, thus the engines can be benchmarked against each other
+on the same puzzles.
+
+Functions:
+    GetEngine()
+        str -> class SolverBase
+    PickEngine()
+        int -> str
+    Solve()
+        SudokuBoard OR str/, int OR None, str, SolverStats OR None/
+            -> list(SudokuBoard)
+    SolveLimited()
+        SudokuBoard OR str/, int OR None, str, float OR None, int OR None,
+            CancelToken OR None/ -> SolveResult
+    IterSolutions()
+        SudokuBoard OR str/, str, SolverStats OR None/
+            -> generator(SudokuBoard)
+    CountSolutions()
+        SudokuBoard OR str/, int OR None, int OR None/ -> int
+"""
+
+__version__ = "0.0.1.0"
+__date__ = "17-10-2026"
+__status__ = "Development"
+
+__all__ = ['ENGINES', 'DEF_ENGINE', 'LARGE_ENGINE', 'LARGE_SIZE', 'GetEngine',
+            'PickEngine', 'Solve', 'SolveLimited', 'IterSolutions',
+            'CountSolutions']
+
+#imports
+
+#+ standard libraries
+
+import multiprocessing
+import threading
+
+#+ other modules from the package
+
+from sudoku_py.core.board import SudokuBoard, ToBoard
+
+from sudoku_py.core.dlx_solver import DLXSolver
+
+from sudoku_py.core.propagation_solver import PropagationSolver
+
+from sudoku_py.core.cdcl_solver import CDCLSolver
+
+from sudoku_py.core.solve_budget import SolveBudget
+
+#globals
+
+ENGINES = dict((clsEngine._strName, clsEngine)
+                                for clsEngine in (DLXSolver, PropagationSolver,
+                                                                CDCLSolver))
+
+DEF_ENGINE = 'propagation'
+
+#+ the engine learning from the conflicts and the board size, from which it
+#+ outperforms the backtracking engines
+
+LARGE_ENGINE = 'cdcl'
+
+LARGE_SIZE = 25
+
+#+ per thread cache of the counting solvers, one per box shape
+
+_objCounters = threading.local()
+
+#functions
+
+def GetEngine(strEngine):
+    """
+    Looks up the solver engine class by its name.
+
+    Signature:
+        str -> class SolverBase
+
+    Args:
+        strEngine: string, name of the engine, see the keys of ENGINES
+
+    Returns:
+        class SolverBase: the engine class
+
+    Raises:
+        ValueError: unknown engine name
+    """
+    clsEngine = ENGINES.get(strEngine, None)
+    if clsEngine is None:
+        raise ValueError('Unknown solver engine {!r}'.format(strEngine))
+    return clsEngine
+
+def PickEngine(iSize):
+    """
+    Selects the engine suitable for the board size: DEF_ENGINE for the small
+    boards and LARGE_ENGINE from the size LARGE_SIZE.
+
+    Signature:
+        int -> str
+
+    Args:
+        iSize: positive integer, the size N of the N x N board
+
+    Returns:
+        str: name of the engine
+    """
+    if iSize >= LARGE_SIZE:
+        return LARGE_ENGINE
+    return DEF_ENGINE
+
+def Solve(gPuzzle, iMaxSolutions = 1, strEngine = DEF_ENGINE,
+                                                            objStats = None):
+    """
+    Finds up to the requested number of solutions of a puzzle using the
+    specified engine.
+
+    Signature:
+        SudokuBoard OR str/, int OR None, str, SolverStats OR None/
+            -> list(SudokuBoard)
+
+    Args:
+        gPuzzle: SudokuBoard instance or string, the puzzle definition
+        iMaxSolutions: (optional) positive integer or None, the maximum number
+            of solutions to find, None means all solutions; defaults to 1
+        strEngine: (optional) string, name of the engine, defaults to
+            DEF_ENGINE
+        objStats: (optional) sudoku_py.core.solver_stats.SolverStats
+            instance, the statistics collector to attach to the engine
+
+    Returns:
+        list(SudokuBoard): found solutions, empty list if there are none
+
+    Raises:
+        TypeError: the puzzle is neither a board nor a string, or the maximum
+            number of solutions is not an integer or None
+        ValueError: the puzzle string is malformed, the maximum number of
+            solutions is not positive, or the engine is unknown
+    """
+    return GetEngine(strEngine)(gPuzzle, objStats).solve(iMaxSolutions)
+
+def SolveLimited(gPuzzle, iMaxSolutions = 1, strEngine = DEF_ENGINE,
+                            gTimeout = None, iMaxNodes = None, objToken = None):
+    """
+    Finds up to the requested number of solutions of a puzzle using the
+    specified engine within the wall-clock and the nodes limits, see
+    sudoku_py.core.solve_budget. The deadline includes the set-up of the
+    engine.
+
+    Signature:
+        SudokuBoard OR str/, int OR None, str, float OR None, int OR None,
+            CancelToken OR None/ -> SolveResult
+
+    Args:
+        gPuzzle: SudokuBoard instance or string, the puzzle definition
+        iMaxSolutions: (optional) positive integer or None, the maximum number
+            of solutions to find, None means all solutions; defaults to 1
+        strEngine: (optional) string, name of the engine, defaults to
+            DEF_ENGINE
+        gTimeout: (optional) non-negative float, the wall-clock limit in
+            seconds, None (default) - unlimited
+        iMaxNodes: (optional) non-negative integer, the maximum number of the
+            visited search tree nodes, None (default) - unlimited
+        objToken: (optional) sudoku_py.core.solve_budget.CancelToken instance
+            to cancel the call from another thread
+
+    Returns:
+        SolveResult: the solutions found, the status ('complete' or the
+            reached limit), the best state and the statistics
+
+    Raises:
+        TypeError: the puzzle is neither a board nor a string, or the maximum
+            number of solutions is not an integer or None
+        ValueError: the puzzle string is malformed, the maximum number of
+            solutions is not positive, a limit is negative, or the engine is
+            unknown
+    """
+    clsEngine = GetEngine(strEngine)
+    objBudget = SolveBudget(gTimeout, iMaxNodes, objToken)
+    return clsEngine(gPuzzle, objBudget).solveLimited(iMaxSolutions, objBudget)
+
+def IterSolutions(gPuzzle, strEngine = DEF_ENGINE, objStats = None):
+    """
+    Generator function, which lazily yields all solutions of a puzzle found by
+    the specified engine. Each solution is found only when the next one is
+    requested, thus the under-constrained puzzles can be enumerated in the
+    constant memory, and the enumeration can be stopped at any moment.
+
+    Signature:
+        SudokuBoard OR str/, str, SolverStats OR None/
+            -> generator(SudokuBoard)
+
+    Args:
+        gPuzzle: SudokuBoard instance or string, the puzzle definition
+        strEngine: (optional) string, name of the engine, defaults to
+            DEF_ENGINE
+        objStats: (optional) sudoku_py.core.solver_stats.SolverStats
+            instance, the statistics collector to attach to the engine
+
+    Yields:
+        SudokuBoard: a solution of the puzzle
+
+    Raises:
+        TypeError: the puzzle is neither a board nor a string
+        ValueError: the puzzle string is malformed, or the engine is unknown
+    """
+    objEngine = GetEngine(strEngine)(gPuzzle, objStats)
+    for objSolution in objEngine.iterSolutions():
+        yield objSolution
+
+def _CountSubtree(tupArgs):
+    """
+    Helper function executed in a worker process. Counts the solutions of a
+    sub-puzzle.
+
+    Signature:
+        tuple(str, int, int, int OR None) -> int
+    """
+    strPuzzle, iBoxRows, iBoxColumns, iLimit = tupArgs
+    return CountSolutions(SudokuBoard.fromString(strPuzzle, iBoxRows,
+                                                        iBoxColumns), iLimit)
+
+def _CountParallel(objBoard, iLimit, iProcesses):
+    """
+    Helper function to count the solutions of a puzzle in a pool of the worker
+    processes, splitting it on the first branching cell.
+
+    Signature:
+        SudokuBoard, int OR None, int OR None -> int
+    """
+    if not (iLimit is None or isinstance(iLimit, (int, long))):
+        raise TypeError('Not an integer limit of solutions')
+    if not (iLimit is None) and iLimit < 1:
+        raise ValueError('Not positive limit of solutions')
+    if iProcesses is None:
+        iProcesses = multiprocessing.cpu_count()
+    if iProcesses < 1:
+        raise ValueError('Not positive number of processes')
+    lstPuzzles = PropagationSolver(objBoard).branch()
+    if len(lstPuzzles) < 2:
+        #contradiction or solved by the propagation alone
+        return len(lstPuzzles)
+    tupShape = (objBoard.BoxRows, objBoard.BoxColumns)
+    objPool = multiprocessing.Pool(min(iProcesses, len(lstPuzzles)))
+    try:
+        iCount = 0
+        for iSubCount in objPool.imap_unordered(_CountSubtree,
+                                [(objPuzzle.toString(), ) + tupShape + (iLimit,)
+                                                for objPuzzle in lstPuzzles]):
+            iCount += iSubCount
+            if iLimit is not None and iCount >= iLimit:
+                iCount = iLimit
+                break
+        objPool.close()
+    finally:
+        objPool.terminate()
+        objPool.join()
+    return iCount
+
+def CountSolutions(gPuzzle, iLimit = 2, iProcesses = 1):
+    """
+    Counts the solutions of a puzzle, stopping as soon as the limit is reached.
+    With the default limit the result is 0 (no solution), 1 (unique solution)
+    or 2 (more than one solution).
+
+    This is the inner loop of the puzzle generators, thus no per call set-up is
+    done: a single propagation solver per box shape (and per thread) is kept
+    and re-loaded with each puzzle (see PropagationSolver.reset()), and the
+    solutions are counted without being converted into boards.
+
+    Optionally the puzzle is split on its first branching cell (after the
+    propagation of the singles) and the sub-puzzles are counted in a pool of
+    the worker processes, which pays off for counting all solutions of the
+    sparse puzzles.
+
+    Signature:
+        SudokuBoard OR str/, int OR None, int OR None/ -> int
+
+    Args:
+        gPuzzle: SudokuBoard instance or string, the puzzle definition
+        iLimit: (optional) positive integer or None, the maximum number of
+            solutions to count, None means all solutions; defaults to 2
+        iProcesses: (optional) positive integer or None, number of the worker
+            processes, None means the number of the CPUs; defaults to 1 - the
+            solutions are counted in the current process
+
+    Returns:
+        int: number of the found solutions, not exceeding the limit
+
+    Raises:
+        TypeError: the puzzle is neither a board nor a string, or the limit is
+            not an integer or None
+        ValueError: the puzzle string is malformed, the limit or the number
+            of the processes is not positive
+    """
+    objBoard = ToBoard(gPuzzle)
+    if iProcesses != 1:
+        return _CountParallel(objBoard, iLimit, iProcesses)
+    tupShape = (objBoard.BoxRows, objBoard.BoxColumns)
+    dictCache = getattr(_objCounters, 'dictSolvers', None)
+    if dictCache is None:
+        dictCache = _objCounters.dictSolvers = dict()
+    objSolver = dictCache.get(tupShape, None)
+    if objSolver is None:
+        objSolver = dictCache[tupShape] = PropagationSolver(objBoard)
+    else:
+        objSolver.reset(objBoard)
+    return objSolver.countSolutions(iLimit)
@@ -0,0 +1,484 @@
+#!/usr/bin/python
+"""
+Module sudoku_py.core.vector_batch
+
+Implements the optional NumPy backend, which applies the singles propagation
+to a whole batch of B puzzles of the same box shape at once. The batch is held
+as a (B, N, N) integer array of the cells' values; the row, column and box
+masks, the candidates' bitsets, the naked and hidden singles and the
+contradictions are all computed with the array operations over the whole
+batch, instead of looping over the puzzles in Python.
+
+The main use is the pre-filtering of large collections: the puzzles solved or
+refuted by the propagation alone are sorted out before any per-puzzle search.
+If NumPy is not installed, the function Prefilter() falls back to the pure
+Python propagation engine (see PropagationSolver.reduce()) with the same
+results.
+
+Classes:
+    BoardBatch
+
+Functions:
+    Prefilter()
+        iterable(SudokuBoard OR str)/, int/
+            -> generator(tuple(str, SudokuBoard OR None))
+"""
+
+__version__ = "0.0.1.0"
+__date__ = "16-10-2026"
+__status__ = "Development"
+
+__all__ = ['HAS_NUMPY', 'BoardBatch', 'Prefilter']
+
+#imports
+
+#+ other libraries
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+#+ other modules from the package
+
+from sudoku_py.core.board import SudokuBoard, ToBoard
+
+from sudoku_py.core.propagation_solver import PropagationSolver
+
+from sudoku_py.core.batch_solver import STATUS_SOLVED, STATUS_UNSOLVABLE
+
+#globals
+
+HAS_NUMPY = numpy is not None
+
+#+ the puzzle is neither solved nor refuted by the propagation
+
+STATUS_OPEN = 'open'
+
+#+ the memory use of a batch grows as B * N ** 3 bytes
+
+DEF_BATCH_SIZE = 4096
+
+#+ board size up to which the digits' flags are looked up in a table
+
+FLAGS_TABLE_BITS = 16
+
+_dictFlagsTables = dict()
+
+#functions
+
+def _PopCount(arrMasks, iSize):
+    """
+    Helper function to count the set bits of each element of an array of the
+    bitsets of N digits.
+
+    Signature:
+        numpy.ndarray, int -> numpy.ndarray
+    """
+    arrCount = numpy.zeros(arrMasks.shape, dtype = numpy.int64)
+    for iDigit in xrange(iSize):
+        arrCount += (arrMasks >> iDigit) & 1
+    return arrCount
+
+def _PrefilterPython(lstBoards):
+    """
+    Helper function - the pure Python fall-back of the pre-filtering of a
+    batch of the boards.
+
+    Signature:
+        list(SudokuBoard) -> list(tuple(str, SudokuBoard OR None))
+    """
+    lstResults = []
+    objSolver = None
+    for objBoard in lstBoards:
+        if objSolver is None:
+            objSolver = PropagationSolver(objBoard)
+        else:
+            objSolver.reset(objBoard)
+        objReduced = objSolver.reduce()
+        if objReduced is None:
+            lstResults.append((STATUS_UNSOLVABLE, None))
+        elif objReduced.isComplete():
+            lstResults.append((STATUS_SOLVED, objReduced))
+        else:
+            lstResults.append((STATUS_OPEN, objReduced))
+    return lstResults
+
+def _PrefilterBatch(lstBoards):
+    """
+    Helper function to pre-filter a batch of the boards of the same shape with
+    the best available backend.
+
+    Signature:
+        list(SudokuBoard) -> list(tuple(str, SudokuBoard OR None))
+    """
+    if not HAS_NUMPY:
+        return _PrefilterPython(lstBoards)
+    objBatch = BoardBatch(lstBoards)
+    objBatch.propagate()
+    return [(strStatus, objBoard) for strStatus, objBoard in zip(
+                                    objBatch.getStatus(), objBatch.toBoards())]
+
+def Prefilter(gPuzzles, iBatchSize = DEF_BATCH_SIZE):
+    """
+    Generator function, which applies the singles propagation to the puzzles
+    in batches and yields the results in the input order. The consecutive
+    puzzles of the same box shape are put into the same batch.
+
+    Signature:
+        iterable(SudokuBoard OR str)/, int/
+            -> generator(tuple(str, SudokuBoard OR None))
+
+    Args:
+        gPuzzles: iterable of SudokuBoard instances or strings, the puzzles
+        iBatchSize: (optional) positive integer, the maximum number of the
+            puzzles in a batch, defaults to DEF_BATCH_SIZE
+
+    Yields:
+        tuple(str, SudokuBoard OR None): the status - 'solved', 'unsolvable'
+            (a contradiction is found) or 'open' (the search is required) -
+            and the puzzle with the singles placed (None if unsolvable)
+
+    Raises:
+        TypeError: a puzzle is neither a board nor a string
+        ValueError: a puzzle string is malformed, or the batch size is not
+            positive
+    """
+    if iBatchSize < 1:
+        raise ValueError('Not positive batch size')
+    lstBoards = []
+    tupShape = None
+    for gPuzzle in gPuzzles:
+        objBoard = ToBoard(gPuzzle)
+        tupNewShape = (objBoard.BoxRows, objBoard.BoxColumns)
+        if lstBoards and (tupNewShape != tupShape
+                                            or len(lstBoards) >= iBatchSize):
+            for tupResult in _PrefilterBatch(lstBoards):
+                yield tupResult
+            lstBoards = []
+        tupShape = tupNewShape
+        lstBoards.append(objBoard)
+    if lstBoards:
+        for tupResult in _PrefilterBatch(lstBoards):
+            yield tupResult
+
+#classes
+
+class BoardBatch(object):
+    """
+    Batch of the boards of the same box shape held as a (B, N, N) NumPy array
+    of the cells' values. The method propagate() places all naked and hidden
+    singles in all boards until a fixpoint, the boards with a contradiction
+    are frozen at the state where it was found.
+
+    Methods:
+        getCandidates()
+            None -> numpy.ndarray
+        propagate()
+            None -> int
+        getStatus()
+            None -> list(str)
+        toBoards()
+            None -> list(SudokuBoard OR None)
+
+    Attributes:
+        BoxRows: int, read-only property, number of rows in a box
+        BoxColumns: int, read-only property, number of columns in a box
+        Values: numpy.ndarray, read-only property, (B, N, N) array of the
+            cells' values, zero for the empty cells
+        Contradictions: numpy.ndarray, read-only property, (B, ) boolean array
+            of the boards with a contradiction found
+    """
+
+    #special methods
+
+    def __init__(self, gPuzzles):
+        """
+        Initialization.
+
+        Signature:
+            iterable(SudokuBoard OR str) -> None
+
+        Args:
+            gPuzzles: iterable of SudokuBoard instances or strings, the puzzles
+                of the same box shape
+
+        Raises:
+            ImportError: NumPy is not installed
+            TypeError: a puzzle is neither a board nor a string
+            ValueError: a puzzle string is malformed, the puzzles have
+                different box shapes, or there are no puzzles
+        """
+        if not HAS_NUMPY:
+            raise ImportError('NumPy is required by {}'.format(
+                                                    self.__class__.__name__))
+        lstBoards = [ToBoard(gPuzzle) for gPuzzle in gPuzzles]
+        if not lstBoards:
+            raise ValueError('Empty batch of puzzles')
+        iBoxRows = lstBoards[0].BoxRows
+        iBoxColumns = lstBoards[0].BoxColumns
+        for objBoard in lstBoards:
+            if (objBoard.BoxRows != iBoxRows
+                                    or objBoard.BoxColumns != iBoxColumns):
+                raise ValueError('Puzzle box shape {} x {} is not {} x {}'.format(
+                                        objBoard.BoxRows, objBoard.BoxColumns,
+                                        iBoxRows, iBoxColumns))
+        iSize = iBoxRows * iBoxColumns
+        self._iBoxRows = iBoxRows
+        self._iBoxColumns = iBoxColumns
+        self._iSize = iSize
+        self._iFullMask = (1 << iSize) - 1
+        self._arrDigits = numpy.arange(iSize, dtype = numpy.int64)
+        self._arrValues = numpy.array([objBoard.Values
+                                    for objBoard in lstBoards],
+                                    dtype = numpy.int64).reshape(
+                                                (len(lstBoards), iSize, iSize))
+        self._arrContradictions = numpy.zeros(len(lstBoards), dtype = bool)
+        if iSize <= FLAGS_TABLE_BITS:
+            self._arrFlagsTable = _dictFlagsTables.get(iSize, None)
+            if self._arrFlagsTable is None:
+                self._arrFlagsTable = ((numpy.arange(1 << iSize)[:, None]
+                                        >> self._arrDigits) & 1).astype(bool)
+                _dictFlagsTables[iSize] = self._arrFlagsTable
+        else:
+            self._arrFlagsTable = None
+
+    #helper methods
+
+    def _getMasks(self, arrValues):
+        """
+        Helper method to calculate the bitsets of the digits placed into each
+        row, column and box (broadcast to the cells) of the boards, and to
+        find the boards with the same digit placed twice into a unit.
+
+        Signature:
+            numpy.ndarray
+                -> tuple(numpy.ndarray, numpy.ndarray, numpy.ndarray,
+                    numpy.ndarray)
+
+        Args:
+            arrValues: numpy.ndarray, (b, N, N) array of the cells' values of
+                a (sub-) batch
+
+        Returns:
+            tuple(numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray):
+                (b, N) row masks, (b, N) column masks, (b, N, N) box masks per
+                cell, (b, ) boolean flags of the repeated digits
+        """
+        iBoxRows = self._iBoxRows
+        iBoxColumns = self._iBoxColumns
+        iSize = self._iSize
+        iBoards = arrValues.shape[0]
+        tupBoxShape = (iBoards, iSize // iBoxRows, iBoxRows,
+                                            iSize // iBoxColumns, iBoxColumns)
+        arrFilled = arrValues > 0
+        arrBits = numpy.where(arrFilled,
+                            numpy.left_shift(1, numpy.maximum(arrValues - 1, 0)),
+                            0)
+        arrRows = numpy.bitwise_or.reduce(arrBits, axis = 2)
+        arrColumns = numpy.bitwise_or.reduce(arrBits, axis = 1)
+        arrBoxes = numpy.bitwise_or.reduce(numpy.bitwise_or.reduce(
+                    arrBits.reshape(tupBoxShape), axis = 4), axis = 2)
+        arrRepeated = (
+            (_PopCount(arrRows, iSize) != arrFilled.sum(axis = 2)).any(axis = 1)
+            | (_PopCount(arrColumns, iSize)
+                                    != arrFilled.sum(axis = 1)).any(axis = 1)
+            | (_PopCount(arrBoxes, iSize) != arrFilled.reshape(
+                        tupBoxShape).sum(axis = (2, 4))).any(axis = (1, 2)))
+        arrBoxes = arrBoxes.repeat(iBoxRows, axis = 1).repeat(iBoxColumns,
+                                                                    axis = 2)
+        return arrRows, arrColumns, arrBoxes, arrRepeated
+
+    def _getFlags(self, arrMasks):
+        """
+        Helper method to expand the bitsets into the boolean flags per digit,
+        using the look-up table for the small boards.
+
+        Signature:
+            numpy.ndarray -> numpy.ndarray
+
+        Args:
+            arrMasks: numpy.ndarray, array of the bitsets of any shape S
+
+        Returns:
+            numpy.ndarray: boolean array of the shape S + (N, )
+        """
+        if self._arrFlagsTable is not None:
+            return self._arrFlagsTable[arrMasks]
+        return ((arrMasks[..., None] >> self._arrDigits) & 1).astype(bool)
+
+    #public API
+
+    #properties
+
+    @property
+    def BoxRows(self):
+        """
+        Getter property for the number of rows in a box.
+
+        Signature:
+            None -> int
+        """
+        return self._iBoxRows
+
+    @property
+    def BoxColumns(self):
+        """
+        Getter property for the number of columns in a box.
+
+        Signature:
+            None -> int
+        """
+        return self._iBoxColumns
+
+    @property
+    def Values(self):
+        """
+        Getter property for the (B, N, N) array of the cells' values.
+
+        Signature:
+            None -> numpy.ndarray
+        """
+        return self._arrValues
+
+    @property
+    def Contradictions(self):
+        """
+        Getter property for the (B, ) boolean array of the boards with a
+        contradiction found.
+
+        Signature:
+            None -> numpy.ndarray
+        """
+        return self._arrContradictions
+
+    #+ methods
+
+    def getCandidates(self):
+        """
+        Calculates the candidates' bitsets of all cells of all boards (bit k
+        set means digit k + 1 is a candidate); zero for the non-empty cells.
+
+        Signature:
+            None -> numpy.ndarray
+
+        Returns:
+            numpy.ndarray: (B, N, N) array of the bitsets
+        """
+        arrRows, arrColumns, arrBoxes, _ = self._getMasks(self._arrValues)
+        arrUsed = arrRows[:, :, None] | arrColumns[:, None, :] | arrBoxes
+        return numpy.where(self._arrValues > 0, 0,
+                                                ~arrUsed & self._iFullMask)
+
+    def propagate(self):
+        """
+        Places the naked and hidden singles into all boards until a fixpoint is
+        reached. Each pass is made only over the boards changed by the previous
+        pass. A board is frozen as soon as a contradiction is found in it: a
+        repeated digit in a unit, an empty cell without candidates, a digit
+        without a place in a unit or a cell being the only place of two
+        digits.
+
+        Signature:
+            None -> int
+
+        Returns:
+            int: number of the passes made
+        """
+        iBoxRows = self._iBoxRows
+        iBoxColumns = self._iBoxColumns
+        iSize = self._iSize
+        arrAllValues = self._arrValues
+        arrActive = numpy.flatnonzero(~self._arrContradictions)
+        iPasses = 0
+        while arrActive.size:
+            iPasses += 1
+            arrValues = arrAllValues[arrActive]
+            iBoards = arrActive.size
+            tupBoxShape = (iBoards, iSize // iBoxRows, iBoxRows,
+                                    iSize // iBoxColumns, iBoxColumns, iSize)
+            arrRows, arrColumns, arrBoxes, arrFailed = self._getMasks(
+                                                                    arrValues)
+            arrEmpty = arrValues == 0
+            arrUsed = arrRows[:, :, None] | arrColumns[:, None, :] | arrBoxes
+            arrCandidates = numpy.where(arrEmpty, ~arrUsed & self._iFullMask, 0)
+            #(b, N, N, N) flags: digit k + 1 is a candidate of the cell
+            arrFlags = self._getFlags(arrCandidates)
+            arrInRows = arrFlags.sum(axis = 2)
+            arrInColumns = arrFlags.sum(axis = 1)
+            arrInBoxes = arrFlags.reshape(tupBoxShape).sum(axis = (2, 4))
+            arrFailed |= (
+                (arrEmpty & (arrCandidates == 0)).any(axis = (1, 2))
+                | ((arrInRows == 0)
+                                & ~self._getFlags(arrRows)).any(axis = (1, 2))
+                | ((arrInColumns == 0)
+                            & ~self._getFlags(arrColumns)).any(axis = (1, 2))
+                | ((arrInBoxes == 0) & ~self._getFlags(
+                            arrBoxes[:, ::iBoxRows, ::iBoxColumns])).any(
+                                                            axis = (1, 2, 3)))
+            arrHidden = arrFlags & ((arrInRows == 1)[:, :, None, :]
+                                    | (arrInColumns == 1)[:, None, :, :]
+                                    | (arrInBoxes == 1).repeat(iBoxRows,
+                                        axis = 1).repeat(iBoxColumns, axis = 2))
+            arrHiddenCount = arrHidden.sum(axis = 3)
+            arrFailed |= (arrHiddenCount > 1).any(axis = (1, 2))
+            arrNaked = arrEmpty & (arrCandidates != 0) & (
+                                    (arrCandidates & (arrCandidates - 1)) == 0)
+            arrPlace = ((arrHiddenCount == 1) | arrNaked) & (
+                                                    ~arrFailed)[:, None, None]
+            self._arrContradictions[arrActive[arrFailed]] = True
+            arrChanged = arrPlace.any(axis = (1, 2))
+            if arrChanged.any():
+                arrNew = numpy.where(arrHiddenCount == 1,
+                                    arrHidden.argmax(axis = 3),
+                                    arrFlags.argmax(axis = 3)) + 1
+                arrValues[arrPlace] = arrNew[arrPlace]
+                arrAllValues[arrActive[arrChanged]] = arrValues[arrChanged]
+            arrActive = arrActive[arrChanged]
+        return iPasses
+
+    def getStatus(self):
+        """
+        Returns the status of each board: 'unsolvable' (a contradiction is
+        found), 'solved' (all cells are filled) or 'open'.
+
+        Signature:
+            None -> list(str)
+        """
+        arrComplete = (self._arrValues > 0).all(axis = (1, 2))
+        lstStatus = []
+        for bContradiction, bComplete in zip(self._arrContradictions.tolist(),
+                                                        arrComplete.tolist()):
+            if bContradiction:
+                lstStatus.append(STATUS_UNSOLVABLE)
+            elif bComplete:
+                lstStatus.append(STATUS_SOLVED)
+            else:
+                lstStatus.append(STATUS_OPEN)
+        return lstStatus
+
+    def toBoards(self):
+        """
+        Converts the current state of the batch into the boards.
+
+        Signature:
+            None -> list(SudokuBoard OR None)
+
+        Returns:
+            list(SudokuBoard OR None): the board per puzzle, None for the
+                boards with a contradiction
+        """
+        lstBoards = []
+        iSize = self._iSize
+        for bContradiction, arrValues in zip(self._arrContradictions.tolist(),
+                                                            self._arrValues):
+            if bContradiction:
+                lstBoards.append(None)
+            else:
+                objBoard = SudokuBoard(self._iBoxRows, self._iBoxColumns)
+                for iCell, iValue in enumerate(
+                                    arrValues.reshape(iSize * iSize).tolist()):
+                    if iValue:
+                        objBoard.setValue(iCell, iValue)
+                lstBoards.append(objBoard)
+        return lstBoards
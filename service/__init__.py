@@ -0,0 +1,18 @@
+#!/usr/bin/python
+"""
+Package sudoku_py.service
+
+Local solve service, which keeps the engines loaded in a pool of the worker
+processes and serves the JSON-lines requests of the other local processes,
+and the load generator client of it.
+
+Modules:
+    server
+    loadgen
+"""
+
+__version__ = "0.0.1.0"
+__date__ = "17-10-2026"
+__status__ = "Development"
+
+__all__ = ['server', 'loadgen']
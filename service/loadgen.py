@@ -0,0 +1,326 @@
+#!/usr/bin/python
+"""
+Module sudoku_py.service.loadgen
+
+Load generator client of the local solve service (see the module
+sudoku_py.service.server). Several connections are opened, each in its own
+thread, and each keeps a fixed number of the requests in flight (pipelining);
+the total throughput and the latency percentiles of the single requests are
+reported.
+
+The puzzles to be solved or rated are read from a text file (one per line),
+or, if no file is given, they are first requested from the service itself
+with the 'generate' operation. Can be run as a script, optionally starting the
+server in-process:
+
+    python -m sudoku_py.service.loadgen --spawn --requests 5000
+
+Functions:
+    FetchPuzzles()
+        str OR tuple(str, int), int/, int, int, int OR None/ -> list(str)
+    RunLoad()
+        str OR tuple(str, int), list(str)/, str, int, int, int, dict OR None/
+            -> dict(str -> int OR float)
+    main()
+        /list(str)/ -> None
+"""
+
+__version__ = "0.0.1.0"
+__date__ = "17-10-2026"
+__status__ = "Development"
+
+__all__ = ['FetchPuzzles', 'RunLoad', 'main']
+
+#imports
+
+#+ standard libraries
+
+import sys
+import os
+import argparse
+import json
+import socket
+import threading
+import timeit
+
+#+ my libraries
+
+if __name__ == '__main__':
+    strTemp = os.path.dirname(os.path.dirname(os.path.dirname(
+                                                os.path.realpath(__file__))))
+    if not (strTemp in sys.path):
+        sys.path.append(strTemp)
+
+#+ other modules from the package
+
+from sudoku_py.core.batch_solver import ReadPuzzles
+
+from sudoku_py.core.solve_budget import STATUS_COMPLETE
+
+from sudoku_py.benchmark.suite import Percentile
+
+from sudoku_py.service.server import (OP_SOLVE, OP_RATE, OP_GENERATE,
+                                        DEF_HOST, DEF_PORT, SolveServer)
+
+#globals
+
+DEF_REQUESTS = 1000
+
+DEF_CONNECTIONS = 4
+
+#+ requests in flight per connection
+
+DEF_PIPELINE = 16
+
+#+ number of the distinct puzzles fetched from the service, if no file is given
+
+DEF_PUZZLES = 100
+
+#functions
+
+def _Connect(gAddress):
+    """
+    Helper function to open a blocking connection to the service.
+
+    Signature:
+        str OR tuple(str, int) -> socket.socket
+    """
+    if isinstance(gAddress, basestring):
+        objSocket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    else:
+        objSocket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        objSocket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    objSocket.connect(gAddress)
+    return objSocket
+
+def _RunConnection(gAddress, lstRequests, iPipeline, glstLatencies,
+                                                                    lstErrors):
+    """
+    Helper function executed in a thread. Sends the requests over a single
+    connection keeping up to the pipeline number of them in flight, and
+    collects the latencies and the error messages.
+
+    Signature:
+        str OR tuple(str, int), list(dict), int, list(float), list(str)
+            -> None
+    """
+    objSocket = _Connect(gAddress)
+    fReader = objSocket.makefile('rb')
+    dictStarted = {}
+    iSent = 0
+    try:
+        while iSent < len(lstRequests) or dictStarted:
+            strlstLines = []
+            while (iSent < len(lstRequests) and
+                                                len(dictStarted) < iPipeline):
+                dictRequest = lstRequests[iSent]
+                dictStarted[dictRequest['id']] = timeit.default_timer()
+                strlstLines.append(json.dumps(dictRequest))
+                iSent += 1
+            if strlstLines:
+                objSocket.sendall('\n'.join(strlstLines) + '\n')
+            strLine = fReader.readline()
+            if not strLine:
+                lstErrors.append('Connection closed by the service')
+                break
+            dictResponse = json.loads(strLine)
+            gStart = dictStarted.pop(dictResponse.get('id'), None)
+            if gStart is not None:
+                glstLatencies.append(timeit.default_timer() - gStart)
+            if not dictResponse.get('ok'):
+                lstErrors.append(dictResponse.get('error'))
+    finally:
+        fReader.close()
+        objSocket.close()
+
+def FetchPuzzles(gAddress, iCount, iBoxRows = 3, iBoxColumns = 3,
+                                                            iMinClues = None):
+    """
+    Requests the puzzles from the service with the 'generate' operation, seeds
+    0 to iCount - 1.
+
+    Signature:
+        str OR tuple(str, int), int/, int, int, int OR None/ -> list(str)
+
+    Args:
+        gAddress: string - path of the Unix socket, or pair (host, port) of
+            the TCP socket
+        iCount: non-negative integer, number of the puzzles
+        iBoxRows: (optional) positive integer, number of rows in a box,
+            defaults to 3
+        iBoxColumns: (optional) positive integer, number of columns in a box,
+            defaults to 3
+        iMinClues: (optional) non-negative integer, the removal of the clues
+            is stopped at this number, by default - minimal puzzles
+
+    Returns:
+        list(str): the puzzles in the order of the seeds
+
+    Raises:
+        RuntimeError: the service failed to generate a puzzle, or it has
+            reached the time limit
+        socket.error: the service is not available
+    """
+    objSocket = _Connect(gAddress)
+    fReader = objSocket.makefile('rb')
+    try:
+        objSocket.sendall(''.join('{}\n'.format(json.dumps({'id' : iIndex,
+                            'op' : OP_GENERATE, 'rows' : iBoxRows,
+                            'columns' : iBoxColumns, 'min_clues' : iMinClues,
+                            'seed' : iIndex})) for iIndex in xrange(iCount)))
+        strlstPuzzles = [None] * iCount
+        for _ in xrange(iCount):
+            dictResponse = json.loads(fReader.readline())
+            if not dictResponse.get('ok'):
+                raise RuntimeError('Service failed to generate: {}'.format(
+                                                    dictResponse.get('error')))
+            if dictResponse['status'] != STATUS_COMPLETE:
+                raise RuntimeError('Service failed to generate: {}'.format(
+                                                    dictResponse['status']))
+            strlstPuzzles[dictResponse['id']] = str(dictResponse['puzzle'])
+    finally:
+        fReader.close()
+        objSocket.close()
+    return strlstPuzzles
+
+def RunLoad(gAddress, strlstPuzzles, strOp = OP_SOLVE,
+                iRequests = DEF_REQUESTS, iConnections = DEF_CONNECTIONS,
+                            iPipeline = DEF_PIPELINE, dictExtra = None):
+    """
+    Sends the requests to the service over several pipelined connections and
+    measures the throughput and the latency.
+
+    Signature:
+        str OR tuple(str, int), list(str)/, str, int, int, int, dict OR None/
+            -> dict(str -> int OR float)
+
+    Args:
+        gAddress: string - path of the Unix socket, or pair (host, port) of
+            the TCP socket
+        strlstPuzzles: list of strings, the puzzles, re-used cyclically; with
+            the 'generate' operation they are ignored and may be empty
+        strOp: (optional) string, the operation, defaults to 'solve'
+        iRequests: (optional) positive integer, the total number of the
+            requests, defaults to DEF_REQUESTS
+        iConnections: (optional) positive integer, number of the connections,
+            defaults to DEF_CONNECTIONS
+        iPipeline: (optional) positive integer, number of the requests in
+            flight per connection, defaults to DEF_PIPELINE
+        dictExtra: (optional) dict, the additional keys of each request, e.g.
+            {'engine' : 'dlx'}
+
+    Returns:
+        dict(str -> int OR float): 'requests', 'errors', 'seconds',
+            'per_second', 'p50_ms', 'p99_ms' and 'max_ms'
+
+    Raises:
+        ValueError: not positive number of requests, connections or pipeline,
+            or no puzzles for the solve / rate operation
+    """
+    if iRequests < 1 or iConnections < 1 or iPipeline < 1:
+        raise ValueError('Not positive number of requests or connections')
+    if strOp != OP_GENERATE and not strlstPuzzles:
+        raise ValueError('No puzzles to {}'.format(strOp))
+    lstlstRequests = [[] for _ in xrange(iConnections)]
+    for iIndex in xrange(iRequests):
+        dictRequest = dict(dictExtra or {})
+        dictRequest['id'] = iIndex
+        dictRequest['op'] = strOp
+        if strOp == OP_GENERATE:
+            dictRequest.setdefault('seed', iIndex)
+        else:
+            dictRequest['puzzle'] = strlstPuzzles[iIndex % len(strlstPuzzles)]
+        lstlstRequests[iIndex % iConnections].append(dictRequest)
+    glstLatencies = []
+    lstErrors = []
+    lstThreads = [threading.Thread(target = _RunConnection,
+                            args = (gAddress, lstRequests, iPipeline,
+                                                    glstLatencies, lstErrors))
+                                for lstRequests in lstlstRequests]
+    gStart = timeit.default_timer()
+    for objThread in lstThreads:
+        objThread.start()
+    for objThread in lstThreads:
+        objThread.join()
+    gElapsed = timeit.default_timer() - gStart
+    glstLatencies.sort()
+    return {'requests' : len(glstLatencies),
+            'errors' : len(lstErrors),
+            'seconds' : round(gElapsed, 3),
+            'per_second' : round(len(glstLatencies) / gElapsed, 1),
+            'p50_ms' : round(1000 * Percentile(glstLatencies, 0.5), 3),
+            'p99_ms' : round(1000 * Percentile(glstLatencies, 0.99), 3),
+            'max_ms' : round(1000 * Percentile(glstLatencies, 1.0), 3)}
+
+def main(strlstArgs = None):
+    """
+    Parses the command line arguments, runs the load and prints the report.
+
+    Signature:
+        /list(str)/ -> None
+
+    Args:
+        strlstArgs: (optional) list of strings, the command line arguments,
+            defaults to sys.argv[1:]
+    """
+    objParser = argparse.ArgumentParser(
+                                description = 'Sudoku solve service load')
+    objParser.add_argument('--unix', metavar = 'PATH',
+                            help = 'connect to the Unix socket PATH')
+    objParser.add_argument('--host', default = DEF_HOST,
+                            help = 'TCP host, default: {}'.format(DEF_HOST))
+    objParser.add_argument('--port', type = int, default = DEF_PORT,
+                            help = 'TCP port, default: {}'.format(DEF_PORT))
+    objParser.add_argument('--spawn', action = 'store_true',
+                            help = 'run the server in-process on a free port')
+    objParser.add_argument('--processes', type = int, default = None,
+                            help = 'worker processes of the spawned server')
+    objParser.add_argument('--op', choices = (OP_SOLVE, OP_RATE, OP_GENERATE),
+                            default = OP_SOLVE, help = 'requested operation')
+    objParser.add_argument('--file', metavar = 'FILE',
+                            help = 'puzzles (one per line), default: fetched '
+                                                            'from the service')
+    objParser.add_argument('--puzzles', type = int, default = DEF_PUZZLES,
+                            help = 'number of puzzles fetched from the service')
+    objParser.add_argument('--requests', type = int, default = DEF_REQUESTS,
+                            help = 'total number of requests')
+    objParser.add_argument('--connections', type = int,
+                            default = DEF_CONNECTIONS,
+                            help = 'number of connections')
+    objParser.add_argument('--pipeline', type = int, default = DEF_PIPELINE,
+                            help = 'requests in flight per connection')
+    objArgs = objParser.parse_args(strlstArgs)
+    objServer = None
+    if objArgs.spawn:
+        objServer = SolveServer((DEF_HOST, 0), objArgs.processes)
+        gAddress = objServer.Address
+        objThread = threading.Thread(target = objServer.run)
+        objThread.daemon = True
+        objThread.start()
+    elif objArgs.unix is None:
+        gAddress = (objArgs.host, objArgs.port)
+    else:
+        gAddress = objArgs.unix
+    try:
+        if objArgs.op == OP_GENERATE:
+            strlstPuzzles = []
+        elif objArgs.file is None:
+            strlstPuzzles = FetchPuzzles(gAddress, objArgs.puzzles)
+        else:
+            with open(objArgs.file) as fFile:
+                strlstPuzzles = [strPuzzle
+                                    for _, strPuzzle in ReadPuzzles(fFile)]
+        dictReport = RunLoad(gAddress, strlstPuzzles, objArgs.op,
+                                objArgs.requests, objArgs.connections,
+                                                            objArgs.pipeline)
+        if objServer is not None:
+            dictReport['batches'] = objServer.Batches
+    finally:
+        if objServer is not None:
+            objServer.stop()
+            objThread.join()
+            objServer.close()
+    print json.dumps(dictReport, sort_keys = True)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,792 @@
+#!/usr/bin/python
+"""
+Module sudoku_py.service.server
+
+Implements the local solve service. The server listens on a Unix socket or on
+a localhost TCP port and accepts any number of the connections; each request
+is a single line with a JSON object, and each response is a single line with
+a JSON object carrying the same 'id' as the request:
+
+    {"id": 1, "op": "solve", "puzzle": "..5.3..", "timeout": 10}
+    {"id": 1, "ok": true, "status": "complete", "solutions": ["..."], ...}
+
+The supported operations are:
+    *) 'solve' - keys 'puzzle', optional 'rows', 'columns', 'engine',
+        'max_solutions', 'timeout' (seconds, capped by the server's limit) and
+        'max_nodes'; the response has the 'status' (see
+        sudoku_py.core.solve_budget), the 'solutions', the 'best' state and
+        the number of the visited 'nodes'
+    *) 'rate' - keys 'puzzle', optional 'rows', 'columns' and 'timeout'; the
+        response has the 'status', the 'rating', the 'level', the 'solved'
+        flag and the number of the 'steps', see sudoku_py.core.rating
+    *) 'generate' - optional keys 'rows', 'columns' (3 x 3 boxes by default),
+        'min_clues', 'seed' and 'timeout'; the response has the 'status', the
+        'puzzle' and its 'solution'
+A failed request is answered with "ok": false and the 'error' message. Each
+request is limited by the server's wall-clock limit (or by the shorter
+'timeout' of the request); a rate or generate request, which reaches it, is
+answered with the 'status' only - 'timeout'.
+
+The requests are not handled one by one, but collected from all connections
+into the micro-batches, which are sent to a pool of the worker processes. A
+batch is dispatched when it is full or when its oldest request has waited for
+the batch delay, as long as the number of the batches in flight is below the
+limit. The batches only reduce the dispatch overhead: a batch is submitted
+to the pool at once, but each of its requests is a separate task, which any
+free worker can take. The workers encode each response and send it back
+through a shared pipe as soon as its request is done, and the server streams
+it to the client at once, thus a slow request does not delay the rest of its
+batch, and the responses of a single connection may come in any order.
+
+The pool does not report a task lost with its worker (e.g. killed by the OS),
+thus a worker also reports the start of each request with its process ID. A
+started request is answered with an error, if its worker has exited, or if it
+is not done within the server's limit plus TASK_MARGIN; its late response (if
+any) is dropped. The workers ignore Ctrl+C, which is meant for the server.
+
+The event loop is built on the standard asyncore / asynchat modules. The
+receiving end of the responses pipe is watched by the loop together with the
+sockets, thus the loop sleeps until a request or a response arrives, or until
+the oldest pending request is due to be dispatched. Can be run as a script:
+
+    python -m sudoku_py.service.server --unix /tmp/sudoku.sock
+
+Classes:
+    SolveServer
+
+Functions:
+    HandleRequest()
+        dict(str -> type A)/, float/ -> dict(str -> type B)
+    main()
+        /list(str)/ -> None
+"""
+
+__version__ = "0.0.1.0"
+__date__ = "17-10-2026"
+__status__ = "Development"
+
+__all__ = ['OP_SOLVE', 'OP_RATE', 'OP_GENERATE', 'DEF_HOST', 'DEF_PORT',
+            'HandleRequest', 'SolveServer', 'main']
+
+#imports
+
+#+ standard libraries
+
+import sys
+import os
+import argparse
+import asynchat
+import asyncore
+import collections
+import json
+import multiprocessing
+import signal
+import socket
+import stat
+import timeit
+
+#+ my libraries
+
+if __name__ == '__main__':
+    strTemp = os.path.dirname(os.path.dirname(os.path.dirname(
+                                                os.path.realpath(__file__))))
+    if not (strTemp in sys.path):
+        sys.path.append(strTemp)
+
+#+ other modules from the package
+
+from sudoku_py.core.board import SudokuBoard
+
+from sudoku_py.core.solvers import DEF_ENGINE, SolveLimited
+
+from sudoku_py.core.rating import RatePuzzle
+
+from sudoku_py.core.generator import GeneratePuzzle
+
+from sudoku_py.core.solve_budget import (STATUS_COMPLETE, BudgetExceeded,
+                                                                SolveBudget)
+
+#globals
+
+OP_SOLVE = 'solve'
+
+OP_RATE = 'rate'
+
+OP_GENERATE = 'generate'
+
+DEF_HOST = '127.0.0.1'
+
+DEF_PORT = 8765
+
+DEF_BATCH_SIZE = 32
+
+#+ the longest time a request waits for its batch to fill, seconds
+
+DEF_BATCH_DELAY = 0.002
+
+#+ the wall-clock limit of a single request, seconds
+
+DEF_SOLVE_LIMIT = 60.0
+
+#+ number of the batches in flight per worker process
+
+BATCHES_PER_PROCESS = 2
+
+#+ the longest accepted request line, bytes
+
+MAX_LINE = 65536
+
+LISTEN_BACKLOG = 128
+
+#+ the event loop wake-up period without the work in progress, and the period
+#+ of the checks of the started requests, seconds
+
+IDLE_PERIOD = 0.2
+
+#+ time over the solve limit, after which a started request is given up,
+#+ seconds
+
+TASK_MARGIN = 5.0
+
+#+ sending end of the responses pipe and its lock, set in each worker process
+#+ of the pool
+
+_objSender = None
+
+_objLock = None
+
+#functions
+
+def _EncodeError(gId, strError):
+    """
+    Helper function to encode the failure response.
+
+    Signature:
+        type A, str -> str
+    """
+    return json.dumps({'id' : gId, 'ok' : False, 'error' : strError})
+
+def _GetPuzzle(dictRequest):
+    """
+    Helper function to parse the puzzle of a request.
+
+    Signature:
+        dict(str -> type A) -> SudokuBoard
+
+    Raises:
+        KeyError: the puzzle is missing
+        TypeError: the puzzle is not a string
+        ValueError: the puzzle is malformed
+    """
+    strPuzzle = dictRequest['puzzle']
+    if not isinstance(strPuzzle, basestring):
+        raise TypeError('Not a string puzzle')
+    return SudokuBoard.fromString(str(strPuzzle), dictRequest.get('rows'),
+                                                    dictRequest.get('columns'))
+
+def _GetTimeout(dictRequest, gSolveLimit):
+    """
+    Helper function to get the timeout of a request capped by the limit.
+
+    Signature:
+        dict(str -> type A), float -> float
+    """
+    gTimeout = dictRequest.get('timeout')
+    if gTimeout is None or gTimeout > gSolveLimit:
+        gTimeout = gSolveLimit
+    return gTimeout
+
+def HandleRequest(dictRequest, gSolveLimit = DEF_SOLVE_LIMIT):
+    """
+    Performs a single request, see the module's documentation.
+
+    Signature:
+        dict(str -> type A)/, float/ -> dict(str -> type B)
+
+    Args:
+        dictRequest: dict, the decoded request
+        gSolveLimit: (optional) non-negative float, the upper limit of the
+            request's timeout, defaults to DEF_SOLVE_LIMIT
+
+    Returns:
+        dict: the response without the 'id' and 'ok' keys
+
+    Raises:
+        KeyError: a required key is missing
+        TypeError: a value of an improper type
+        ValueError: unknown operation or an improper value
+    """
+    strOp = dictRequest.get('op')
+    gTimeout = _GetTimeout(dictRequest, gSolveLimit)
+    if strOp == OP_SOLVE:
+        objResult = SolveLimited(_GetPuzzle(dictRequest),
+                                    dictRequest.get('max_solutions', 1),
+                                    str(dictRequest.get('engine', DEF_ENGINE)),
+                                    gTimeout, dictRequest.get('max_nodes'))
+        dictResponse = {'status' : objResult.Status,
+                        'solutions' : [objSolution.toString()
+                                        for objSolution in objResult.Solutions],
+                        'best' : objResult.Best.toString(),
+                        'nodes' : objResult.Stats.Nodes}
+    elif strOp == OP_RATE:
+        objPuzzle = _GetPuzzle(dictRequest)
+        try:
+            objRating = RatePuzzle(objPuzzle, SolveBudget(gTimeout))
+        except BudgetExceeded as objError:
+            return {'status' : objError.Reason}
+        dictResponse = {'status' : STATUS_COMPLETE,
+                        'rating' : objRating.Rating,
+                        'level' : objRating.Level,
+                        'solved' : objRating.Solved,
+                        'steps' : len(objRating.Steps)}
+    elif strOp == OP_GENERATE:
+        try:
+            objPuzzle, objSolution = GeneratePuzzle(
+                                dictRequest.get('rows', 3),
+                                dictRequest.get('columns', 3),
+                                dictRequest.get('min_clues'),
+                                dictRequest.get('seed'),
+                                objBudget = SolveBudget(gTimeout))
+        except BudgetExceeded as objError:
+            return {'status' : objError.Reason}
+        dictResponse = {'status' : STATUS_COMPLETE,
+                        'puzzle' : objPuzzle.toString(),
+                        'solution' : objSolution.toString()}
+    else:
+        raise ValueError('Unknown operation {!r}'.format(strOp))
+    return dictResponse
+
+def _InitWorker(objSender, objLock):
+    """
+    Helper function to set the sending end of the responses pipe and its lock
+    in each worker process of the pool. Ctrl+C is ignored.
+
+    Signature:
+        multiprocessing.Connection, multiprocessing.Lock -> None
+    """
+    global _objSender, _objLock
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    _objSender = objSender
+    _objLock = objLock
+
+def _HandleTask(tupTask):
+    """
+    Helper function executed in a worker process. Performs a single request of
+    a batch; sends the tuple (batch, index of the request, process ID, None)
+    at the start and the same tuple with the encoded response instead of None
+    at the end. The exceptions are caught and reported in the response, since
+    the pool does not report the failed tasks.
+
+    Signature:
+        tuple(int, int, dict(str -> type A), float) -> None
+    """
+    iBatch, iIndex, dictRequest, gSolveLimit = tupTask
+    iPid = os.getpid()
+    with _objLock:
+        _objSender.send((iBatch, iIndex, iPid, None))
+    gId = dictRequest.get('id')
+    try:
+        dictResponse = HandleRequest(dictRequest, gSolveLimit)
+    except Exception as objError:
+        strResponse = _EncodeError(gId, '{}: {}'.format(
+                                        objError.__class__.__name__, objError))
+    else:
+        dictResponse['id'] = gId
+        dictResponse['ok'] = True
+        strResponse = json.dumps(dictResponse)
+    with _objLock:
+        _objSender.send((iBatch, iIndex, iPid, strResponse))
+
+#classes
+
+class _RequestChannel(asynchat.async_chat):
+    """
+    Connection of a single client, which splits the incoming data into the
+    lines and passes them to the server.
+    """
+
+    #special methods
+
+    def __init__(self, objSocket, objServer, dictMap):
+        """
+        Initialization.
+
+        Signature:
+            socket.socket, SolveServer, dict -> None
+        """
+        asynchat.async_chat.__init__(self, objSocket, dictMap)
+        self._objServer = objServer
+        self._strlstBuffer = []
+        self._iBuffered = 0
+        self.set_terminator('\n')
+
+    #public API
+
+    def collect_incoming_data(self, strData):
+        """
+        Buffers the incoming data until the end of the line. A client sending
+        too long line is disconnected.
+
+        Signature:
+            str -> None
+        """
+        self._iBuffered += len(strData)
+        if self._iBuffered > MAX_LINE:
+            self._strlstBuffer = []
+            self._iBuffered = 0
+            self.set_terminator(None)
+            self.push(_EncodeError(None, 'Request line is too long') + '\n')
+            self.close_when_done()
+        else:
+            self._strlstBuffer.append(strData)
+
+    def found_terminator(self):
+        """
+        Passes the complete line to the server.
+
+        Signature:
+            None -> None
+        """
+        strLine = ''.join(self._strlstBuffer)
+        self._strlstBuffer = []
+        self._iBuffered = 0
+        if strLine.strip():
+            self._objServer._addRequest(self, strLine)
+
+    def sendLine(self, strLine):
+        """
+        Queues a response line, unless the client has disconnected.
+
+        Signature:
+            str -> None
+        """
+        if self.connected:
+            self.push(strLine + '\n')
+
+class _Listener(asyncore.dispatcher):
+    """
+    Listening socket, which creates a channel for each accepted connection.
+    """
+
+    #special methods
+
+    def __init__(self, gAddress, objServer, dictMap):
+        """
+        Initialization.
+
+        Signature:
+            str OR tuple(str, int), SolveServer, dict -> None
+        """
+        asyncore.dispatcher.__init__(self, map = dictMap)
+        self._objServer = objServer
+        self._dictMap = dictMap
+        if isinstance(gAddress, basestring):
+            self.create_socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        else:
+            self.create_socket(socket.AF_INET, socket.SOCK_STREAM)
+            self.set_reuse_addr()
+        self.bind(gAddress)
+        self.listen(LISTEN_BACKLOG)
+
+    #public API
+
+    def handle_accept(self):
+        """
+        Accepts a connection.
+
+        Signature:
+            None -> None
+        """
+        tupPair = self.accept()
+        if tupPair is not None:
+            _RequestChannel(tupPair[0], self._objServer, self._dictMap)
+
+class _ResponseReader(asyncore.dispatcher):
+    """
+    Receiving end of the responses pipe, which wakes up the event loop to send
+    back the responses as soon as they arrive.
+    """
+
+    #special methods
+
+    def __init__(self, objReceiver, objServer, dictMap):
+        """
+        Initialization. The pipe is watched as it is, without the non-blocking
+        mode, since a message is always read completely.
+
+        Signature:
+            multiprocessing.Connection, SolveServer, dict -> None
+        """
+        asyncore.dispatcher.__init__(self, map = dictMap)
+        self._objServer = objServer
+        self._fileno = objReceiver.fileno()
+        self.connected = True
+        self.add_channel(dictMap)
+
+    #public API
+
+    def writable(self):
+        """
+        The pipe is never written to by the server.
+
+        Signature:
+            None -> bool
+        """
+        return False
+
+    def handle_read(self):
+        """
+        Sends back the received responses.
+
+        Signature:
+            None -> None
+        """
+        self._objServer._collect()
+
+    def close(self):
+        """
+        Stops watching the pipe; the pipe itself is closed by the server.
+
+        Signature:
+            None -> None
+        """
+        self.del_channel()
+
+class SolveServer(object):
+    """
+    The local solve service, see the module's documentation. The pool of the
+    worker processes is started upon instantiation, the requests are served by
+    the method run() until the method stop() is called (e.g. from another
+    thread); the method close() releases the socket and the pool.
+
+    Methods:
+        run()
+            None -> None
+        stop()
+            None -> None
+        close()
+            None -> None
+
+    Attributes:
+        Address: str OR tuple(str, int), read-only property, the address
+            actually listened on
+        Served: int, read-only property, number of the responses sent
+        Batches: int, read-only property, number of the batches dispatched
+    """
+
+    #special methods
+
+    def __init__(self, gAddress = (DEF_HOST, DEF_PORT), iProcesses = None,
+                    iBatchSize = DEF_BATCH_SIZE, gBatchDelay = DEF_BATCH_DELAY,
+                                            gSolveLimit = DEF_SOLVE_LIMIT):
+        """
+        Initialization.
+
+        Signature:
+            /str OR tuple(str, int), int OR None, int, float, float/ -> None
+
+        Args:
+            gAddress: (optional) string - path of the Unix socket, or pair
+                (host, port) of the TCP socket, port 0 means any free port;
+                defaults to (DEF_HOST, DEF_PORT)
+            iProcesses: (optional) positive integer, number of the worker
+                processes, defaults to the number of the CPUs
+            iBatchSize: (optional) positive integer, the maximum number of the
+                requests in a batch, defaults to DEF_BATCH_SIZE
+            gBatchDelay: (optional) non-negative float, the longest time a
+                request waits for its batch to fill, in seconds, defaults to
+                DEF_BATCH_DELAY
+            gSolveLimit: (optional) non-negative float, the wall-clock limit
+                of a request, in seconds, defaults to DEF_SOLVE_LIMIT
+
+        Raises:
+            ValueError: not positive number of processes or batch size, or
+                negative delay or limit
+            socket.error: the address cannot be listened on
+        """
+        if iProcesses is None:
+            iProcesses = multiprocessing.cpu_count()
+        if iProcesses < 1:
+            raise ValueError('Not positive number of processes')
+        if iBatchSize < 1:
+            raise ValueError('Not positive batch size')
+        if gBatchDelay < 0 or gSolveLimit < 0:
+            raise ValueError('Negative batch delay or solve limit')
+        self._iBatchSize = iBatchSize
+        self._gBatchDelay = gBatchDelay
+        self._gSolveLimit = gSolveLimit
+        self._iWindow = iProcesses * BATCHES_PER_PROCESS
+        self._deqPending = collections.deque()
+        self._dictInFlight = {}
+        self._dictStarted = {}
+        self._gNextCheck = 0.0
+        self._iBatches = 0
+        self._iServed = 0
+        self._bRunning = False
+        self._strUnixPath = None
+        #the workers are forked before the socket is open; the sending end
+        #of the pipe is kept open for the replaced workers
+        self._objReceiver, self._objSender = multiprocessing.Pipe(False)
+        self._objPool = multiprocessing.Pool(iProcesses, _InitWorker,
+                                (self._objSender, multiprocessing.Lock()))
+        self._dictMap = {}
+        _ResponseReader(self._objReceiver, self, self._dictMap)
+        try:
+            if isinstance(gAddress, basestring):
+                if (os.path.exists(gAddress)
+                                and stat.S_ISSOCK(os.stat(gAddress).st_mode)):
+                    os.unlink(gAddress)
+                self._strUnixPath = gAddress
+            self._objListener = _Listener(gAddress, self, self._dictMap)
+        except:
+            self._objPool.terminate()
+            self._objPool.join()
+            self._objReceiver.close()
+            self._objSender.close()
+            raise
+
+    #helper methods
+
+    def _addRequest(self, objChannel, strLine):
+        """
+        Helper method to decode a request line and to queue it; the malformed
+        requests are answered at once.
+
+        Signature:
+            _RequestChannel, str -> None
+        """
+        try:
+            dictRequest = json.loads(strLine)
+        except ValueError as objError:
+            objChannel.sendLine(_EncodeError(None,
+                                        'Malformed JSON: {}'.format(objError)))
+            return
+        if not isinstance(dictRequest, dict):
+            objChannel.sendLine(_EncodeError(None, 'Not a JSON object'))
+            return
+        self._deqPending.append((objChannel, dictRequest,
+                                                    timeit.default_timer()))
+
+    def _dispatch(self):
+        """
+        Helper method to send the full or the overdue batches to the pool, as
+        long as the number of the batches in flight is below the limit.
+
+        Signature:
+            None -> None
+        """
+        deqPending = self._deqPending
+        while deqPending and len(self._dictInFlight) < self._iWindow:
+            if (len(deqPending) < self._iBatchSize and
+                                timeit.default_timer() - deqPending[0][2] <
+                                                            self._gBatchDelay):
+                break
+            iCount = min(self._iBatchSize, len(deqPending))
+            self._iBatches += 1
+            lstChannels = []
+            lstIds = []
+            lstTasks = []
+            for iIndex in xrange(iCount):
+                objChannel, dictRequest, _ = deqPending.popleft()
+                lstChannels.append(objChannel)
+                lstIds.append(dictRequest.get('id'))
+                lstTasks.append((self._iBatches, iIndex, dictRequest,
+                                                            self._gSolveLimit))
+            #the channels (None once answered), the requests' IDs and the
+            #number of the responses still awaited
+            self._dictInFlight[self._iBatches] = [lstChannels, lstIds, iCount]
+            self._objPool.map_async(_HandleTask, lstTasks, 1)
+
+    def _answer(self, iBatch, iIndex, strResponse):
+        """
+        Helper method to send back the response to a request, unless it is
+        answered already; a batch is no longer in flight, when all its
+        requests are answered.
+
+        Signature:
+            int, int, str -> None
+        """
+        self._dictStarted.pop((iBatch, iIndex), None)
+        lstBatch = self._dictInFlight.get(iBatch)
+        if lstBatch is None or lstBatch[0][iIndex] is None:
+            return
+        lstBatch[0][iIndex].sendLine(strResponse)
+        lstBatch[0][iIndex] = None
+        lstBatch[2] -= 1
+        if not lstBatch[2]:
+            del self._dictInFlight[iBatch]
+        self._iServed += 1
+
+    def _collect(self):
+        """
+        Helper method to register the started requests and to send back the
+        responses received so far.
+
+        Signature:
+            None -> None
+        """
+        objReceiver = self._objReceiver
+        while objReceiver.poll():
+            iBatch, iIndex, iPid, strResponse = objReceiver.recv()
+            if strResponse is not None:
+                self._answer(iBatch, iIndex, strResponse)
+            elif iBatch in self._dictInFlight:
+                self._dictStarted[(iBatch, iIndex)] = (iPid,
+                    timeit.default_timer() + self._gSolveLimit + TASK_MARGIN)
+
+    def _checkStarted(self):
+        """
+        Helper method to answer with an error the started requests, whose
+        worker process has exited, or which are overdue. Checks at most once
+        per IDLE_PERIOD.
+
+        Signature:
+            None -> None
+        """
+        gNow = timeit.default_timer()
+        if not self._dictStarted or gNow < self._gNextCheck:
+            return
+        self._gNextCheck = gNow + IDLE_PERIOD
+        setAlive = set(objProcess.pid
+                            for objProcess in multiprocessing.active_children())
+        for tupTask, (iPid, gDeadline) in self._dictStarted.items():
+            if not (iPid in setAlive):
+                strError = 'Worker process has exited'
+            elif gNow > gDeadline:
+                strError = 'Request is not done within the solve limit'
+            else:
+                continue
+            iBatch, iIndex = tupTask
+            self._answer(iBatch, iIndex, _EncodeError(
+                            self._dictInFlight[iBatch][1][iIndex], strError))
+
+    #public API
+
+    #properties
+
+    @property
+    def Address(self):
+        """
+        Getter property for the address actually listened on.
+
+        Signature:
+            None -> str OR tuple(str, int)
+        """
+        return self._objListener.getsockname()
+
+    @property
+    def Served(self):
+        """
+        Getter property for the number of the responses sent.
+
+        Signature:
+            None -> int
+        """
+        return self._iServed
+
+    @property
+    def Batches(self):
+        """
+        Getter property for the number of the batches dispatched.
+
+        Signature:
+            None -> int
+        """
+        return self._iBatches
+
+    #+ methods
+
+    def run(self):
+        """
+        Serves the requests until stop() is called.
+
+        Signature:
+            None -> None
+        """
+        self._bRunning = True
+        while self._bRunning:
+            gTimeout = IDLE_PERIOD
+            if (self._deqPending and
+                            len(self._dictInFlight) < self._iWindow):
+                #the responses wake the loop up, the batch delay does not
+                gTimeout = min(gTimeout, max(0.0, self._deqPending[0][2] +
+                            self._gBatchDelay - timeit.default_timer()))
+            asyncore.loop(gTimeout, map = self._dictMap, count = 1)
+            self._checkStarted()
+            self._dispatch()
+
+    def stop(self):
+        """
+        Requests the event loop to stop, can be called from another thread.
+        The loop stops within IDLE_PERIOD.
+
+        Signature:
+            None -> None
+        """
+        self._bRunning = False
+
+    def close(self):
+        """
+        Closes all connections and the listening socket, and terminates the
+        worker processes.
+
+        Signature:
+            None -> None
+        """
+        asyncore.close_all(self._dictMap)
+        self._objPool.terminate()
+        self._objPool.join()
+        self._objReceiver.close()
+        self._objSender.close()
+        if self._strUnixPath is not None and os.path.exists(self._strUnixPath):
+            os.unlink(self._strUnixPath)
+
+def main(strlstArgs = None):
+    """
+    Parses the command line arguments and runs the server until interrupted
+    by Ctrl+C.
+
+    Signature:
+        /list(str)/ -> None
+
+    Args:
+        strlstArgs: (optional) list of strings, the command line arguments,
+            defaults to sys.argv[1:]
+    """
+    objParser = argparse.ArgumentParser(description = 'Sudoku solve service')
+    objParser.add_argument('--unix', metavar = 'PATH',
+                            help = 'listen on the Unix socket PATH')
+    objParser.add_argument('--host', default = DEF_HOST,
+                            help = 'TCP host, default: {}'.format(DEF_HOST))
+    objParser.add_argument('--port', type = int, default = DEF_PORT,
+                            help = 'TCP port, default: {}'.format(DEF_PORT))
+    objParser.add_argument('--processes', type = int, default = None,
+                            help = 'number of worker processes, default: CPUs')
+    objParser.add_argument('--batch-size', type = int,
+                            default = DEF_BATCH_SIZE,
+                            help = 'maximum requests per batch')
+    objParser.add_argument('--batch-delay', type = float,
+                            default = DEF_BATCH_DELAY,
+                            help = 'longest wait for a batch to fill, seconds')
+    objParser.add_argument('--solve-limit', type = float,
+                            default = DEF_SOLVE_LIMIT,
+                            help = 'wall-clock limit of a request, seconds')
+    objArgs = objParser.parse_args(strlstArgs)
+    if objArgs.unix is None:
+        gAddress = (objArgs.host, objArgs.port)
+    else:
+        gAddress = objArgs.unix
+    objServer = SolveServer(gAddress, objArgs.processes, objArgs.batch_size,
+                                objArgs.batch_delay, objArgs.solve_limit)
+    sys.stderr.write('Serving on {}\n'.format(objServer.Address))
+    try:
+        objServer.run()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        objServer.close()
+    sys.stderr.write('Served {} requests in {} batches\n'.format(
+                                        objServer.Served, objServer.Batches))
+
+if __name__ == '__main__':
+    main()
@@ -2,9 +2,17 @@
 """
 Loader for the CLI version of the program.
 
+Without arguments the interactive main menu is launched. With the --batch
+option the puzzles from the specified file are solved in a pool of worker
+processes without any interaction, see runBatch().
+
 Functions:
     run()
         None -> None
+    runBatch()
+        str/, str OR None, int OR None, bool, int, str/ -> dict(str -> int)
+    main()
+        /list(str)/ -> None
 """
 
 __version__ = "0.0.1.0"
@@ -15,6 +23,7 @@ __status__ = "Development"
 
 import sys
 import os
+import argparse
 
 #+ my libraries
 
@@ -26,6 +35,12 @@ if not (strTemp in sys.path):
 
 from sudoku_py.ui.cli.user_menus import MainMenu
 
+from sudoku_py.core.solvers import ENGINES, DEF_ENGINE
+
+from sudoku_py.core.batch_solver import WriteResults
+
+from sudoku_py.core.parallel_batch import SolveFileParallel, DEF_CHUNK_SIZE
+
 #execution area
 
 #globals
@@ -33,7 +48,7 @@ from sudoku_py.ui.cli.user_menus import MainMenu
 ROOT_FOLDER = os.path.dirname(os.path.realpath(__file__))
 RESOURCES = os.path.join(ROOT_FOLDER, 'resources', 'cli')
 
-#single and main function
+#functions
 
 def run():
     """
@@ -45,5 +60,75 @@ def run():
     objMenu = MainMenu(os.path.join(RESOURCES, 'main_menu.json'))
     print objMenu.run()
 
+def runBatch(strInput, strOutput = None, iProcesses = None, bOrdered = True,
+                        iChunkSize = DEF_CHUNK_SIZE, strEngine = DEF_ENGINE):
+    """
+    Solves all puzzles from a text file (one per line) in a pool of worker
+    processes and writes the results (see
+    sudoku_py.core.batch_solver.WriteResults()) into the output file.
+
+    Signature:
+        str/, str OR None, int OR None, bool, int, str/ -> dict(str -> int)
+
+    Args:
+        strInput: string, path to the file with the puzzles
+        strOutput: (optional) string, path to the output file, defaults to the
+            input path with the '.solved' extension added
+        iProcesses: (optional) positive integer, number of the worker
+            processes, defaults to the number of the CPUs
+        bOrdered: (optional) boolean, if True (default) the results are written
+            in the input order, otherwise - as they are completed
+        iChunkSize: (optional) positive integer, number of the puzzles sent to
+            a worker process at once
+        strEngine: (optional) string, name of the solver engine
+
+    Returns:
+        dict(str -> int): number of the puzzles per status
+    """
+    if strOutput is None:
+        strOutput = '{}.solved'.format(strInput)
+    with open(strInput) as fInput:
+        with open(strOutput, 'w') as fOutput:
+            dictCounts = WriteResults(SolveFileParallel(fInput, iProcesses,
+                                bOrdered, iChunkSize, strEngine), fOutput)
+    return dictCounts
+
+def main(strlstArgs = None):
+    """
+    Parses the command line arguments and launches either the interactive
+    menu or the batch solver.
+
+    Signature:
+        /list(str)/ -> None
+
+    Args:
+        strlstArgs: (optional) list of strings, the command line arguments,
+            defaults to sys.argv[1:]
+    """
+    objParser = argparse.ArgumentParser(description = 'Sudoku m x n')
+    objParser.add_argument('--batch', metavar = 'FILE',
+                            help = 'solve all puzzles (one per line) from FILE')
+    objParser.add_argument('--output', metavar = 'FILE',
+                            help = 'batch output file, default: FILE.solved')
+    objParser.add_argument('--processes', type = int, default = None,
+                            help = 'number of worker processes, default: CPUs')
+    objParser.add_argument('--chunk-size', type = int,
+                            default = DEF_CHUNK_SIZE,
+                            help = 'puzzles per task sent to a worker')
+    objParser.add_argument('--unordered', action = 'store_true',
+                            help = 'write results as they are completed')
+    objParser.add_argument('--engine', choices = sorted(ENGINES),
+                            default = DEF_ENGINE, help = 'solver engine')
+    objArgs = objParser.parse_args(strlstArgs)
+    if objArgs.batch is None:
+        run()
+    else:
+        dictCounts = runBatch(objArgs.batch, objArgs.output,
+                                objArgs.processes, not objArgs.unordered,
+                                objArgs.chunk_size, objArgs.engine)
+        print ', '.join('{} {}'.format(strStatus, iCount)
+                                for strStatus, iCount in sorted(
+                                                        dictCounts.items()))
+
 if __name__ == '__main__':
-    run()
\ No newline at end of file
+    main()
\ No newline at end of file
@@ -18,6 +18,8 @@ __status__ = "Development"
 #+ standard libraries
 
 import sys
+import os
+import threading
 
 #+ my libraries
 
@@ -25,6 +27,62 @@ import sys
 
 import sudoku_py.ui.cli.basic_ui_elements as bue
 
+from sudoku_py.ui.cli.terminal_utils import PrintFW
+
+from sudoku_py.core.board import SudokuBoard
+
+from sudoku_py.core.solution_cache import SolutionCache
+
+from sudoku_py.core.solvers import PickEngine
+
+from sudoku_py.core.solve_budget import (STATUS_CANCELLED, BudgetExceeded,
+                                    CancelToken, SolveResult, SolveBudget)
+
+from sudoku_py.core.rating import GetLevel
+
+from sudoku_py.core.batch_solver import SolveFile, WriteResults
+
+from sudoku_py.core.generator import GeneratePuzzle
+
+from sudoku_py.core.puzzle_factory import RunFactory
+
+from sudoku_py.core.game import GameBoard
+
+from sudoku_py.core.savegame import SaveGame, LoadGame
+
+from sudoku_py.core.puzzle_library import PuzzleLibrary
+
+from sudoku_py.core.puzzle_pool import LEVEL_NAMES, PuzzlePool
+
+#globals
+
+#+ persistent cache of the solutions of the puzzles entered by the user
+
+CACHE_FOLDER = os.path.join(os.path.expanduser('~'), '.sudoku_py')
+
+CACHE_FILE = os.path.join(CACHE_FOLDER, 'solutions.sqlite')
+
+#+ pre-built library of the puzzles for the new games (optional)
+
+LIBRARY_FILE = os.path.join(CACHE_FOLDER, 'library.bin')
+
+#+ persistent pool of the ready puzzles for the new games, topped up in the
+#+ background
+
+POOL_FILE = os.path.join(CACHE_FOLDER, 'pool.sqlite')
+
+#+ wall-clock limit of solving a single puzzle entered by the user, seconds
+
+SOLVE_TIMEOUT = 300.0
+
+#+ period of the progress display while solving, seconds
+
+PROGRESS_PERIOD = 0.25
+
+#+ the longest wait for the solve to stop after Ctrl+C, seconds
+
+CANCEL_TIMEOUT = 1.0
+
 #classes
 
 class MainMenu(bue.SimpleMenuCLI):
@@ -42,6 +100,228 @@ class MainMenu(bue.SimpleMenuCLI):
     
     _strMenuName = 'Main'
     
+    _objCache = None
+    
+    _objPool = None
+    
+    #helper methods
+    
+    def _getCache(self):
+        """
+        Helper method to open the persistent solutions cache upon the first
+        use. If the cache file cannot be created, only the in-memory cache is
+        used.
+        
+        Signature:
+            None -> sudoku_py.core.solution_cache.SolutionCache
+        """
+        if self._objCache is None:
+            try:
+                if not os.path.isdir(CACHE_FOLDER):
+                    os.makedirs(CACHE_FOLDER)
+                self._objCache = SolutionCache(CACHE_FILE)
+            except Exception:
+                self._objCache = SolutionCache()
+        return self._objCache
+    
+    def _getPool(self):
+        """
+        Helper method to open the persistent pool of the ready puzzles and to
+        start its background worker upon the first use. If the pool file
+        cannot be created, None is returned, and the puzzles are generated on
+        demand.
+        
+        Signature:
+            None -> sudoku_py.core.puzzle_pool.PuzzlePool OR None
+        """
+        if self._objPool is None:
+            try:
+                if not os.path.isdir(CACHE_FOLDER):
+                    os.makedirs(CACHE_FOLDER)
+                self._objPool = PuzzlePool(POOL_FILE)
+                self._objPool.start()
+            except Exception:
+                self._objPool = None
+        return self._objPool
+    
+    def _solveFile(self, strPath):
+        """
+        Helper method to solve all puzzles stored in a text file (one per line)
+        in the streaming mode. The results are written into a file with the
+        same name and the '.solved' extension added.
+        
+        Signature:
+            str -> str
+        
+        Args:
+            strPath: string, path to the file with the puzzles
+        
+        Returns:
+            str: summary of the batch solution
+        """
+        strOutput = '{}.solved'.format(strPath)
+        with open(strPath) as fInput:
+            with open(strOutput, 'w') as fOutput:
+                dictCounts = WriteResults(SolveFile(fInput), fOutput)
+        return 'Solved {}, unsolvable {}, invalid {}'.format(
+                        dictCounts['solved'], dictCounts['unsolvable'],
+                                                        dictCounts['invalid'])
+    
+    def _solveWorker(self, objPuzzle, objBudget, lstOutcome):
+        """
+        Helper method executed in a worker thread. Solves a puzzle through the
+        solutions cache within the budget, using the engine suited for the
+        board size, and appends the outcome to the list: the cache entry, the
+        partial result or the raised exception.
+        
+        Signature:
+            SudokuBoard, SolveBudget, list -> None
+        """
+        try:
+            lstOutcome.append(self._getCache().solve(objPuzzle,
+                                        PickEngine(objPuzzle.Size), objBudget))
+        except BudgetExceeded as objError:
+            lstOutcome.append(objError.Result)
+        except Exception as objError:
+            lstOutcome.append(objError)
+    
+    def _solveWithProgress(self, objPuzzle):
+        """
+        Helper method to solve a puzzle in a worker thread, displaying the
+        progress (elapsed time, visited nodes, depth) while waiting. The solve
+        is limited by SOLVE_TIMEOUT and can be cancelled by Ctrl+C; if the
+        worker does not stop within CANCEL_TIMEOUT, it is left to finish in
+        the background, and the deepest state reached so far is returned.
+        
+        Signature:
+            SudokuBoard -> CacheEntry OR SolveResult
+        
+        Returns:
+            CacheEntry: the solution and the rating, if the search is finished
+            SolveResult: the partial result, if the search is abandoned
+        """
+        objToken = CancelToken()
+        objBudget = SolveBudget(SOLVE_TIMEOUT, None, objToken)
+        lstOutcome = []
+        objThread = threading.Thread(target = self._solveWorker,
+                                    args = (objPuzzle, objBudget, lstOutcome))
+        objThread.daemon = True
+        objThread.start()
+        try:
+            while objThread.is_alive():
+                objThread.join(PROGRESS_PERIOD)
+                sys.stdout.write(
+                    '\rSolving... {:.1f} s, {} nodes, depth {} (Ctrl+C to '
+                    'cancel) '.format(objBudget.Elapsed, objBudget.Nodes,
+                                                        objBudget.MaxDepth))
+                sys.stdout.flush()
+        except KeyboardInterrupt:
+            objToken.cancel()
+            objThread.join(CANCEL_TIMEOUT)
+        sys.stdout.write('\n')
+        if not lstOutcome:
+            objBest = objBudget.Best
+            if objBest is None:
+                objBest = objPuzzle.copy()
+            return SolveResult([], STATUS_CANCELLED, objBest, objBudget)
+        if isinstance(lstOutcome[0], Exception):
+            raise lstOutcome[0]
+        return lstOutcome[0]
+    
+    def _generateBatch(self, iBoxRows, iBoxColumns, iCount):
+        """
+        Helper method to generate many puzzles into a file in the worker
+        processes, see sudoku_py.core.puzzle_factory. Prompts the user for the
+        output file and the difficulty band as 'level' or 'level-level' (empty
+        input means any difficulty); displays the puzzles per second while
+        waiting. The batch can be interrupted by Ctrl+C and resumed later by
+        entering the same file and parameters.
+        
+        Signature:
+            int, int, int -> str
+        
+        Returns:
+            str: summary of the batch
+        """
+        sys.stdout.write('Output file (empty to cancel): ')
+        strPath = raw_input().strip()
+        if not strPath:
+            return 'Cancelled puzzle creation'
+        sys.stdout.write('Difficulty as "level" or "level-level" (empty for '
+                                                                    'any): ')
+        strBand = raw_input().strip().lower()
+        strlstBand = strBand.split('-') if strBand else [None]
+        strMinLevel, strMaxLevel = strlstBand[0], strlstBand[-1]
+        def _ShowProgress(dictStats):
+            sys.stdout.write('\rGenerated {} of {}, {} skipped, {:.2f} puzzles'
+                            '/s (Ctrl+C to stop) '.format(dictStats['written']
+                            + dictStats['resumed'], iCount,
+                            dictStats['skipped'], dictStats['per_second']))
+            sys.stdout.flush()
+        try:
+            dictStats = RunFactory(strPath, iCount, iBoxRows, iBoxColumns,
+                                strMinLevel, strMaxLevel,
+                                funProgress = _ShowProgress)
+        except KeyboardInterrupt:
+            sys.stdout.write('\n')
+            return 'Puzzle creation interrupted, repeat it to resume'
+        except (IOError, ValueError) as objError:
+            sys.stdout.write('\n')
+            return 'Puzzle creation failed: {}'.format(objError)
+        sys.stdout.write('\n')
+        return 'Puzzles generated {}, resumed {}, skipped {} into {}'.format(
+                    dictStats['written'], dictStats['resumed'],
+                                            dictStats['skipped'], strPath)
+    
+    def _playGame(self, objGame):
+        """
+        Helper method implementing the interactive game loop. The moves are
+        entered as 'row column digit' (1-based, digit 0 clears the cell),
+        'u' undoes the last move, 's' saves the game into a file (see
+        sudoku_py.core.savegame) and 'q' quits the game. The conflicting cells
+        are marked by '*' after each move.
+        
+        Signature:
+            sudoku_py.core.game.GameBoard -> str
+        
+        Args:
+            objGame: sudoku_py.core.game.GameBoard instance, the game to play
+        
+        Returns:
+            str: 'Game solved' or 'Game cancelled'
+        """
+        iSize = objGame.Size
+        while not objGame.isSolved():
+            PrintFW(objGame)
+            sys.stdout.write(
+                    'Move as "row column digit", u - undo, s - save, q - quit: ')
+            strlstCommand = raw_input().strip().lower().split()
+            if strlstCommand == ['q']:
+                return 'Game cancelled'
+            if strlstCommand == ['s']:
+                sys.stdout.write('Save to file: ')
+                strPath = raw_input().strip()
+                try:
+                    with open(strPath, 'wb') as fFile:
+                        SaveGame(objGame, fFile)
+                    PrintFW('Game saved')
+                except (IOError, OSError) as objError:
+                    PrintFW('Game save failed: {}'.format(objError))
+                continue
+            if strlstCommand == ['u']:
+                objGame.undo()
+                continue
+            try:
+                iRow, iColumn, iValue = [int(strItem)
+                                                for strItem in strlstCommand]
+                if not (1 <= iRow <= iSize and 1 <= iColumn <= iSize):
+                    raise IndexError('Cell is out of range')
+                objGame.move((iRow - 1) * iSize + iColumn - 1, iValue)
+            except (IndexError, ValueError) as objError:
+                PrintFW('Improper move: {}'.format(objError))
+        PrintFW(objGame)
+        return 'Game solved'
+    
     #helper methods - event handlers
     
     def onExit(self):
@@ -62,7 +342,11 @@ class MainMenu(bue.SimpleMenuCLI):
     
     def onNewGame(self):
         """
-        Handler of the event - 'start new game'. ...
+        Handler of the event - 'start new game'. Prompts the user for the
+        difficulty level and takes a ready classic 3 x 3 boxes puzzle of that
+        level from the puzzles pool. If the pool has none, draws a random
+        puzzle from the puzzles library, if it is present, otherwise generates
+        a puzzle (of any level). Then launches the game loop.
         
         Signature:
             None -> str
@@ -71,11 +355,33 @@ class MainMenu(bue.SimpleMenuCLI):
             str: result of the action initiated by this menu item, e.g.
                 'Game played', 'Game cancelled', etc.
         """
-        return 'onNewGame'
+        sys.stdout.write('Difficulty level ({}; empty for any): '.format(
+                                                    ', '.join(LEVEL_NAMES)))
+        strLevel = raw_input().strip().lower() or None
+        if not (strLevel is None or strLevel in LEVEL_NAMES):
+            return 'Unknown difficulty level {!r}'.format(strLevel)
+        objPuzzle = None
+        objPool = self._getPool()
+        if objPool is not None:
+            try:
+                objPuzzle = objPool.pop(strLevel)
+            except Exception:
+                objPuzzle = None
+        if objPuzzle is None and os.path.isfile(LIBRARY_FILE):
+            try:
+                with PuzzleLibrary(LIBRARY_FILE) as objLibrary:
+                    if len(objLibrary):
+                        objPuzzle = objLibrary.getRandom(strLevel)
+            except (IOError, ValueError):
+                objPuzzle = None
+        if objPuzzle is None:
+            objPuzzle, _ = GeneratePuzzle()
+        return self._playGame(GameBoard(objPuzzle))
     
     def onLoadGame(self):
         """
-        Handler of the event - 'load saved game'. ...
+        Handler of the event - 'load saved game'. Prompts the user for the path
+        to a saved game file, loads it and continues the game loop.
         
         Signature:
             None -> str
@@ -84,11 +390,29 @@ class MainMenu(bue.SimpleMenuCLI):
             str: result of the action initiated by this menu item, e.g.
                 'Game played', 'Cancelled load', 'File load failed', etc.
         """
-        return 'onLoadGame'
+        sys.stdout.write('Enter the saved game file (empty to cancel): ')
+        strPath = raw_input().strip()
+        if not strPath:
+            return 'Cancelled load'
+        try:
+            with open(strPath, 'rb') as fFile:
+                objGame = LoadGame(fFile)
+        except (IOError, OSError, ValueError) as objError:
+            return 'File load failed: {}'.format(objError)
+        return self._playGame(objGame)
     
     def onSolvePuzzle(self):
         """
-        Handler of the event - 'auto solve puzzle'. ...
+        Handler of the event - 'auto solve puzzle'. Prompts the user for the
+        puzzle as a single line of N * N characters ('.' or '0' for the empty
+        cells), solves it and displays the solution. Alternatively, the path to
+        a text file with one puzzle per line can be entered, then all puzzles
+        are solved and the results are written into the '<path>.solved' file.
+        The single puzzles are solved through the persistent solutions cache,
+        thus re-submitted (or equivalent) puzzles are not solved again. The
+        solve runs in a worker thread with the progress displayed; it is
+        limited in time and can be cancelled, then the best partial state is
+        displayed.
         
         Signature:
             None -> str
@@ -97,11 +421,42 @@ class MainMenu(bue.SimpleMenuCLI):
             str: result of the action initiated by this menu item, e.g.
                 'Puzzle solved', 'Cancelled puzzle solution', etc.
         """
-        return 'onSolvePuzzle'
+        sys.stdout.write('Enter the puzzle or a file path (empty to cancel): ')
+        strPuzzle = raw_input().strip()
+        if not strPuzzle:
+            return 'Cancelled puzzle solution'
+        if os.path.isfile(strPuzzle):
+            return self._solveFile(strPuzzle)
+        try:
+            objPuzzle = SudokuBoard.fromString(strPuzzle)
+        except ValueError as objError:
+            return 'Improper puzzle: {}'.format(objError)
+        gOutcome = self._solveWithProgress(objPuzzle)
+        if isinstance(gOutcome, SolveResult):
+            PrintFW(gOutcome.Best)
+            strResult = ('Puzzle not solved ({}) after {} nodes, best state '
+                            'has {} of {} cells filled').format(gOutcome.Status,
+                            gOutcome.Stats.Nodes, gOutcome.Best.Filled,
+                                                        gOutcome.Best.Cells)
+        elif gOutcome.Solution is None:
+            strResult = 'Puzzle has no solution'
+        else:
+            PrintFW(gOutcome.Solution)
+            strResult = 'Puzzle solved'
+            if gOutcome.Rating is not None:
+                strResult = '{}, difficulty {} ({:.2f})'.format(strResult,
+                                    GetLevel(gOutcome.Rating), gOutcome.Rating)
+        sys.stdout.write('Press Enter to continue...')
+        raw_input()
+        return strResult
     
     def onGeneratePuzzle(self):
         """
-        Handler of the event - 'create custom puzzle'. ...
+        Handler of the event - 'create custom puzzle'. Prompts the user for the
+        box shape as 'm x n' (empty input means the classic 3 x 3 boxes),
+        generates a uniquely solvable puzzle and displays it together with its
+        single line definition. Alternatively, the number of the puzzles can be
+        entered, then they are generated into a file in the bulk mode.
         
         Signature:
             None -> str
@@ -111,7 +466,32 @@ class MainMenu(bue.SimpleMenuCLI):
                 'Custom puzzle created and saved', 'Cancelled puzzle creation',
                 etc.
         """
-        return 'onGeneratePuzzle'
+        sys.stdout.write('Enter the box shape m x n (empty for 3 x 3): ')
+        strShape = raw_input().strip().lower()
+        if not strShape:
+            strShape = '3x3'
+        try:
+            iBoxRows, iBoxColumns = [int(strItem)
+                                            for strItem in strShape.split('x')]
+            SudokuBoard(iBoxRows, iBoxColumns)
+        except (TypeError, ValueError):
+            return 'Improper box shape {!r}'.format(strShape)
+        sys.stdout.write('Number of puzzles (empty for 1): ')
+        strCount = raw_input().strip()
+        try:
+            iCount = int(strCount) if strCount else 1
+        except ValueError:
+            return 'Improper number of puzzles {!r}'.format(strCount)
+        if iCount < 1:
+            return 'Cancelled puzzle creation'
+        if iCount > 1:
+            return self._generateBatch(iBoxRows, iBoxColumns, iCount)
+        objPuzzle, _ = GeneratePuzzle(iBoxRows, iBoxColumns)
+        PrintFW(objPuzzle)
+        PrintFW(objPuzzle.toString())
+        sys.stdout.write('Press Enter to continue...')
+        raw_input()
+        return 'Puzzle generated with {} clues'.format(objPuzzle.Filled)
     
     def onHelp(self):
         """
@@ -138,6 +518,28 @@ class MainMenu(bue.SimpleMenuCLI):
                 the value returned by the help menu.
         """
         return 'onShowRecords'
+    
+    #public API
+    
+    #+ methods
+    
+    def run(self):
+        """
+        Main method, see sudoku_py.ui.cli.basic_ui_elements.SimpleMenuCLI.run().
+        The background worker of the puzzles pool is started before the menu
+        loop, thus the pool is topped up while the user is busy, and it is
+        stopped after the loop.
+        
+        Signature:
+            None -> str
+        """
+        self._getPool()
+        try:
+            return super(MainMenu, self).run()
+        finally:
+            if self._objPool is not None:
+                self._objPool.close()
+                self._objPool = None
 
 class HelpMenu(bue.SimpleMenuCLI):
     """